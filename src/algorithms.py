@@ -1,27 +1,91 @@
-from typing import Dict, List, Tuple, Set, Optional, Any
-from src.graph import Graph
-from src.fringe import BinaryHeap, SortedLinkedList
+from typing import Dict, List, Tuple, Set, Optional, Any, Union
+from array import array
+from collections import defaultdict
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.graph import Graph, CSRGraph
+from src.fringe import PriorityQueue, BinaryHeap, SortedLinkedList, TieOrder
+from src.union_find import UnionFind
+from src.results import ShortestPathResult, MSTResult, compact_ids, id_array, float_array
+
+
+# graphs at least this dense use the O(V^2) array-scan versions when
+# fringe_type is 'auto'; below DENSE_MIN_VERTICES NumPy overhead dominates
+DENSE_THRESHOLD = 0.15
+DENSE_MIN_VERTICES = 200
+
+
+def _resolve_fringe(graph: Graph, fringe_type: str) -> str:
+    # pick 'dense' or 'heap' for fringe_type='auto'
+    if fringe_type != 'auto':
+        return fringe_type
+    if graph.num_vertices() >= DENSE_MIN_VERTICES and graph.density() >= DENSE_THRESHOLD:
+        return 'dense'
+    return 'heap'
+
+
+def make_fringe(fringe_type: str, order: Optional[TieOrder] = None) -> PriorityQueue:
+    # build the priority queue used as the search fringe
+    # ties go to the vertex first in order (graph.vertex_order() for vertex
+    # names, range(num_vertices) for CSR ids), the same vertex the dense
+    # argmin picks
+    if fringe_type == 'heap':
+        return BinaryHeap(order)
+    elif fringe_type == 'list':
+        return SortedLinkedList(order)
+    else:
+        raise ValueError(f"Invalid fringe_type: {fringe_type}")
 
 
 def dijkstra(
     graph: Graph,
     source: str,
-    fringe_type: str = 'heap'
-) -> Tuple[Dict[str, float], Dict[str, Optional[str]], List[Dict[str, Any]]]:
+    fringe_type: str = 'auto',
+    record_history: bool = True,
+    engine: str = 'scalar',
+    compact: bool = False
+) -> Union[Tuple[Dict[str, float], Dict[str, Optional[str]], List[Dict[str, Any]]], ShortestPathResult]:
     # Dijkstra's algorithm
+    # fringe_type: 'heap', 'list', 'dense' (array scan) or 'auto' (dense
+    # above DENSE_THRESHOLD, heap otherwise)
+    # engine: 'scalar' relaxes neighbors one by one, 'vectorized' relaxes
+    # each vertex's neighbors with one NumPy slice over a CSR snapshot
+    # (pays off on high-degree graphs); ignored by the dense fringe
+    # compact: return a ShortestPathResult backed by flat arrays instead of
+    # dicts (unpacks the same way; never records step history)
     # Returns: (distances dict, previous dict, step-by-step history)
+    # step history is empty when record_history is False
 
     # Step 1: validate inputs
     if not graph.has_vertex(source):
         raise ValueError(f"Source vertex '{source}' not in graph")
+    if engine not in ('scalar', 'vectorized'):
+        raise ValueError(f"Invalid engine: {engine}")
 
-    # Step 2: initialize fringe (priority queue)
-    if fringe_type == 'heap':
-        fringe = BinaryHeap()
-    elif fringe_type == 'list':
-        fringe = SortedLinkedList()
-    else:
-        raise ValueError(f"Invalid fringe_type: {fringe_type}")
+    fringe_type = _resolve_fringe(graph, fringe_type)
+    if fringe_type == 'dense':
+        if compact:
+            _, distance, previous, _ = _dijkstra_dense_arrays(graph, source, False)
+            return _shortest_path_result(graph, source, distance, compact_ids(previous))
+        return dijkstra_dense(graph, source, record_history)
+
+    # Step 2: initialize fringe (priority queue), keyed by CSR id on the
+    # array paths and by vertex name on the scalar one
+    array_keys = compact or engine == 'vectorized'
+    fringe = make_fringe(fringe_type, range(graph.num_vertices()) if array_keys else graph.vertex_order())
+
+    if engine == 'vectorized':
+        vertices, distance, previous, step_history = _dijkstra_vectorized(
+            graph, source, fringe, record_history and not compact)
+        if compact:
+            return _shortest_path_result(graph, source, distance, compact_ids(previous))
+        return dict(zip(vertices, distance.tolist())), _labels(vertices, previous), step_history
+
+    if compact:
+        csr = graph.to_csr()
+        distance, previous = dijkstra_compact(csr, csr.index[source], fringe)
+        return _shortest_path_result(graph, source, distance, previous)
 
     # Step 3: initialize distance and predecessor structures
     distance: Dict[str, float] = {v: float('inf') for v in graph.get_vertices()}
@@ -34,13 +98,14 @@ def dijkstra(
     fringe.insert(source, 0.0)
 
     # record initial state
-    step_history.append({
-        'iteration': 0,
-        'current': None,
-        'visited': set(),
-        'distances': distance.copy(),
-        'fringe_size': fringe.size()
-    })
+    if record_history:
+        step_history.append({
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'distances': distance.copy(),
+            'fringe_size': fringe.size()
+        })
 
     iteration = 0
 
@@ -70,26 +135,300 @@ def dijkstra(
                     fringe.insert(neighbor, alt_distance)
 
         # record this step for visualization
+        if record_history:
+            step_history.append({
+                'iteration': iteration,
+                'current': current,
+                'current_distance': current_dist,
+                'visited': visited.copy(),
+                'distances': distance.copy(),
+                'previous': previous.copy(),
+                'fringe_size': fringe.size()
+            })
+
+    return distance, previous, step_history
+
+
+def dijkstra_dense(
+    graph: Graph,
+    source: str,
+    record_history: bool = True
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], List[Dict[str, Any]]]:
+    # Dijkstra's algorithm on a dense weight matrix
+    # each iteration scans the whole frontier with argmin and relaxes a full
+    # matrix row with np.minimum: O(V^2) total, which beats a heap when E ~ V^2
+    # Returns the same (distances, previous, history) as dijkstra
+
+    # Step 1: validate inputs
+    if not graph.has_vertex(source):
+        raise ValueError(f"Source vertex '{source}' not in graph")
+
+    vertices, distance, previous, step_history = _dijkstra_dense_arrays(graph, source, record_history)
+    return dict(zip(vertices, distance.tolist())), _labels(vertices, previous), step_history
+
+
+def _dijkstra_dense_arrays(
+    graph: Graph,
+    source: str,
+    record_history: bool
+) -> Tuple[List[str], np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+    # array-scan Dijkstra core: (vertices, distance, previous ids, history)
+
+    # Step 2: initialize distance and predecessor arrays
+    vertices, matrix = graph.to_matrix()
+    n = len(vertices)
+    s = vertices.index(source)
+    distance = np.full(n, np.inf)
+    distance[s] = 0.0
+    previous = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    step_history: List[Dict[str, Any]] = []
+
+    if record_history:
         step_history.append({
-            'iteration': iteration,
-            'current': current,
-            'current_distance': current_dist,
-            'visited': visited.copy(),
-            'distances': distance.copy(),
-            'previous': previous.copy(),
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'distances': dict(zip(vertices, distance.tolist())),
+            'fringe_size': 1
+        })
+
+    # frontier holds tentative distances of unvisited vertices, inf otherwise;
+    # blocked is inf for visited vertices so relaxation never touches them
+    frontier = distance.copy()
+    blocked = np.zeros(n)
+
+    # Step 3: main loop - settle the closest unvisited vertex
+    for iteration in range(1, n + 1):
+        current = int(np.argmin(frontier))
+        if frontier[current] == np.inf:
+            break  # remaining vertices are unreachable
+        visited[current] = True
+        frontier[current] = np.inf
+        blocked[current] = np.inf
+
+        # Step 4: relax the whole row at once
+        candidate = (distance[current] + matrix[current]) + blocked
+        improved = candidate < frontier
+        np.minimum(frontier, candidate, out=frontier)
+        distance[improved] = candidate[improved]
+        previous[improved] = current
+
+        if record_history:
+            step_history.append(_array_dijkstra_step(
+                vertices, iteration, current, visited, distance, previous,
+                int(np.count_nonzero(frontier < np.inf))
+            ))
+
+    return vertices, distance, previous, step_history
+
+
+def _dijkstra_vectorized(
+    graph: Graph,
+    source: str,
+    fringe: PriorityQueue,
+    record_history: bool
+) -> Tuple[List[str], np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+    # Dijkstra's algorithm over a CSR snapshot
+    # the fringe still picks one vertex at a time, but all of its neighbors
+    # are relaxed with one NumPy slice: candidate distances, one comparison
+    # to mask improvements, and only improved neighbors are pushed
+    csr = graph.to_csr()
+    vertices = csr.vertices
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(vertices)
+    s = csr.index[source]
+
+    distance = np.full(n, np.inf)
+    distance[s] = 0.0
+    previous = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    step_history: List[Dict[str, Any]] = []
+
+    fringe.insert(s, 0.0)
+
+    if record_history:
+        step_history.append({
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'distances': dict(zip(vertices, distance.tolist())),
             'fringe_size': fringe.size()
         })
 
-    return distance, previous, step_history
+    iteration = 0
+
+    while not fringe.is_empty():
+        current, current_dist = fringe.extract_min()
+        if visited[current]:
+            continue
+        visited[current] = True
+        iteration += 1
+
+        # relax every neighbor at once; visited neighbors can never improve
+        # because their distance is already <= current_dist
+        lo = indptr[current]
+        hi = indptr[current + 1]
+        neighbors = indices[lo:hi]
+        candidate = current_dist + weights[lo:hi]
+        improved = candidate < distance[neighbors]
+        if improved.any():
+            targets = neighbors[improved]
+            new_distances = candidate[improved]
+            distance[targets] = new_distances
+            previous[targets] = current
+            for v, d in zip(targets.tolist(), new_distances.tolist()):
+                fringe.insert(v, d)
+
+        if record_history:
+            step_history.append(_array_dijkstra_step(
+                vertices, iteration, current, visited, distance, previous, fringe.size()
+            ))
+
+    return vertices, distance, previous, step_history
+
+
+def dijkstra_compact(
+    csr: CSRGraph,
+    s: int,
+    fringe: PriorityQueue
+) -> Tuple[array, array]:
+    # scalar Dijkstra from vertex id s over a CSR snapshot with
+    # array('d')/array('i') state, so no per-vertex dict entries or float
+    # objects outlive the search
+    # Returns: (distances, predecessor ids)
+    n = csr.num_vertices()
+    indptr = csr.indptr.tolist()
+
+    distance = float_array(n)
+    distance[s] = 0.0
+    previous = id_array(n)
+    visited = bytearray(n)
+
+    fringe.insert(s, 0.0)
+
+    while not fringe.is_empty():
+        current, current_dist = fringe.extract_min()
+        if visited[current]:
+            continue
+        visited[current] = 1
+
+        lo = indptr[current]
+        hi = indptr[current + 1]
+        for neighbor, weight in zip(csr.indices[lo:hi].tolist(), csr.weights[lo:hi].tolist()):
+            if not visited[neighbor]:
+                alt_distance = current_dist + weight
+                if alt_distance < distance[neighbor]:
+                    distance[neighbor] = alt_distance
+                    previous[neighbor] = current
+                    fringe.insert(neighbor, alt_distance)
+
+    return distance, previous
+
+
+def _shortest_path_result(graph: Graph, source: str, distance, previous) -> ShortestPathResult:
+    # wrap id-indexed arrays; vertex order and index are the CSR snapshot's
+    csr = graph.to_csr()
+    return ShortestPathResult(csr.vertices, csr.index, source, distance, previous)
+
+
+def _array_dijkstra_step(
+    vertices: List[str],
+    iteration: int,
+    current: int,
+    visited: np.ndarray,
+    distance: np.ndarray,
+    previous: np.ndarray,
+    fringe_size: int
+) -> Dict[str, Any]:
+    # step history entry for the array-based Dijkstra variants,
+    # in the same label-keyed format dijkstra records
+    return {
+        'iteration': iteration,
+        'current': vertices[current],
+        'current_distance': float(distance[current]),
+        'visited': {vertices[i] for i in np.flatnonzero(visited)},
+        'distances': dict(zip(vertices, distance.tolist())),
+        'previous': _labels(vertices, previous),
+        'fringe_size': fringe_size
+    }
+
+
+def _labels(vertices: List[str], indices: np.ndarray) -> Dict[str, Optional[str]]:
+    # convert a predecessor index array (-1 for none) to a label dict
+    return {v: (vertices[i] if i >= 0 else None) for v, i in zip(vertices, indices.tolist())}
+
+
+def _grow_mst(
+    graph: Graph,
+    fringe: PriorityQueue,
+    key: Dict[str, float],
+    parent: Dict[str, Optional[str]],
+    visited: Set[str],
+    mst_edges: List[Tuple[str, str, float]],
+    step_history: List[Dict[str, Any]],
+    iteration: int,
+    record_history: bool
+) -> int:
+    # Prim's main loop: grow the tree of every vertex already in the fringe
+    # until the fringe is empty; returns the updated iteration count
+    while not fringe.is_empty():
+        # extract vertex with minimum key
+        current, current_key = fringe.extract_min()
+
+        # skip if already visited
+        if current in visited:
+            continue
+
+        visited.add(current)
+        iteration += 1
+
+        # add edge to MST (except for the root)
+        if parent[current] is not None:
+            edge = (parent[current], current, key[current])
+            mst_edges.append(edge)
+
+        # update keys for neighbors
+        neighbors = graph.get_neighbors(current)
+        for neighbor, weight in neighbors.items():
+            # if neighbor not in MST and edge weight is smaller
+            if neighbor not in visited and weight < key[neighbor]:
+                key[neighbor] = weight
+                parent[neighbor] = current
+                fringe.insert(neighbor, weight)
+
+        # record this step
+        if record_history:
+            step_history.append({
+                'iteration': iteration,
+                'current': current,
+                'current_key': current_key,
+                'visited': visited.copy(),
+                'mst_edges': mst_edges.copy(),
+                'keys': key.copy(),
+                'parent': parent.copy(),
+                'fringe_size': fringe.size()
+            })
+
+    return iteration
 
 
 def prim(
     graph: Graph,
     start: str,
-    fringe_type: str = 'heap'
-) -> Tuple[List[Tuple[str, str, float]], float, List[Dict[str, Any]]]:
+    fringe_type: str = 'auto',
+    record_history: bool = True,
+    require_spanning: bool = False,
+    compact: bool = False
+) -> Union[Tuple[List[Tuple[str, str, float]], float, List[Dict[str, Any]]], MSTResult]:
     # Prim's algorithm
+    # fringe_type: 'heap', 'list', 'dense' (array scan) or 'auto'
+    # require_spanning: fail up front if start's component is not the whole
+    # graph, instead of returning a tree of that component only
+    # compact: return an MSTResult backed by flat arrays instead of a list
+    # of tuples (unpacks the same way; never records step history)
     # Returns: (MST edges, total weight, step history)
+    # step history is empty when record_history is False
 
     # Step 1: validate inputs
     if not graph.has_vertex(start):
@@ -98,13 +437,25 @@ def prim(
     if graph.directed:
         raise ValueError("Prim's algorithm requires an undirected graph")
 
+    if require_spanning and graph.num_components() > 1:
+        raise ValueError(
+            f"Graph has {graph.num_components()} components, "
+            f"no spanning tree reaches every vertex from '{start}'"
+        )
+
+    fringe_type = _resolve_fringe(graph, fringe_type)
+    if fringe_type == 'dense':
+        if compact:
+            _, key, parent, _, _ = _prim_dense_arrays(graph, start, False)
+            return mst_result(graph.to_csr(), compact_ids(parent), key)
+        return prim_dense(graph, start, record_history)
+
     # Step 2: initialize fringe
-    if fringe_type == 'heap':
-        fringe = BinaryHeap()
-    elif fringe_type == 'list':
-        fringe = SortedLinkedList()
-    else:
-        raise ValueError(f"Invalid fringe_type: {fringe_type}")
+    fringe = make_fringe(fringe_type, range(graph.num_vertices()) if compact else graph.vertex_order())
+
+    if compact:
+        csr = graph.to_csr()
+        return mst_result(csr, *prim_compact(csr, csr.index[start], fringe))
 
     # Step 3: initialize key values and parent pointers
     # key = minimum edge weight to connect vertex to MST
@@ -119,61 +470,644 @@ def prim(
     fringe.insert(start, 0.0)
 
     # record initial state
-    step_history.append({
-        'iteration': 0,
-        'current': None,
-        'visited': set(),
-        'mst_edges': [],
-        'keys': key.copy(),
-        'fringe_size': fringe.size()
-    })
-
-    iteration = 0
+    if record_history:
+        step_history.append({
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'mst_edges': [],
+            'keys': key.copy(),
+            'fringe_size': fringe.size()
+        })
 
     # Step 5: main loop - grow MST one vertex at a time
-    while not fringe.is_empty():
-        # extract vertex with minimum key
-        current, current_key = fringe.extract_min()
+    _grow_mst(graph, fringe, key, parent, visited, mst_edges,
+              step_history, 0, record_history)
 
-        # skip if already visited
-        if current in visited:
-            continue
+    # calculate total MST weight
+    total_weight = sum(weight for _, _, weight in mst_edges)
 
-        visited.add(current)
-        iteration += 1
+    return mst_edges, total_weight, step_history
 
-        # Step 6: add edge to MST (except for start vertex)
-        if parent[current] is not None:
-            edge = (parent[current], current, key[current])
-            mst_edges.append(edge)
 
-        # Step 7: update keys for neighbors
-        neighbors = graph.get_neighbors(current)
-        for neighbor, weight in neighbors.items():
-            # if neighbor not in MST and edge weight is smaller
-            if neighbor not in visited and weight < key[neighbor]:
+def prim_dense(
+    graph: Graph,
+    start: str,
+    record_history: bool = True
+) -> Tuple[List[Tuple[str, str, float]], float, List[Dict[str, Any]]]:
+    # Prim's algorithm on a dense weight matrix
+    # argmin over all keys picks the next vertex, one vectorized row
+    # comparison updates the keys: O(V^2) total
+    # Returns the same (MST edges, total weight, history) as prim
+
+    # Step 1: validate inputs
+    if not graph.has_vertex(start):
+        raise ValueError(f"Start vertex '{start}' not in graph")
+
+    if graph.directed:
+        raise ValueError("Prim's algorithm requires an undirected graph")
+
+    vertices, key, parent, order, step_history = _prim_dense_arrays(graph, start, record_history)
+    mst_edges = [(vertices[parent[c]], vertices[c], float(key[c])) for c in order]
+    total_weight = sum(weight for _, _, weight in mst_edges)
+
+    return mst_edges, total_weight, step_history
+
+
+def _prim_dense_arrays(
+    graph: Graph,
+    start: str,
+    record_history: bool
+) -> Tuple[List[str], np.ndarray, np.ndarray, List[int], List[Dict[str, Any]]]:
+    # array-scan Prim core: (vertices, key, parent ids, join order, history)
+    # where join order lists every non-root tree vertex as it was added
+
+    # Step 2: initialize key and parent arrays
+    vertices, matrix = graph.to_matrix()
+    n = len(vertices)
+    key = np.full(n, np.inf)
+    key[vertices.index(start)] = 0.0
+    parent = np.full(n, -1, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    order: List[int] = []
+    mst_edges: List[Tuple[str, str, float]] = []
+    step_history: List[Dict[str, Any]] = []
+
+    if record_history:
+        step_history.append({
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'mst_edges': [],
+            'keys': dict(zip(vertices, key.tolist())),
+            'fringe_size': 1
+        })
+
+    # frontier holds keys of vertices outside the tree, inf otherwise;
+    # blocked is inf for tree vertices so their keys are never updated
+    frontier = key.copy()
+    blocked = np.zeros(n)
+
+    # Step 3: main loop - add the cheapest vertex outside the tree
+    for iteration in range(1, n + 1):
+        current = int(np.argmin(frontier))
+        if frontier[current] == np.inf:
+            break  # rest of the graph is in other components
+        in_tree[current] = True
+        frontier[current] = np.inf
+        blocked[current] = np.inf
+
+        if parent[current] >= 0:
+            order.append(current)
+
+        # Step 4: update keys from the new vertex's row
+        row = matrix[current] + blocked
+        improved = row < frontier
+        np.minimum(frontier, row, out=frontier)
+        key[improved] = row[improved]
+        parent[improved] = current
+
+        if record_history:
+            if parent[current] >= 0:
+                mst_edges.append((vertices[parent[current]], vertices[current], float(key[current])))
+            step_history.append({
+                'iteration': iteration,
+                'current': vertices[current],
+                'current_key': float(key[current]),
+                'visited': {vertices[i] for i in np.flatnonzero(in_tree)},
+                'mst_edges': mst_edges.copy(),
+                'keys': dict(zip(vertices, key.tolist())),
+                'parent': _labels(vertices, parent),
+                'fringe_size': int(np.count_nonzero(frontier < np.inf))
+            })
+
+    return vertices, key, parent, order, step_history
+
+
+def prim_compact(
+    csr: CSRGraph,
+    s: int,
+    fringe: PriorityQueue
+) -> Tuple[array, array]:
+    # scalar Prim from vertex id s over a CSR snapshot with
+    # array('d')/array('i') state
+    # Returns: (parent ids, keys)
+    n = csr.num_vertices()
+    indptr = csr.indptr.tolist()
+
+    key = float_array(n)
+    key[s] = 0.0
+    parent = id_array(n)
+    in_tree = bytearray(n)
+
+    fringe.insert(s, 0.0)
+
+    while not fringe.is_empty():
+        current, _ = fringe.extract_min()
+        if in_tree[current]:
+            continue
+        in_tree[current] = 1
+
+        lo = indptr[current]
+        hi = indptr[current + 1]
+        for neighbor, weight in zip(csr.indices[lo:hi].tolist(), csr.weights[lo:hi].tolist()):
+            if not in_tree[neighbor] and weight < key[neighbor]:
                 key[neighbor] = weight
                 parent[neighbor] = current
                 fringe.insert(neighbor, weight)
 
-        # record this step
+    return parent, key
+
+
+def mst_result(csr: CSRGraph, parent, key) -> MSTResult:
+    # vertices with a parent are exactly the non-root tree vertices
+    # csr must be the snapshot parent and key were computed on
+    total_weight = float(np.asarray(key)[np.asarray(parent) >= 0].sum())
+    return MSTResult(csr.vertices, csr.index, parent, key, total_weight)
+
+
+def minimum_spanning_forest(
+    graph: Graph,
+    fringe_type: str = 'heap',
+    record_history: bool = True
+) -> Tuple[List[List[Tuple[str, str, float]]], List[float], List[Dict[str, Any]]]:
+    # Prim's algorithm over every component in a single pass
+    # one fringe and one set of key/parent structures are shared by all
+    # components, so the whole forest costs the same as one prim call
+    # Returns: (edge list per component, weight per component, step history)
+
+    # Step 1: validate inputs
+    if graph.directed:
+        raise ValueError("Prim's algorithm requires an undirected graph")
+
+    # Step 2: initialize fringe, keys and parents once
+    fringe = make_fringe(fringe_type, graph.vertex_order())
+    vertices = graph.get_vertices()
+    key: Dict[str, float] = {v: float('inf') for v in vertices}
+    parent: Dict[str, Optional[str]] = {v: None for v in vertices}
+    visited: Set[str] = set()
+    mst_edges: List[Tuple[str, str, float]] = []
+    step_history: List[Dict[str, Any]] = []
+
+    component_edges: List[List[Tuple[str, str, float]]] = []
+    component_weights: List[float] = []
+
+    # record initial state
+    if record_history:
         step_history.append({
-            'iteration': iteration,
-            'current': current,
-            'current_key': current_key,
-            'visited': visited.copy(),
-            'mst_edges': mst_edges.copy(),
+            'iteration': 0,
+            'current': None,
+            'visited': set(),
+            'mst_edges': [],
             'keys': key.copy(),
-            'parent': parent.copy(),
-            'fringe_size': fringe.size()
+            'fringe_size': 0
         })
 
+    iteration = 0
+
+    # Step 3: every unvisited vertex roots a new component
+    for root in sorted(vertices):
+        if root in visited:
+            continue
+
+        first_edge = len(mst_edges)
+        key[root] = 0.0
+        fringe.insert(root, 0.0)
+        iteration = _grow_mst(graph, fringe, key, parent, visited, mst_edges,
+                              step_history, iteration, record_history)
+
+        # Step 4: edges added since the root belong to this component
+        edges = mst_edges[first_edge:]
+        component_edges.append(edges)
+        component_weights.append(sum(weight for _, _, weight in edges))
+
+    return component_edges, component_weights, step_history
+
+
+# edge arrays shared with Boruvka worker processes (set once per pool)
+_boruvka_edges: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+
+def _init_boruvka_worker(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> None:
+    global _boruvka_edges
+    _boruvka_edges = (sources, targets, weights)
+
+
+def _cheapest_edges(
+    component: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    edge_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    # cheapest outgoing edge of every component among edge_ids
+    # ties are broken by edge id so all components agree on one total order
+    comp_u = component[sources[edge_ids]]
+    comp_v = component[targets[edge_ids]]
+    crossing = comp_u != comp_v
+    edge_ids = edge_ids[crossing]
+
+    # a crossing edge is a candidate for the components at both of its ends
+    cand_comp = np.concatenate([comp_u[crossing], comp_v[crossing]])
+    cand_edge = np.concatenate([edge_ids, edge_ids])
+    if len(cand_edge) == 0:
+        return cand_comp, cand_edge
+
+    order = np.lexsort((cand_edge, weights[cand_edge], cand_comp))
+    cand_comp = cand_comp[order]
+    cand_edge = cand_edge[order]
+
+    # first entry of each component run is its cheapest edge
+    first = np.ones(len(cand_comp), dtype=bool)
+    first[1:] = cand_comp[1:] != cand_comp[:-1]
+    return cand_comp[first], cand_edge[first]
+
+
+def _boruvka_chunk(task: Tuple[np.ndarray, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    # worker entry point: cheapest edges for the edge range [lo, hi)
+    component, lo, hi = task
+    sources, targets, weights = _boruvka_edges
+    return _cheapest_edges(component, sources, targets, weights, np.arange(lo, hi))
+
+
+def boruvka(
+    graph: Graph,
+    workers: int = 1
+) -> Tuple[List[Tuple[str, str, float]], float, List[Dict[str, Any]]]:
+    # Boruvka's algorithm
+    # every round each component picks its cheapest outgoing edge in parallel,
+    # then components are merged with union-find
+    # Returns: (MST edges, total weight, per-round history)
+    # on a disconnected graph the result is a minimum spanning forest
+
+    # Step 1: validate inputs
+    if graph.directed:
+        raise ValueError("Boruvka's algorithm requires an undirected graph")
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+
+    # Step 2: flatten graph into edge arrays (sources are sorted)
+    vertices, sources, targets, weights = graph.to_edge_arrays()
+    num_vertices = len(vertices)
+
+    # Step 3: partition vertices into contiguous ranges, one per worker,
+    # and map each range to the slice of edges it owns
+    vertex_bounds = np.linspace(0, num_vertices, workers + 1).astype(np.int64)
+    edge_bounds = np.searchsorted(sources, vertex_bounds)
+    chunks = [(int(edge_bounds[i]), int(edge_bounds[i + 1])) for i in range(workers)]
+
+    components = UnionFind(num_vertices)
+    component = np.arange(num_vertices, dtype=np.int64)
+    mst_edges: List[Tuple[str, str, float]] = []
+    step_history: List[Dict[str, Any]] = [{
+        'iteration': 0,
+        'num_components': num_vertices,
+        'mst_edges': []
+    }]
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_boruvka_worker,
+            initargs=(sources, targets, weights)
+        )
+
+    try:
+        iteration = 0
+        while True:
+            # Step 4: cheapest outgoing edge per component, per chunk
+            if pool is None:
+                partials = [_cheapest_edges(component, sources, targets, weights,
+                                            np.arange(len(sources)))]
+            else:
+                partials = list(pool.map(_boruvka_chunk,
+                                         [(component, lo, hi) for lo, hi in chunks]))
+
+            # Step 5: reduce chunk winners to one edge per component
+            cand_comp = np.concatenate([c for c, _ in partials])
+            cand_edge = np.concatenate([e for _, e in partials])
+            if len(cand_edge) == 0:
+                break
+            order = np.lexsort((cand_edge, weights[cand_edge], cand_comp))
+            cand_comp = cand_comp[order]
+            cand_edge = cand_edge[order]
+            first = np.ones(len(cand_comp), dtype=bool)
+            first[1:] = cand_comp[1:] != cand_comp[:-1]
+
+            # Step 6: merge components along the selected edges
+            # an edge chosen by both of its components is only added once
+            for e in np.unique(cand_edge[first]).tolist():
+                u = int(sources[e])
+                v = int(targets[e])
+                if components.union(u, v):
+                    mst_edges.append((vertices[u], vertices[v], float(weights[e])))
+
+            component = np.array([components.find(i) for i in range(num_vertices)],
+                                 dtype=np.int64)
+            iteration += 1
+
+            # record this round
+            step_history.append({
+                'iteration': iteration,
+                'num_components': components.num_sets(),
+                'mst_edges': mst_edges.copy()
+            })
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
     # calculate total MST weight
     total_weight = sum(weight for _, _, weight in mst_edges)
 
     return mst_edges, total_weight, step_history
 
 
+# CSR arrays shared with delta-stepping worker processes (set once per pool)
+_delta_csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+# frontiers with fewer outgoing edges than this are relaxed in-process,
+# shipping them to the pool costs more than the relaxation itself
+DELTA_PARALLEL_MIN_EDGES = 20000
+
+
+def _init_delta_worker(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray) -> None:
+    global _delta_csr
+    _delta_csr = (indptr, indices, weights)
+
+
+def _auto_delta(weights: np.ndarray, avg_degree: float) -> float:
+    # bucket width from the weight distribution: pick the weight quantile
+    # that leaves about two light edges per vertex, so light phases stay
+    # short while buckets are still wide enough to relax in bulk
+    if len(weights) == 0:
+        return 1.0
+    fraction = min(1.0, 2.0 / max(avg_degree, 1.0))
+    delta = float(np.quantile(weights, fraction))
+    return delta if delta > 0 else float(weights.max()) or 1.0
+
+
+def _relax_requests(
+    frontier: np.ndarray,
+    frontier_distance: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    delta: float,
+    light: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # gather every light (weight <= delta) or heavy edge leaving frontier and
+    # reduce to one (target, distance, predecessor) request per target
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+
+    # edge ids of all frontier rows laid end to end
+    row_offsets = np.cumsum(counts) - counts
+    edge_ids = np.repeat(starts - row_offsets, counts) + np.arange(total)
+    sources = np.repeat(frontier, counts)
+    source_distance = np.repeat(frontier_distance, counts)
+
+    edge_weights = weights[edge_ids]
+    keep = edge_weights <= delta if light else edge_weights > delta
+    targets = indices[edge_ids[keep]]
+    candidate = source_distance[keep] + edge_weights[keep]
+    sources = sources[keep]
+
+    # best candidate per target
+    order = np.lexsort((sources, candidate, targets))
+    targets = targets[order]
+    first = np.ones(len(targets), dtype=bool)
+    first[1:] = targets[1:] != targets[:-1]
+    return targets[first], candidate[order][first], sources[order][first]
+
+
+def _delta_chunk(task: Tuple[np.ndarray, np.ndarray, float, bool]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # worker entry point: relaxation requests for one slice of the frontier
+    frontier, frontier_distance, delta, light = task
+    indptr, indices, weights = _delta_csr
+    return _relax_requests(frontier, frontier_distance, indptr, indices, weights, delta, light)
+
+
+def delta_stepping(
+    graph: Graph,
+    source: str,
+    delta: Optional[float] = None,
+    workers: int = 1
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]], List[Dict[str, Any]]]:
+    # delta-stepping single-source shortest paths
+    # vertices are grouped into buckets of width delta; a bucket is settled by
+    # repeatedly relaxing light edges (weight <= delta) of its whole frontier in
+    # bulk, then heavy edges once. Frontiers are split across a process pool
+    # when workers > 1. delta defaults to a value tuned from the weights.
+    # Returns: (distances dict, previous dict, per-bucket history)
+
+    # Step 1: validate inputs
+    if not graph.has_vertex(source):
+        raise ValueError(f"Source vertex '{source}' not in graph")
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+
+    csr = graph.to_csr()
+    vertices = csr.vertices
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(vertices)
+
+    if delta is None:
+        delta = _auto_delta(weights, len(indices) / max(n, 1))
+    elif delta <= 0:
+        raise ValueError("delta must be positive")
+
+    # Step 2: initialize distance and predecessor arrays
+    distance = np.full(n, np.inf)
+    distance[csr.index[source]] = 0.0
+    previous = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+    step_history: List[Dict[str, Any]] = []
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_delta_worker,
+            initargs=(indptr, indices, weights)
+        )
+
+    def relax(frontier: np.ndarray, light: bool) -> np.ndarray:
+        # relax light or heavy edges out of frontier, return improved vertices
+        edge_count = int((indptr[frontier + 1] - indptr[frontier]).sum())
+        if pool is None or edge_count < DELTA_PARALLEL_MIN_EDGES:
+            targets, candidate, sources = _relax_requests(
+                frontier, distance[frontier], indptr, indices, weights, delta, light)
+        else:
+            chunks = np.array_split(frontier, workers)
+            partials = list(pool.map(_delta_chunk, [
+                (chunk, distance[chunk], delta, light) for chunk in chunks
+            ]))
+            targets = np.concatenate([t for t, _, _ in partials])
+            candidate = np.concatenate([c for _, c, _ in partials])
+            sources = np.concatenate([p for _, _, p in partials])
+            order = np.lexsort((sources, candidate, targets))
+            targets, candidate, sources = targets[order], candidate[order], sources[order]
+            first = np.ones(len(targets), dtype=bool)
+            first[1:] = targets[1:] != targets[:-1]
+            targets, candidate, sources = targets[first], candidate[first], sources[first]
+
+        improved = candidate < distance[targets]
+        targets = targets[improved]
+        distance[targets] = candidate[improved]
+        previous[targets] = sources[improved]
+        return targets
+
+    # bucket index -> arrays of vertices placed there, plus a heap of the
+    # non-empty indices; entries go stale when a vertex improves into a lower
+    # bucket or is settled, and are dropped when their bucket comes up
+    buckets: Dict[int, List[np.ndarray]] = defaultdict(list)
+    bucket_heap: List[int] = []
+
+    def place(improved: np.ndarray) -> None:
+        # place improved vertices in the bucket of their new distance
+        if not len(improved):
+            return
+        ids = (distance[improved] // delta).astype(np.int64)
+        order = np.argsort(ids, kind='stable')
+        ids, improved = ids[order], improved[order]
+        cuts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        for bucket, group in zip(ids[np.concatenate(([0], cuts))].tolist(), np.split(improved, cuts)):
+            if bucket not in buckets:
+                heapq.heappush(bucket_heap, bucket)
+            buckets[bucket].append(group)
+
+    try:
+        iteration = 0
+        place(np.array([csr.index[source]], dtype=np.int64))
+        while bucket_heap:
+            # Step 3: take the lowest non-empty bucket, minus stale entries
+            bucket = heapq.heappop(bucket_heap)
+            frontier = np.unique(np.concatenate(buckets.pop(bucket)))
+            frontier = frontier[~settled[frontier] & (distance[frontier] // delta == bucket)]
+            if not len(frontier):
+                continue
+            iteration += 1
+
+            # Step 4: light phases - relax until the bucket stops changing
+            removed = [frontier]
+            phases = 0
+            while len(frontier):
+                improved = relax(frontier, light=True)
+                in_bucket = distance[improved] // delta == bucket
+                place(improved[~in_bucket])
+                frontier = improved[in_bucket]
+                removed.append(frontier)
+                phases += 1
+
+            # Step 5: heavy edges land in later buckets, relax them once
+            bucket_vertices = np.unique(np.concatenate(removed))
+            place(relax(bucket_vertices, light=False))
+            settled[bucket_vertices] = True
+
+            step_history.append({
+                'iteration': iteration,
+                'bucket': bucket,
+                'settled': len(bucket_vertices),
+                'light_phases': phases
+            })
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return dict(zip(vertices, distance.tolist())), _labels(vertices, previous), step_history
+
+
+def bounded_dijkstra(
+    graph: Graph,
+    source: str,
+    radius: Optional[float] = None,
+    k: Optional[int] = None,
+    fringe_type: str = 'heap',
+    target: Optional[str] = None
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    # Dijkstra's algorithm that stops early
+    # radius: settle only vertices within this distance (isochrone)
+    # k: settle at most k vertices, the source included (k nearest)
+    # target: stop as soon as target is settled (point-to-point)
+    # Nothing is sized to the whole graph: work and memory are proportional
+    # to the vertices actually touched.
+    # Returns: (distances, previous) for the settled vertices only
+
+    # Step 1: validate inputs
+    if not graph.has_vertex(source):
+        raise ValueError(f"Source vertex '{source}' not in graph")
+    if radius is not None and radius < 0:
+        raise ValueError("radius cannot be negative")
+    if k is not None and k < 1:
+        raise ValueError("k must be at least 1")
+    if fringe_type == 'auto':
+        fringe_type = 'heap'
+
+    # Step 2: sparse tentative distances, filled in as vertices are reached
+    fringe = make_fringe(fringe_type, graph.vertex_order())
+    tentative: Dict[str, float] = {source: 0.0}
+    parent: Dict[str, Optional[str]] = {source: None}
+    distance: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    infinity = float('inf')
+
+    fringe.insert(source, 0.0)
+
+    # Step 3: settle vertices in distance order until a bound is hit
+    while not fringe.is_empty():
+        current, current_dist = fringe.extract_min()
+        if current in distance:
+            continue
+        if radius is not None and current_dist > radius:
+            break
+
+        distance[current] = current_dist
+        previous[current] = parent[current]
+        if k is not None and len(distance) >= k:
+            break
+        if current == target:
+            break
+
+        for neighbor, weight in graph.get_neighbors(current).items():
+            if neighbor not in distance:
+                alt_distance = current_dist + weight
+                if alt_distance < tentative.get(neighbor, infinity):
+                    tentative[neighbor] = alt_distance
+                    parent[neighbor] = current
+                    fringe.insert(neighbor, alt_distance)
+
+    return distance, previous
+
+
+def shortest_path(
+    graph: Graph,
+    source: str,
+    target: str,
+    fringe_type: str = 'heap'
+) -> Tuple[Optional[List[str]], float]:
+    # point-to-point shortest path
+    # vertices in different components are rejected in O(a(n)) through the
+    # graph's component index; otherwise Dijkstra stops once target is settled
+    # Returns: (path or None, distance or inf)
+    if not graph.has_vertex(source):
+        raise ValueError(f"Source vertex '{source}' not in graph")
+    if not graph.has_vertex(target):
+        raise ValueError(f"Target vertex '{target}' not in graph")
+
+    if not graph.same_component(source, target):
+        return None, float('inf')
+
+    distance, previous = bounded_dijkstra(graph, source, fringe_type=fringe_type, target=target)
+    if target not in distance:
+        return None, float('inf')  # directed graph, weakly but not strongly reachable
+    return get_shortest_path(source, target, previous), distance[target]
+
+
 def get_shortest_path(
     source: str,
     target: str,
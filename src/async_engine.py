@@ -0,0 +1,274 @@
+from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
+import time
+from src.graph import Graph, CSRGraph
+from src.algorithms import make_fringe, dijkstra_compact, prim_compact, mst_result
+from src.results import ShortestPathResult, MSTResult
+
+# query kinds with their own latency histogram
+QUERY_KINDS = ('distances', 'shortest_path', 'mst')
+
+
+class LatencyHistogram:
+    # log2-bucketed latency histogram: bucket i counts latencies up to
+    # BASE_MS * 2 ** i, the last bucket everything slower
+    # percentiles are reported as the upper bound of their bucket, so they
+    # are at most 2x pessimistic while memory stays constant
+
+    BASE_MS = 0.05
+    NUM_BUCKETS = 24  # up to ~7 minutes
+
+    def __init__(self):
+        self.counts = [0] * (self.NUM_BUCKETS + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        bucket = 0
+        bound = self.BASE_MS
+        while ms > bound and bucket < self.NUM_BUCKETS:
+            bucket += 1
+            bound *= 2
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        # latency (ms) that q percent of recorded queries did not exceed
+        if self.count == 0:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.BASE_MS * 2 ** bucket, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+            'buckets_ms': {self.BASE_MS * 2 ** i: c for i, c in enumerate(self.counts) if c}
+        }
+
+
+# CSR snapshot shared with engine worker processes (set once per pool)
+_engine_csr: Optional[CSRGraph] = None
+
+
+def _init_engine_worker(csr: CSRGraph) -> None:
+    global _engine_csr
+    _engine_csr = csr
+
+
+def _engine_task(kind: str, s: int, fringe_type: str, csr: Optional[CSRGraph] = None) -> Tuple[Any, Any]:
+    # worker entry point: compact single-source search from vertex id s
+    # threads pass the snapshot, processes use the one from their initializer
+    # Returns: (distances or keys, predecessor or parent ids)
+    csr = csr if csr is not None else _engine_csr
+    fringe = make_fringe(fringe_type, range(csr.num_vertices()))
+    if kind == 'mst':
+        parent, key = prim_compact(csr, s, fringe)
+        return key, parent
+    return dijkstra_compact(csr, s, fringe)
+
+
+class AsyncGraphEngine:
+    # asyncio facade over the compact dijkstra/prim searches
+    # queries run on a thread or process pool so the event loop never
+    # blocks. Concurrent queries for the same (kind, vertex, graph version)
+    # share one computation; distinct ones wait in a queue of at most
+    # max_pending entries, so callers are slowed down (backpressure) rather
+    # than piling up work. Thread workers still share the GIL; use
+    # executor='process' for parallel speedup on multi-core machines.
+
+    def __init__(
+        self,
+        graph: Graph,
+        executor: str = 'thread',
+        workers: int = 4,
+        max_pending: int = 64,
+        fringe_type: str = 'heap'
+    ):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Invalid executor: {executor}")
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        make_fringe(fringe_type)  # validates fringe_type
+
+        self.graph = graph
+        self.executor = executor
+        self.workers = workers
+        self.max_pending = max_pending
+        self.fringe_type = fringe_type
+
+        self._pool: Optional[Executor] = None
+        self._pool_version: Optional[int] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumers: List[asyncio.Task] = []
+        # (kind, vertex, graph version) -> future shared by identical queries
+        self._inflight: Dict[Tuple[str, str, int], asyncio.Future] = {}
+
+        self._latency = {kind: LatencyHistogram() for kind in QUERY_KINDS}
+        self._computed = 0
+        self._coalesced = 0
+
+    async def distances(self, source: str) -> ShortestPathResult:
+        # single-source shortest paths as a compact result
+        start = time.perf_counter()
+        result = await self._query('distances', source)
+        self._latency['distances'].record(time.perf_counter() - start)
+        return result
+
+    async def shortest_path(self, source: str, target: str) -> Tuple[Optional[List[str]], float]:
+        # (path or None, distance); shares the single-source search with
+        # every concurrent query from the same source
+        if not self.graph.has_vertex(target):
+            raise ValueError(f"Target vertex '{target}' not in graph")
+        start = time.perf_counter()
+        result = await self._query('distances', source)
+        path = result.path(target)
+        self._latency['shortest_path'].record(time.perf_counter() - start)
+        return path, result.distance[target]
+
+    async def mst(self, start: Optional[str] = None) -> MSTResult:
+        # minimum spanning tree of start's component (first vertex by default)
+        if self.graph.directed:
+            raise ValueError("Prim's algorithm requires an undirected graph")
+        if start is None:
+            if self.graph.num_vertices() == 0:
+                raise ValueError("Graph is empty")
+            start = self.graph.to_csr().vertices[0]
+        begin = time.perf_counter()
+        result = await self._query('mst', start)
+        self._latency['mst'].record(time.perf_counter() - begin)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'computed': self._computed,
+            'coalesced': self._coalesced,
+            'pending': self._queue.qsize() if self._queue is not None else 0,
+            'latency': {kind: histogram.summary() for kind, histogram in self._latency.items()}
+        }
+
+    async def close(self) -> None:
+        # queries still queued or running fail with RuntimeError
+        # (taken before cancelling: consumers drop their key when cancelled)
+        pending = list(self._inflight.values())
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+
+        # Step 1: empty the queue, which also wakes callers waiting for room
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            pending.append(future)
+        self._queue = None
+        self._inflight = {}
+
+        # Step 2: fail every future so no caller awaits it forever
+        for future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("engine closed"))
+                future.exception()  # callers get it; never "unretrieved"
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    async def __aenter__(self) -> 'AsyncGraphEngine':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _query(self, kind: str, vertex: str) -> Any:
+        if not self.graph.has_vertex(vertex):
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+
+        # Step 1: join an identical computation already in flight
+        key = (kind, vertex, self.graph.version)
+        future = self._inflight.get(key)
+        if future is not None:
+            self._coalesced += 1
+            return await asyncio.shield(future)
+
+        # Step 2: enqueue a new one, waiting while the queue is full (or
+        # until close() fails the future)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._start()
+        queued = asyncio.ensure_future(self._queue.put((key, future)))
+        try:
+            await asyncio.wait({queued, future}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # cancelled while waiting for room; coalesced waiters fail too
+            queued.cancel()
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_exception(RuntimeError("Query was cancelled before it started"))
+                future.exception()
+            raise
+        queued.cancel()  # no-op once the entry is in the queue
+
+        # shield: a cancelled caller must not cancel the shared computation
+        return await asyncio.shield(future)
+
+    def _start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._consumers = [asyncio.ensure_future(self._consume()) for _ in range(self.workers)]
+
+    def _pool_for(self, csr: CSRGraph) -> Executor:
+        # process workers hold a copy of the snapshot, so they are replaced
+        # when the graph changes
+        if self._pool is None:
+            if self.executor == 'thread':
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 initializer=_init_engine_worker, initargs=(csr,))
+            self._pool_version = self.graph.version
+        elif self.executor == 'process' and self._pool_version != self.graph.version:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            return self._pool_for(csr)
+        return self._pool
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            key, future = await self._queue.get()
+            kind, vertex, _ = key
+            try:
+                csr = self.graph.to_csr()
+                pool = self._pool_for(csr)
+                shared = csr if self.executor == 'thread' else None
+                values, parents = await loop.run_in_executor(
+                    pool, _engine_task, kind, csr.index[vertex], self.fringe_type, shared)
+                self._computed += 1
+
+                if kind == 'mst':
+                    result = mst_result(csr, parents, values)
+                else:
+                    result = ShortestPathResult(csr.vertices, csr.index, vertex, values, parents)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                self._inflight.pop(key, None)
+                self._queue.task_done()
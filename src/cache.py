@@ -0,0 +1,178 @@
+from typing import Dict, List, Tuple, Optional, Set
+from collections import OrderedDict
+import weakref
+import numpy as np
+from src.graph import Graph
+from src.algorithms import dijkstra
+
+
+class _CachedTree:
+    # compact single-source result: distances and predecessor ids indexed
+    # by the graph's CSR vertex order (-1 means no predecessor)
+
+    __slots__ = ('vertices', 'index', 'distance', 'previous')
+
+    def __init__(self, vertices: List[str], index: Dict[str, int],
+                 distance: np.ndarray, previous: np.ndarray):
+        self.vertices = vertices
+        self.index = index
+        self.distance = distance
+        self.previous = previous
+
+    def nbytes(self) -> int:
+        # vertex list and index are shared by every entry of a graph version
+        return self.distance.nbytes + self.previous.nbytes
+
+
+class ShortestPathCache:
+    # LRU cache of single-source Dijkstra results
+    # entries are keyed on (graph identity, graph version, source); the
+    # fringe type does not change the result so it is not part of the key.
+    # A graph's entries are dropped as soon as it is seen at a new version,
+    # and total entry size is kept under max_bytes by evicting the least
+    # recently used entries.
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, fringe_type: str = 'auto'):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.fringe_type = fringe_type
+
+        self._entries: 'OrderedDict[Tuple[int, int, str], _CachedTree]' = OrderedDict()
+        # graph id -> (version of its cached entries, keys of those entries)
+        self._graphs: Dict[int, Tuple[int, Set[Tuple[int, int, str]]]] = {}
+        # ids of graphs with a finalizer registered
+        self._watched: Set[int] = set()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def distances(self, graph: Graph, source: str) -> Dict[str, float]:
+        # distance from source to every vertex (inf if unreachable)
+        tree = self._lookup(graph, source)
+        return dict(zip(tree.vertices, tree.distance.tolist()))
+
+    def distance(self, graph: Graph, source: str, target: str) -> float:
+        # distance from source to target (inf if unreachable)
+        tree = self._lookup(graph, source)
+        if target not in tree.index:
+            raise ValueError(f"Target vertex '{target}' not in graph")
+        return float(tree.distance[tree.index[target]])
+
+    def shortest_path(self, graph: Graph, source: str, target: str) -> Optional[List[str]]:
+        # same result as get_shortest_path on a dijkstra run from source,
+        # but only walks the cached predecessor array after the first query
+        tree = self._lookup(graph, source)
+        if target not in tree.index:
+            return None
+
+        # Step 1: build path backwards from target
+        path = []
+        current = tree.index[target]
+        while current >= 0:
+            path.append(tree.vertices[current])
+            current = int(tree.previous[current])
+
+        # Step 2: check if we reached source
+        if path[-1] != source:
+            return None
+
+        path.reverse()
+        return path
+
+    def invalidate(self, graph: Optional[Graph] = None) -> None:
+        # drop entries of one graph, or everything
+        if graph is None:
+            for graph_id in list(self._graphs):
+                self._drop_graph(graph_id)
+        elif id(graph) in self._graphs:
+            self._drop_graph(id(graph))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'invalidations': self._invalidations,
+            'entries': len(self._entries),
+            'bytes': self._bytes
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, graph: Graph, source: str) -> _CachedTree:
+        graph_id = id(graph)
+        known = self._graphs.get(graph_id)
+
+        # Step 1: the graph changed since its entries were cached
+        if known is not None and known[0] != graph.version:
+            self._invalidations += 1
+            self._drop_graph(graph_id)
+            known = None
+
+        key = (graph_id, graph.version, source)
+        tree = self._entries.get(key)
+        if tree is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return tree
+
+        # Step 2: compute and store in compact form
+        self._misses += 1
+        tree = self._compute(graph, source)
+
+        if known is None:
+            known = (graph.version, set())
+            self._graphs[graph_id] = known
+        if graph_id not in self._watched:
+            # forget the graph's entries when it is garbage collected,
+            # before its id can be reused by another graph
+            self._watched.add(graph_id)
+            weakref.finalize(graph, self._forget_graph, graph_id)
+        known[1].add(key)
+        self._entries[key] = tree
+        self._bytes += tree.nbytes()
+
+        # Step 3: evict least recently used entries over budget
+        # (the new entry is kept even if it alone exceeds the budget)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, old_tree = self._entries.popitem(last=False)
+            self._bytes -= old_tree.nbytes()
+            self._graphs[old_key[0]][1].discard(old_key)
+            self._evictions += 1
+
+        return tree
+
+    def _compute(self, graph: Graph, source: str) -> _CachedTree:
+        distance, previous, _ = dijkstra(graph, source, self.fringe_type, record_history=False)
+        csr = graph.to_csr()
+        index = csr.index
+        dist_array = np.fromiter((distance[v] for v in csr.vertices),
+                                 dtype=np.float64, count=len(csr.vertices))
+        prev_array = np.fromiter(
+            (-1 if previous[v] is None else index[previous[v]] for v in csr.vertices),
+            dtype=np.int32 if len(csr.vertices) < 2 ** 31 else np.int64,
+            count=len(csr.vertices)
+        )
+        return _CachedTree(csr.vertices, index, dist_array, prev_array)
+
+    def _forget_graph(self, graph_id: int) -> None:
+        self._watched.discard(graph_id)
+        self._drop_graph(graph_id)
+
+    def _drop_graph(self, graph_id: int) -> None:
+        known = self._graphs.pop(graph_id, None)
+        if known is None:
+            return
+        for key in known[1]:
+            tree = self._entries.pop(key, None)
+            if tree is not None:
+                self._bytes -= tree.nbytes()
+
+    def __str__(self) -> str:
+        return (f"ShortestPathCache(entries={len(self._entries)}, bytes={self._bytes}, "
+                f"max_bytes={self.max_bytes})")
@@ -0,0 +1,229 @@
+from typing import Optional, Union, Any
+from array import array
+import os
+import time
+import zlib
+import numpy as np
+from src.graph import Graph, CSRGraph
+from src.fringe import BinaryHeap
+from src.results import ShortestPathResult, MSTResult, id_array, float_array
+from src.algorithms import mst_result
+
+# A checkpoint is one uncompressed .npz file holding the search state over
+# the graph's CSR vertex ids:
+#   algorithm    'dijkstra' or 'prim'
+#   source       id of the source (dijkstra) or start (prim) vertex
+#   value        float64 distance (dijkstra) or key (prim) per vertex
+#   parent       int32 predecessor (dijkstra) or parent (prim) per vertex
+#   done         bit-packed visited (dijkstra) or in-tree (prim) flags
+#   fringe_ids, fringe_priorities   heap contents
+#   steps        vertices settled so far
+#   fingerprint  CRC32 of the CSR snapshot, so a checkpoint is never
+#                resumed against a different graph
+_ALGORITHMS = ('dijkstra', 'prim')
+
+
+class _SearchState:
+    # mutable state of a checkpointable search over CSR vertex ids
+
+    __slots__ = ('algorithm', 'source', 'value', 'parent', 'done', 'fringe', 'steps')
+
+    def __init__(self, algorithm: str, source: int, value: array, parent: array,
+                 done: bytearray, fringe: BinaryHeap, steps: int = 0):
+        self.algorithm = algorithm
+        self.source = source
+        self.value = value
+        self.parent = parent
+        self.done = done
+        self.fringe = fringe
+        self.steps = steps
+
+
+class _Checkpointer:
+    # decides when to checkpoint and writes the file atomically
+    # (temporary file, then rename), so a crash mid-write keeps the previous
+    # checkpoint intact
+
+    def __init__(self, path: str, fingerprint: int, every_steps: Optional[int],
+                 every_seconds: Optional[float], start_steps: int = 0):
+        if every_steps is None and every_seconds is None:
+            raise ValueError("Set every_steps or every_seconds")
+        if every_steps is not None and every_steps <= 0:
+            raise ValueError("every_steps must be positive")
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError("every_seconds must be positive")
+        self.path = path
+        self.fingerprint = fingerprint
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.checkpoints = 0
+        self._last_steps = start_steps
+        self._last_time = time.perf_counter()
+
+    def maybe_save(self, state: _SearchState) -> None:
+        if self.every_steps is not None and state.steps - self._last_steps >= self.every_steps:
+            self.save(state)
+        elif self.every_seconds is not None and time.perf_counter() - self._last_time >= self.every_seconds:
+            self.save(state)
+
+    def save(self, state: _SearchState) -> None:
+        items = state.fringe.items()
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.savez(
+                f,
+                algorithm=np.array(state.algorithm),
+                source=np.int64(state.source),
+                value=np.frombuffer(state.value, dtype=np.float64),
+                parent=np.frombuffer(state.parent, dtype=state.parent.typecode),
+                done=np.packbits(np.frombuffer(state.done, dtype=np.uint8)),
+                fringe_ids=np.array([key for key, _ in items], dtype=np.int64),
+                fringe_priorities=np.array([priority for _, priority in items], dtype=np.float64),
+                steps=np.int64(state.steps),
+                fingerprint=np.int64(self.fingerprint)
+            )
+        os.replace(temporary, self.path)
+        self.checkpoints += 1
+        self._last_steps = state.steps
+        self._last_time = time.perf_counter()
+
+
+def graph_fingerprint(csr: CSRGraph) -> int:
+    # CRC32 over vertex labels and adjacency arrays
+    crc = zlib.crc32('\0'.join(csr.vertices).encode())
+    for values in (csr.indptr, csr.indices, csr.weights):
+        crc = zlib.crc32(np.ascontiguousarray(values).tobytes(), crc)
+    return crc
+
+
+def checkpointed_dijkstra(
+    graph: Graph,
+    source: str,
+    path: str,
+    every_steps: Optional[int] = None,
+    every_seconds: Optional[float] = None
+) -> ShortestPathResult:
+    # compact Dijkstra that saves its state to path every every_steps
+    # settled vertices and/or every every_seconds; the checkpoint is
+    # removed once the search finishes. Continue a crashed run with
+    # resume_search.
+    if not graph.has_vertex(source):
+        raise ValueError(f"Source vertex '{source}' not in graph")
+    csr = graph.to_csr()
+    checkpointer = _Checkpointer(path, graph_fingerprint(csr), every_steps, every_seconds)
+
+    n = csr.num_vertices()
+    s = csr.index[source]
+    value = float_array(n)
+    value[s] = 0.0
+    state = _SearchState('dijkstra', s, value, id_array(n), bytearray(n), BinaryHeap.from_items([(s, 0.0)], range(n)))
+    result = _run(csr, state, checkpointer)
+    _discard(path)
+    return result
+
+
+def checkpointed_prim(
+    graph: Graph,
+    start: str,
+    path: str,
+    every_steps: Optional[int] = None,
+    every_seconds: Optional[float] = None
+) -> MSTResult:
+    # compact Prim (spanning tree of start's component) with the same
+    # checkpointing as checkpointed_dijkstra
+    if graph.directed:
+        raise ValueError("Prim's algorithm requires an undirected graph")
+    if not graph.has_vertex(start):
+        raise ValueError(f"Start vertex '{start}' not in graph")
+    csr = graph.to_csr()
+    checkpointer = _Checkpointer(path, graph_fingerprint(csr), every_steps, every_seconds)
+
+    n = csr.num_vertices()
+    s = csr.index[start]
+    value = float_array(n)
+    value[s] = 0.0
+    state = _SearchState('prim', s, value, id_array(n), bytearray(n), BinaryHeap.from_items([(s, 0.0)], range(n)))
+    result = _run(csr, state, checkpointer)
+    _discard(path)
+    return result
+
+
+def resume_search(
+    graph: Graph,
+    path: str,
+    every_steps: Optional[int] = None,
+    every_seconds: Optional[float] = None
+) -> Union[ShortestPathResult, MSTResult]:
+    # continue the search saved in path against the same graph, rebuilding
+    # the fringe with one bulk heapify; keeps checkpointing to path when
+    # an interval is given
+    csr = graph.to_csr()
+    fingerprint = graph_fingerprint(csr)
+
+    # Step 1: load and validate the saved state
+    with np.load(path, allow_pickle=False) as data:
+        algorithm = str(data['algorithm'])
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(f"Unknown checkpoint algorithm: {algorithm}")
+        if int(data['fingerprint']) != fingerprint:
+            raise ValueError("Checkpoint was written for a different graph")
+
+        n = csr.num_vertices()
+        value = array('d')
+        value.frombytes(data['value'].tobytes())
+        parent_data = data['parent']
+        parent = array(parent_data.dtype.char)
+        parent.frombytes(parent_data.tobytes())
+        done = bytearray(np.unpackbits(data['done'], count=n).tobytes())
+        fringe = BinaryHeap.from_items(list(zip(data['fringe_ids'].tolist(),
+                                                data['fringe_priorities'].tolist())), range(n))
+        state = _SearchState(algorithm, int(data['source']), value, parent, done, fringe, int(data['steps']))
+
+    # Step 2: carry on, checkpointing only if asked to
+    checkpointer = None
+    if every_steps is not None or every_seconds is not None:
+        checkpointer = _Checkpointer(path, fingerprint, every_steps, every_seconds, state.steps)
+    result = _run(csr, state, checkpointer)
+    _discard(path)
+    return result
+
+
+def _run(csr: CSRGraph, state: _SearchState, checkpointer: Optional[_Checkpointer]) -> Any:
+    indptr = csr.indptr.tolist()
+    value = state.value
+    parent = state.parent
+    done = state.done
+    fringe = state.fringe
+    prim = state.algorithm == 'prim'
+
+    while not fringe.is_empty():
+        current, current_value = fringe.extract_min()
+        if done[current]:
+            continue
+        done[current] = 1
+        state.steps += 1
+
+        # Step 1: relax (dijkstra) or offer (prim) each incident edge
+        lo = indptr[current]
+        hi = indptr[current + 1]
+        for neighbor, weight in zip(csr.indices[lo:hi].tolist(), csr.weights[lo:hi].tolist()):
+            if not done[neighbor]:
+                candidate = weight if prim else current_value + weight
+                if candidate < value[neighbor]:
+                    value[neighbor] = candidate
+                    parent[neighbor] = current
+                    fringe.insert(neighbor, candidate)
+
+        # Step 2: save between steps, where the state is consistent
+        if checkpointer is not None:
+            checkpointer.maybe_save(state)
+
+    if prim:
+        return mst_result(csr, parent, value)
+    return ShortestPathResult(csr.vertices, csr.index, csr.vertices[state.source], value, parent)
+
+
+def _discard(path: str) -> None:
+    # a finished search leaves no checkpoint behind
+    if os.path.exists(path):
+        os.remove(path)
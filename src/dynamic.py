@@ -0,0 +1,287 @@
+from typing import Dict, List, Set, Tuple, Optional
+from collections import defaultdict
+from src.graph import Graph
+from src.fringe import BinaryHeap
+from src.link_cut_tree import LinkCutTree
+from src.algorithms import dijkstra, minimum_spanning_forest, get_shortest_path
+
+
+class DynamicShortestPaths:
+    # single-source shortest-path tree kept up to date under edge updates
+    # insertions and weight decreases seed the fringe with the improved
+    # endpoint and only re-relax the region that gets shorter; weight
+    # increases and deletions of tree edges reset the subtree below the edge
+    # and recompute it from its unaffected in-neighbors.
+    # Mutations should go through this object (add_edge / remove_edge); if
+    # the graph is changed elsewhere the tree is rebuilt from scratch on the
+    # next read.
+
+    def __init__(self, graph: Graph, source: str, fringe_type: str = 'heap'):
+        if not graph.has_vertex(source):
+            raise ValueError(f"Source vertex '{source}' not in graph")
+        self.graph = graph
+        self.source = source
+        self.fringe_type = fringe_type
+        # vertices whose distance or parent changed during the last update
+        self.last_update_touched = 0
+        self._rebuild()
+
+    @property
+    def distance(self) -> Dict[str, float]:
+        # vertex -> shortest distance from the source, rebuilt first if the
+        # graph was changed outside this object
+        self._sync()
+        return self._distance
+
+    @property
+    def previous(self) -> Dict[str, Optional[str]]:
+        # vertex -> parent in the shortest-path tree, like dijkstra's previous
+        self._sync()
+        return self._previous
+
+    def add_edge(self, u: str, v: str, weight: float) -> None:
+        # insert edge (u, v) or change its weight, then repair the tree
+        self._sync()
+        old_weight = self.graph.get_weight(u, v)
+        self.graph.add_edge(u, v, weight)
+        self._version = self.graph.version
+        self.last_update_touched = 0
+
+        for vertex in (u, v):
+            if vertex not in self._distance:
+                self._distance[vertex] = float('inf')
+                self._previous[vertex] = None
+        self._in_edges[v][u] = weight
+        if not self.graph.directed:
+            self._in_edges[u][v] = weight
+
+        if old_weight is None or weight < old_weight:
+            self._propagate(self._seed_edge(u, v, weight))
+        elif weight > old_weight:
+            self._repair_tree_edge(u, v)
+
+    def remove_edge(self, u: str, v: str) -> None:
+        # delete edge (u, v), then repair the tree if it used the edge
+        self._sync()
+        self.graph.remove_edge(u, v)
+        self._version = self.graph.version
+        self.last_update_touched = 0
+
+        del self._in_edges[v][u]
+        if not self.graph.directed and u != v:
+            del self._in_edges[u][v]
+
+        self._repair_tree_edge(u, v)
+
+    def shortest_path(self, target: str) -> Optional[List[str]]:
+        self._sync()
+        return get_shortest_path(self.source, target, self._previous)
+
+    def _sync(self) -> None:
+        # rebuild if the graph was mutated behind our back
+        if self.graph.version != self._version:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._distance, self._previous, _ = dijkstra(
+            self.graph, self.source, self.fringe_type, record_history=False)
+        self._version = self.graph.version
+
+        # children of each vertex in the shortest-path tree
+        self._children: Dict[str, Set[str]] = defaultdict(set)
+        for vertex, parent in self._previous.items():
+            if parent is not None:
+                self._children[parent].add(vertex)
+
+        # in-neighbors with weights, needed to re-seed a reset subtree
+        self._in_edges: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for a, b, weight in self.graph.get_edges():
+            self._in_edges[b][a] = weight
+            if not self.graph.directed:
+                self._in_edges[a][b] = weight
+
+    def _set_parent(self, vertex: str, distance: float, parent: Optional[str]) -> None:
+        old_parent = self._previous[vertex]
+        if old_parent is not None:
+            self._children[old_parent].discard(vertex)
+        if parent is not None:
+            self._children[parent].add(vertex)
+        self._distance[vertex] = distance
+        self._previous[vertex] = parent
+        self.last_update_touched += 1
+
+    def _seed_edge(self, u: str, v: str, weight: float) -> BinaryHeap:
+        # endpoints that the new or cheaper edge brings closer to the source
+        fringe = BinaryHeap()
+        pairs = [(u, v)] if self.graph.directed else [(u, v), (v, u)]
+        for a, b in pairs:
+            alt_distance = self._distance[a] + weight
+            if alt_distance < self._distance[b]:
+                self._set_parent(b, alt_distance, a)
+                fringe.insert(b, alt_distance)
+        return fringe
+
+    def _propagate(self, fringe: BinaryHeap) -> None:
+        # Dijkstra from the seeded vertices; only vertices whose distance
+        # actually decreases are ever pushed, so work is local to the change
+        while not fringe.is_empty():
+            current, current_dist = fringe.extract_min()
+            for neighbor, weight in self.graph.get_neighbors(current).items():
+                alt_distance = current_dist + weight
+                if alt_distance < self._distance[neighbor]:
+                    self._set_parent(neighbor, alt_distance, current)
+                    fringe.insert(neighbor, alt_distance)
+
+    def _repair_tree_edge(self, u: str, v: str) -> None:
+        # the edge got longer or vanished; only matters if the tree used it
+        if self._previous.get(v) == u:
+            self._recompute_subtree(v)
+        elif not self.graph.directed and self._previous.get(u) == v:
+            self._recompute_subtree(u)
+
+    def _recompute_subtree(self, root: str) -> None:
+        # Step 1: collect and reset every vertex below the changed edge
+        affected = [root]
+        for vertex in affected:
+            affected.extend(self._children[vertex])
+        affected_set = set(affected)
+        for vertex in affected:
+            self._set_parent(vertex, float('inf'), None)
+
+        # Step 2: seed each reset vertex from its best unaffected in-neighbor
+        fringe = BinaryHeap()
+        for vertex in affected:
+            best_distance = float('inf')
+            best_parent = None
+            for neighbor, weight in self._in_edges[vertex].items():
+                if neighbor not in affected_set and self._distance[neighbor] + weight < best_distance:
+                    best_distance = self._distance[neighbor] + weight
+                    best_parent = neighbor
+            if best_parent is not None:
+                self._set_parent(vertex, best_distance, best_parent)
+                fringe.insert(vertex, best_distance)
+
+        # Step 3: settle the subtree; unaffected distances cannot improve
+        self._propagate(fringe)
+
+
+class IncrementalMST:
+    # minimum spanning forest kept up to date as edges are inserted
+    # the forest lives in a link-cut tree where every tree edge is its own
+    # node carrying the edge weight, so the heaviest edge on the tree path
+    # between two vertices is one O(log V) query. A new edge either joins two
+    # trees or replaces that heaviest edge if it is cheaper (cycle property).
+    # Seeded with Prim's algorithm over every component. All mutations must
+    # go through add_edge; other changes to the graph trigger a rebuild.
+
+    def __init__(self, graph: Graph, fringe_type: str = 'heap'):
+        if graph.directed:
+            raise ValueError("Minimum spanning trees require an undirected graph")
+        self.graph = graph
+        self.fringe_type = fringe_type
+        self._rebuild()
+
+    @property
+    def total_weight(self) -> float:
+        # O(1): maintained on every update (rebuilt after outside changes)
+        self._sync()
+        return self._total_weight
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        self._sync()
+        return [(u, v, self._tree.value(node)) for (u, v), node in self._edge_nodes.items()]
+
+    def num_components(self) -> int:
+        self._sync()
+        return self._num_components
+
+    def add_edge(self, u: str, v: str, weight: float) -> None:
+        # insert edge (u, v), or change its weight, and update the forest
+        self._sync()
+        old_weight = self.graph.get_weight(u, v)
+        self.graph.add_edge(u, v, weight)
+        self._version = self.graph.version
+
+        if u == v:
+            return  # self-loops never belong to a spanning forest
+        key = (u, v) if u < v else (v, u)
+
+        if key in self._edge_nodes:
+            if weight <= old_weight:
+                # a cheaper tree edge stays in the tree
+                self._total_weight += weight - old_weight
+                self._tree.set_value(self._edge_nodes[key], weight)
+                return
+            # a heavier tree edge may need a replacement from the non-tree
+            # edges; insertion-only maintenance cannot find it cheaply
+            self._rebuild()
+            return
+
+        x = self._vertex_node(u)
+        y = self._vertex_node(v)
+
+        # Step 1: different trees - the edge joins them
+        if not self._tree.connected(x, y):
+            self._attach(key, weight)
+            self._num_components -= 1
+            return
+
+        # Step 2: same tree - swap out the heaviest edge on the cycle
+        heaviest = self._tree.path_max(x, y)
+        heaviest_weight = self._tree.value(heaviest)
+        if heaviest_weight > weight:
+            self._detach(self._node_edges[heaviest])
+            self._attach(key, weight)
+
+    def _sync(self) -> None:
+        if self.graph.version != self._version:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        component_edges, component_weights, _ = minimum_spanning_forest(
+            self.graph, self.fringe_type, record_history=False)
+
+        self._tree = LinkCutTree()
+        self._vertex_nodes: Dict[str, int] = {}
+        self._edge_nodes: Dict[Tuple[str, str], int] = {}
+        self._node_edges: Dict[int, Tuple[str, str]] = {}
+        self._free_nodes: List[int] = []
+        self._total_weight = 0.0
+        self._num_components = 0
+
+        for vertex in self.graph.get_vertices():
+            self._vertex_node(vertex)
+        for edges in component_edges:
+            for u, v, weight in edges:
+                self._attach((u, v) if u < v else (v, u), weight)
+
+        self._num_components = len(component_edges)
+        self._version = self.graph.version
+
+    def _vertex_node(self, vertex: str) -> int:
+        # vertices carry -inf so path maxima always land on edge nodes
+        if vertex not in self._vertex_nodes:
+            self._vertex_nodes[vertex] = self._tree.add_node()
+            self._num_components += 1
+        return self._vertex_nodes[vertex]
+
+    def _attach(self, key: Tuple[str, str], weight: float) -> None:
+        # add tree edge as node: u - edge - v
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            self._tree.set_value(node, weight)
+        else:
+            node = self._tree.add_node(weight)
+        self._edge_nodes[key] = node
+        self._node_edges[node] = key
+        self._tree.link(node, self._vertex_nodes[key[0]])
+        self._tree.link(node, self._vertex_nodes[key[1]])
+        self._total_weight += weight
+
+    def _detach(self, key: Tuple[str, str]) -> None:
+        node = self._edge_nodes.pop(key)
+        del self._node_edges[node]
+        self._tree.cut(node, self._vertex_nodes[key[0]])
+        self._tree.cut(node, self._vertex_nodes[key[1]])
+        self._total_weight -= self._tree.value(node)
+        self._free_nodes.append(node)
@@ -0,0 +1,215 @@
+from typing import Dict, List, Tuple, Any
+from collections import OrderedDict
+import os
+import numpy as np
+from src.graph import CSRGraph
+from src.algorithms import make_fringe
+from src.results import ShortestPathResult, id_array, float_array, id_dtype
+
+# files of an on-disk blocked CSR graph directory
+_FILES = ('vertices', 'indptr', 'indices', 'weights', 'info')
+
+
+class _Block:
+    # adjacency of vertices [start, start + len(indptr) - 1) copied into RAM
+    # indptr is rebased so the block's rows start at 0
+
+    __slots__ = ('start', 'indptr', 'indices', 'weights')
+
+    def __init__(self, start: int, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.start = start
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+
+def write_blocked_csr(
+    path: str,
+    vertices: List[str],
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    block_size: int = 4096,
+    directed: bool = False
+) -> None:
+    # write a CSR graph as a directory of .npy files that BlockedCSRGraph
+    # memory-maps; the arrays may themselves be memory-mapped, so a graph
+    # can be converted without ever holding its adjacency in RAM
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    if len(indptr) != len(vertices) + 1:
+        raise ValueError("indptr must have one entry per vertex plus one")
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, 'vertices.npy'), np.asarray(vertices, dtype=str), allow_pickle=False)
+    np.save(os.path.join(path, 'indptr.npy'), np.asarray(indptr, dtype=np.int64), allow_pickle=False)
+    # neighbor ids are int32 unless the vertex count needs int64
+    np.save(os.path.join(path, 'indices.npy'), np.asarray(indices, dtype=id_dtype(len(vertices))),
+            allow_pickle=False)
+    np.save(os.path.join(path, 'weights.npy'), np.asarray(weights, dtype=np.float64), allow_pickle=False)
+    np.save(os.path.join(path, 'info.npy'), np.array([block_size, int(directed)], dtype=np.int64))
+
+
+class BlockedCSRGraph:
+    # read-only CSR graph kept on disk and paged in by vertex blocks
+    # block b holds the adjacency rows of vertices [b * block_size,
+    # (b + 1) * block_size). Blocks are copied out of the memory-mapped
+    # files on first use and kept in an LRU cache whose total size stays
+    # under memory_limit bytes; vertex labels and indptr stay resident
+    # (labels in RAM, indptr memory-mapped) since searches need O(V) state
+    # anyway.
+
+    def __init__(self, path: str, memory_limit: int = 64 * 1024 * 1024):
+        if memory_limit <= 0:
+            raise ValueError("memory_limit must be positive")
+        for name in _FILES:
+            if not os.path.exists(os.path.join(path, name + '.npy')):
+                raise FileNotFoundError(f"Missing {name}.npy in {path}")
+
+        self.path = path
+        self.memory_limit = memory_limit
+        self.vertices: List[str] = np.load(os.path.join(path, 'vertices.npy')).tolist()
+        self.index: Dict[str, int] = {v: i for i, v in enumerate(self.vertices)}
+        self.indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode='r')
+        self._indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode='r')
+        self._weights = np.load(os.path.join(path, 'weights.npy'), mmap_mode='r')
+        block_size, directed = np.load(os.path.join(path, 'info.npy')).tolist()
+        self.block_size = block_size
+        self.directed = bool(directed)
+
+        # Step 1: every block must fit under the cap on its own
+        n = len(self.vertices)
+        bounds = np.append(np.asarray(self.indptr[:n:block_size]), self.indptr[n])
+        entries = np.diff(bounds)
+        rows = np.minimum(block_size, n - np.arange(len(entries)) * block_size)
+        entry_bytes = self._indices.itemsize + self._weights.itemsize
+        largest = int(((rows + 1) * 8 + entries * entry_bytes).max()) if len(entries) else 0
+        if largest > memory_limit:
+            raise ValueError(f"memory_limit {memory_limit} is smaller than the largest block ({largest} bytes)")
+
+        self._blocks: 'OrderedDict[int, _Block]' = OrderedDict()
+        self._resident = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_read = 0
+
+    @classmethod
+    def from_csr(
+        cls,
+        csr: CSRGraph,
+        path: str,
+        block_size: int = 4096,
+        memory_limit: int = 64 * 1024 * 1024
+    ) -> 'BlockedCSRGraph':
+        write_blocked_csr(path, csr.vertices, csr.indptr, csr.indices, csr.weights, block_size, csr.directed)
+        return cls(path, memory_limit)
+
+    def neighbors(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        # (neighbor ids, edge weights) of vertex id i from its resident block
+        block = self._block(i // self.block_size)
+        row = i - block.start
+        lo = block.indptr[row]
+        hi = block.indptr[row + 1]
+        return block.indices[lo:hi], block.weights[lo:hi]
+
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    def num_edges(self) -> int:
+        return len(self._indices)
+
+    def num_blocks(self) -> int:
+        return -(-len(self.vertices) // self.block_size)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            'blocks_read': self._misses,
+            'bytes_read': self._bytes_read,
+            'hits': self._hits,
+            'hit_ratio': self._hits / lookups if lookups else 0.0,
+            'evictions': self._evictions,
+            'resident_blocks': len(self._blocks),
+            'resident_bytes': self._resident
+        }
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_read = 0
+
+    def _block(self, b: int) -> _Block:
+        block = self._blocks.get(b)
+        if block is not None:
+            self._hits += 1
+            self._blocks.move_to_end(b)
+            return block
+
+        # Step 1: read the block's rows out of the mapped files
+        self._misses += 1
+        start = b * self.block_size
+        stop = min(start + self.block_size, len(self.vertices))
+        indptr = np.array(self.indptr[start:stop + 1])
+        lo = indptr[0]
+        hi = indptr[-1]
+        block = _Block(start, indptr - lo, np.array(self._indices[lo:hi]), np.array(self._weights[lo:hi]))
+        self._bytes_read += block.nbytes()
+
+        # Step 2: evict least recently used blocks until it fits
+        while self._blocks and self._resident + block.nbytes() > self.memory_limit:
+            _, evicted = self._blocks.popitem(last=False)
+            self._resident -= evicted.nbytes()
+            self._evictions += 1
+
+        self._blocks[b] = block
+        self._resident += block.nbytes()
+        return block
+
+    def __repr__(self) -> str:
+        return f"BlockedCSRGraph(vertices={self.num_vertices()}, blocks={self.num_blocks()}, memory_limit={self.memory_limit})"
+
+
+def external_dijkstra(
+    graph: BlockedCSRGraph,
+    source: str,
+    fringe_type: str = 'heap'
+) -> ShortestPathResult:
+    # Dijkstra over an on-disk BlockedCSRGraph; same distances as dijkstra
+    # on the in-memory graph, with only a bounded set of adjacency blocks
+    # resident. Block I/O is reported by graph.stats().
+    if source not in graph.index:
+        raise ValueError(f"Source vertex '{source}' not in graph")
+
+    n = graph.num_vertices()
+    s = graph.index[source]
+    fringe = make_fringe(fringe_type, range(n))
+
+    distance = float_array(n)
+    distance[s] = 0.0
+    previous = id_array(n)
+    visited = bytearray(n)
+
+    fringe.insert(s, 0.0)
+
+    while not fringe.is_empty():
+        current, current_dist = fringe.extract_min()
+        if visited[current]:
+            continue
+        visited[current] = 1
+
+        neighbors, weights = graph.neighbors(current)
+        for neighbor, weight in zip(neighbors.tolist(), weights.tolist()):
+            if not visited[neighbor]:
+                alt_distance = current_dist + weight
+                if alt_distance < distance[neighbor]:
+                    distance[neighbor] = alt_distance
+                    previous[neighbor] = current
+                    fringe.insert(neighbor, alt_distance)
+
+    return ShortestPathResult(graph.vertices, graph.index, source, distance, previous)
@@ -1,6 +1,9 @@
-from typing import Any, Optional, List, Tuple
+from typing import Any, Optional, List, Tuple, Mapping, Sequence, Union
 from abc import ABC, abstractmethod
 
+# tie-break rank per key: a dict for vertex names, a range for integer ids
+TieOrder = Union[Mapping[Any, int], Sequence[int]]
+
 class PriorityQueue(ABC):
     # abstract base class for priority queues
     # defines the interface all implementations must follow
@@ -29,10 +32,40 @@ class PriorityQueue(ABC):
 class BinaryHeap(PriorityQueue):
     # min-heap using array-based binary tree
     # supports O(log n) insert, extract_min, and decrease_key
+    # equal priorities leave in order of order[key] (in insertion order
+    # when order is None), so results do not depend on the heap's shape
 
-    def __init__(self):
+    def __init__(self, order: Optional[TieOrder] = None):
         self._heap: List[Tuple[Any, float]] = []  # stores (key, priority) pairs
         self._position: dict[Any, int] = {}  # maps keys to heap positions
+        # without an order, keys are ranked as they are inserted
+        self._order: TieOrder = order if order is not None else {}
+        self._ranks_insertions = order is None
+        self._inserted = 0
+
+    @classmethod
+    def from_items(
+        cls,
+        items: List[Tuple[Any, float]],
+        order: Optional[TieOrder] = None
+    ) -> 'BinaryHeap':
+        # build a heap from distinct (key, priority) pairs with bottom-up
+        # heapify, O(n) instead of n inserts
+        heap = cls(order)
+        heap._heap = list(items)
+        heap._position = {key: i for i, (key, _) in enumerate(heap._heap)}
+        if len(heap._position) != len(heap._heap):
+            raise ValueError("Duplicate keys in heap items")
+        if heap._ranks_insertions:
+            heap._order = dict(heap._position)
+            heap._inserted = len(heap._heap)
+        for index in range(len(heap._heap) // 2 - 1, -1, -1):
+            heap._bubble_down(index)
+        return heap
+
+    def items(self) -> List[Tuple[Any, float]]:
+        # current (key, priority) pairs in heap order
+        return list(self._heap)
 
     def insert(self, key: Any, priority: float) -> None:
         # insert element with given priority
@@ -42,6 +75,9 @@ class BinaryHeap(PriorityQueue):
             if priority < current_priority:
                 self.decrease_key(key, priority)
         else:
+            if self._ranks_insertions:
+                self._order[key] = self._inserted
+                self._inserted += 1
             self._heap.append((key, priority))
             index = len(self._heap) - 1
             self._position[key] = index
@@ -64,6 +100,8 @@ class BinaryHeap(PriorityQueue):
         else:
             self._heap.pop()
 
+        if self._ranks_insertions:
+            del self._order[min_element[0]]
         return min_element
 
     def decrease_key(self, key: Any, new_priority: float) -> None:
@@ -88,9 +126,13 @@ class BinaryHeap(PriorityQueue):
 
     def _bubble_up(self, index: int) -> None:
         # restore heap property by moving element upward
+        heap = self._heap
+        key, priority = heap[index]
         while index > 0:
             parent_index = (index - 1) // 2
-            if self._heap[index][1] < self._heap[parent_index][1]:
+            parent_key, parent_priority = heap[parent_index]
+            if priority < parent_priority or (
+                    priority == parent_priority and self._tie_before(key, parent_key)):
                 self._swap(index, parent_index)
                 index = parent_index
             else:
@@ -98,21 +140,27 @@ class BinaryHeap(PriorityQueue):
 
     def _bubble_down(self, index: int) -> None:
         # restore heap property by moving element downward
-        heap_size = len(self._heap)
+        heap = self._heap
+        heap_size = len(heap)
 
         while True:
             left_child = 2 * index + 1
             right_child = 2 * index + 2
             smallest = index
+            smallest_key, smallest_priority = heap[index]
 
             # find smallest among node and its children
-            if (left_child < heap_size and
-                    self._heap[left_child][1] < self._heap[smallest][1]):
-                smallest = left_child
-
-            if (right_child < heap_size and
-                    self._heap[right_child][1] < self._heap[smallest][1]):
-                smallest = right_child
+            if left_child < heap_size:
+                key, priority = heap[left_child]
+                if priority < smallest_priority or (
+                        priority == smallest_priority and self._tie_before(key, smallest_key)):
+                    smallest, smallest_key, smallest_priority = left_child, key, priority
+
+            if right_child < heap_size:
+                key, priority = heap[right_child]
+                if priority < smallest_priority or (
+                        priority == smallest_priority and self._tie_before(key, smallest_key)):
+                    smallest = right_child
 
             # swap with smallest child if needed
             if smallest != index:
@@ -121,6 +169,10 @@ class BinaryHeap(PriorityQueue):
             else:
                 break
 
+    def _tie_before(self, a: Any, b: Any) -> bool:
+        # whether key a leaves before key b when their priorities are equal
+        return self._order[a] < self._order[b]
+
     def _swap(self, i: int, j: int) -> None:
         # swap two elements and update position map
         self._position[self._heap[i][0]] = j
@@ -139,26 +191,36 @@ class SortedLinkedList(PriorityQueue):
             self.priority = priority
             self.next = next_node
 
-    def __init__(self):
+    # equal priorities are kept in the same order as BinaryHeap's
+
+    def __init__(self, order: Optional[TieOrder] = None):
         self._head: Optional[SortedLinkedList._Node] = None
         self._size: int = 0
+        # without an order, keys are ranked as they are first inserted
+        # (a decrease keeps the rank, as in BinaryHeap)
+        self._order: TieOrder = order if order is not None else {}
+        self._ranks_insertions = order is None
+        self._inserted = 0
 
     def insert(self, key: Any, priority: float) -> None:
         # insert while maintaining sorted order (lowest priority first)
         # if key exists, remove old one first
         if self._contains(key):
             self._remove(key)
+        if self._ranks_insertions and key not in self._order:
+            self._order[key] = self._inserted
+            self._inserted += 1
 
         new_node = self._Node(key, priority)
 
         # insert at head if empty or smallest priority
-        if self._head is None or priority < self._head.priority:
+        if self._head is None or self._ahead(new_node, self._head):
             new_node.next = self._head
             self._head = new_node
         else:
             # find correct position
             current = self._head
-            while current.next is not None and current.next.priority < priority:
+            while current.next is not None and self._ahead(current.next, new_node):
                 current = current.next
 
             new_node.next = current.next
@@ -174,6 +236,8 @@ class SortedLinkedList(PriorityQueue):
         min_node = self._head
         self._head = self._head.next
         self._size -= 1
+        if self._ranks_insertions:
+            del self._order[min_node.key]
 
         return (min_node.key, min_node.priority)
 
@@ -198,6 +262,12 @@ class SortedLinkedList(PriorityQueue):
     def size(self) -> int:
         return self._size
 
+    def _ahead(self, a: '_Node', b: '_Node') -> bool:
+        # whether node a belongs ahead of node b
+        if a.priority != b.priority:
+            return a.priority < b.priority
+        return self._order[a.key] < self._order[b.key]
+
     def _contains(self, key: Any) -> bool:
         # check if key exists
         current = self._head
@@ -1,5 +1,9 @@
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Any, Callable, Mapping
 from collections import defaultdict
+from types import MappingProxyType
+import hashlib
+import numpy as np
+from src.union_find import UnionFind
 
 
 class Graph:
@@ -10,6 +14,25 @@ class Graph:
         self.directed = directed
         # adjacency list: vertex -> {neighbor: weight}
         self._adj_list: Dict[str, Dict[str, float]] = defaultdict(dict)
+        # bumped on every mutation so derived snapshots can be invalidated
+        self._version = 0
+        # snapshot name -> (version it was built at, value)
+        self._snapshots: Dict[str, Tuple[int, Any]] = {}
+        # interned vertex ids (insertion order) and connected components,
+        # kept incrementally by add_edge; edge removal forces a lazy rebuild
+        self._vertex_ids: Dict[str, int] = {}
+        self._components = UnionFind()
+        self._components_stale = False
+
+    @property
+    def version(self) -> int:
+        # mutation counter, changes whenever a vertex or edge is added or removed
+        return self._version
+
+    def vertex_order(self) -> Mapping[str, int]:
+        # vertex -> insertion rank, the order every snapshot lists vertices in
+        # (a read-only live view, so it follows later additions)
+        return MappingProxyType(self._vertex_ids)
 
     def add_vertex(self, vertex: str) -> None:
         # add a vertex to the graph
@@ -17,6 +40,8 @@ class Graph:
             raise ValueError("Vertex identifier cannot be None or empty")
         if vertex not in self._adj_list:
             self._adj_list[vertex] = {}
+            self._vertex_ids[vertex] = self._components.add()
+            self._version += 1
 
     def add_edge(self, u: str, v: str, weight: float) -> None:
         # add weighted edge between u and v
@@ -36,6 +61,24 @@ class Graph:
         if not self.directed:
             self._adj_list[v][u] = weight
 
+        if not self._components_stale:
+            self._components.union(self._vertex_ids[u], self._vertex_ids[v])
+        self._version += 1
+
+    def remove_edge(self, u: str, v: str) -> None:
+        # remove edge (u, v), and (v, u) for undirected graphs
+        if not self.has_edge(u, v):
+            raise ValueError(f"Edge ({u}, {v}) not in graph")
+
+        del self._adj_list[u][v]
+        # an undirected self-loop is stored once
+        if not self.directed and u != v:
+            del self._adj_list[v][u]
+
+        # union-find cannot split a set, rebuild on the next query
+        self._components_stale = True
+        self._version += 1
+
     def get_neighbors(self, vertex: str) -> Dict[str, float]:
         # return neighbors of a vertex with edge weights
         if vertex not in self._adj_list:
@@ -69,6 +112,188 @@ class Graph:
                         seen_edges.add(edge)
         return edges
 
+    def _snapshot(self, name: str, build: Callable[[], Any]) -> Any:
+        # return a derived representation, rebuilding it only after mutation
+        cached = self._snapshots.get(name)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        value = build()
+        self._snapshots[name] = (self._version, value)
+        return value
+
+    def same_component(self, u: str, v: str) -> bool:
+        # O(a(n)) check whether u and v are connected, ignoring direction
+        # for directed graphs False proves v is unreachable from u, but True
+        # does not prove it is reachable (see strongly_connected)
+        if u not in self._vertex_ids or v not in self._vertex_ids:
+            return False
+        components = self._component_index()
+        return components.connected(self._vertex_ids[u], self._vertex_ids[v])
+
+    def num_components(self) -> int:
+        # number of (weakly) connected components
+        return self._component_index().num_sets()
+
+    def strongly_connected(self, u: str, v: str) -> bool:
+        # whether u and v reach each other; strongly connected components
+        # of directed graphs are recomputed lazily after each mutation
+        if not self.directed:
+            return self.same_component(u, v)
+        if u not in self._vertex_ids or v not in self._vertex_ids:
+            return False
+        scc = self._snapshot('scc', self._build_scc)
+        return scc[u] == scc[v]
+
+    def _component_index(self) -> UnionFind:
+        if self._components_stale:
+            components = UnionFind(len(self._vertex_ids))
+            for u, neighbors in self._adj_list.items():
+                for v in neighbors:
+                    components.union(self._vertex_ids[u], self._vertex_ids[v])
+            self._components = components
+            self._components_stale = False
+        return self._components
+
+    def _build_scc(self) -> Dict[str, int]:
+        # iterative Tarjan's algorithm: vertex -> component id
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        component: Dict[str, int] = {}
+        counter = 0
+
+        for root in self._adj_list:
+            if root in index:
+                continue
+            # frames of (vertex, iterator over its neighbors)
+            work = [(root, iter(self._adj_list[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                vertex, neighbors = work[-1]
+                advanced = False
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self._adj_list[neighbor])))
+                        advanced = True
+                        break
+                    elif neighbor in on_stack:
+                        lowlink[vertex] = min(lowlink[vertex], index[neighbor])
+                if advanced:
+                    continue
+
+                # vertex is finished: pop its component if it is a root
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[vertex])
+                if lowlink[vertex] == index[vertex]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = index[vertex]
+                        if member == vertex:
+                            break
+
+        return component
+
+    def to_edge_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        # flat edge array for array-based algorithms
+        # returns (vertices, sources, targets, weights) where sources and targets
+        # index into vertices; undirected edges appear once and sources are sorted
+        # the arrays are cached until the next mutation and must not be modified
+        return self._snapshot('edge_arrays', self._build_edge_arrays)
+
+    def _build_edge_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        csr = self.to_csr()
+        sources = np.repeat(np.arange(csr.num_vertices(), dtype=np.int64), np.diff(csr.indptr))
+        targets = csr.indices
+        weights = csr.weights
+
+        # undirected edges are stored twice, keep the (low, high) copy
+        if not self.directed:
+            keep = sources <= targets
+            sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+        for array in (sources, targets, weights):
+            array.setflags(write=False)
+        return csr.vertices, sources, targets, weights
+
+    def topology_fingerprint(self) -> str:
+        # hex digest of the vertex set and the (undirected) edge set; equal
+        # for graphs with the same topology whatever their insertion order,
+        # direction or weights. Cached until the next mutation.
+        return self._snapshot('topology_fingerprint', self._build_topology_fingerprint)
+
+    def _build_topology_fingerprint(self) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for vertex in sorted(self._adj_list):
+            digest.update(vertex.encode() + b'\0')
+        digest.update(b'\1')
+        edges = sorted({(u, v) if u <= v else (v, u) for u, v, _ in self.get_edges()})
+        for u, v in edges:
+            digest.update(u.encode() + b'\0' + v.encode() + b'\0')
+        return digest.hexdigest()
+
+    def to_csr(self) -> 'CSRGraph':
+        # compressed sparse row snapshot, cached until the next mutation
+        return self._snapshot('csr', self._build_csr)
+
+    def _build_csr(self) -> 'CSRGraph':
+        vertices = list(self._adj_list.keys())
+        index = {v: i for i, v in enumerate(vertices)}
+
+        degrees = []
+        targets = []
+        weights = []
+        for u in vertices:
+            neighbors = self._adj_list[u]
+            degrees.append(len(neighbors))
+            targets.extend(map(index.__getitem__, neighbors.keys()))
+            weights.extend(neighbors.values())
+
+        indptr = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        return CSRGraph(
+            vertices,
+            indptr,
+            np.array(targets, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            self.directed
+        )
+
+    def to_matrix(self) -> Tuple[List[str], np.ndarray]:
+        # dense weight matrix for array-scan algorithms on near-complete graphs
+        # returns (vertices, matrix) where matrix[i, j] is the weight of edge
+        # (vertices[i], vertices[j]) and inf where there is no edge
+        # the matrix is cached until the next mutation and must not be modified
+        return self._snapshot('matrix', self._build_matrix)
+
+    def _build_matrix(self) -> Tuple[List[str], np.ndarray]:
+        vertices, sources, targets, weights = self.to_edge_arrays()
+        matrix = np.full((len(vertices), len(vertices)), np.inf)
+        matrix[sources, targets] = weights
+        if not self.directed:
+            matrix[targets, sources] = weights
+        matrix.setflags(write=False)
+        return vertices, matrix
+
+    def density(self) -> float:
+        # fraction of possible edges present (0.0 for fewer than 2 vertices)
+        n = self.num_vertices()
+        if n < 2:
+            return 0.0
+        possible = n * (n - 1) if self.directed else n * (n - 1) // 2
+        return self.num_edges() / possible
+
     def has_vertex(self, vertex: str) -> bool:
         # check if vertex exists
         return vertex in self._adj_list
@@ -105,3 +330,46 @@ class Graph:
 
     def __repr__(self) -> str:
         return f"Graph(directed={self.directed}, vertices={self.num_vertices()}, edges={self.num_edges()})"
+
+
+class CSRGraph:
+    # frozen compressed sparse row view of a Graph
+    # vertex i's neighbors are indices[indptr[i]:indptr[i + 1]] with the
+    # matching edge weights in weights; undirected edges appear in both rows
+
+    def __init__(
+        self,
+        vertices: List[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        directed: bool = False
+    ):
+        self.vertices = vertices
+        self.index: Dict[str, int] = {v: i for i, v in enumerate(vertices)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+
+        for array in (self.indptr, self.indices, self.weights):
+            array.setflags(write=False)
+
+    def neighbors(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        # (neighbor ids, edge weights) of vertex id i, as array views
+        lo = self.indptr[i]
+        hi = self.indptr[i + 1]
+        return self.indices[lo:hi], self.weights[lo:hi]
+
+    def degree(self, i: int) -> int:
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    def num_edges(self) -> int:
+        # number of stored (directed) adjacency entries
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(directed={self.directed}, vertices={self.num_vertices()}, entries={self.num_edges()})"
@@ -0,0 +1,164 @@
+from typing import List
+
+
+class LinkCutTree:
+    # dynamic forest of rooted trees (Sleator-Tarjan link-cut tree)
+    # each node carries a value; link, cut and path-maximum queries run in
+    # O(log n) amortized. Preferred paths are kept in splay trees, with a
+    # lazy reversal flag so any node can be made the root (evert).
+
+    def __init__(self):
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._parent: List[int] = []  # splay parent or path-parent pointer
+        self._reversed: List[bool] = []
+        self._value: List[float] = []
+        self._max: List[int] = []  # node with the largest value in splay subtree
+
+    def add_node(self, value: float = float('-inf')) -> int:
+        # create an isolated node and return its id
+        node = len(self._value)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(-1)
+        self._reversed.append(False)
+        self._value.append(value)
+        self._max.append(node)
+        return node
+
+    def value(self, x: int) -> float:
+        return self._value[x]
+
+    def set_value(self, x: int, value: float) -> None:
+        # x becomes the root of its splay tree so only x needs updating
+        self._access(x)
+        self._value[x] = value
+        self._update(x)
+
+    def connected(self, x: int, y: int) -> bool:
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def find_root(self, x: int) -> int:
+        # root of the represented tree containing x
+        self._access(x)
+        while True:
+            self._push(x)
+            if self._left[x] == -1:
+                break
+            x = self._left[x]
+        self._splay(x)
+        return x
+
+    def link(self, x: int, y: int) -> None:
+        # add tree edge x - y; x and y must be in different trees
+        if self.connected(x, y):
+            raise ValueError(f"Nodes {x} and {y} are already connected")
+        self._make_root(x)
+        self._parent[x] = y
+
+    def cut(self, x: int, y: int) -> None:
+        # remove tree edge x - y
+        self._make_root(x)
+        self._access(y)
+        # with x as root and y accessed, x is y's predecessor on the path
+        if self._left[y] == x:
+            self._push(x)
+        if self._left[y] != x or self._right[x] != -1:
+            raise ValueError(f"Nodes {x} and {y} are not adjacent")
+        self._left[y] = -1
+        self._parent[x] = -1
+        self._update(y)
+
+    def path_max(self, x: int, y: int) -> int:
+        # node with the largest value on the tree path x .. y
+        if not self.connected(x, y):
+            raise ValueError(f"Nodes {x} and {y} are not connected")
+        self._make_root(x)
+        self._access(y)
+        return self._max[y]
+
+    def size(self) -> int:
+        return len(self._value)
+
+    def _is_splay_root(self, x: int) -> bool:
+        p = self._parent[x]
+        return p == -1 or (self._left[p] != x and self._right[p] != x)
+
+    def _push(self, x: int) -> None:
+        # propagate a pending reversal one level down
+        if self._reversed[x]:
+            self._left[x], self._right[x] = self._right[x], self._left[x]
+            for child in (self._left[x], self._right[x]):
+                if child != -1:
+                    self._reversed[child] = not self._reversed[child]
+            self._reversed[x] = False
+
+    def _update(self, x: int) -> None:
+        best = x
+        for child in (self._left[x], self._right[x]):
+            if child != -1 and self._value[self._max[child]] > self._value[best]:
+                best = self._max[child]
+        self._max[x] = best
+
+    def _rotate(self, x: int) -> None:
+        p = self._parent[x]
+        g = self._parent[p]
+        if not self._is_splay_root(p):
+            if self._left[g] == p:
+                self._left[g] = x
+            else:
+                self._right[g] = x
+        self._parent[x] = g
+
+        if self._left[p] == x:
+            self._left[p] = self._right[x]
+            if self._right[x] != -1:
+                self._parent[self._right[x]] = p
+            self._right[x] = p
+        else:
+            self._right[p] = self._left[x]
+            if self._left[x] != -1:
+                self._parent[self._left[x]] = p
+            self._left[x] = p
+        self._parent[p] = x
+
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x: int) -> None:
+        # push pending reversals from the splay root down to x first
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self._parent[path[-1]])
+        for node in reversed(path):
+            self._push(node)
+
+        while not self._is_splay_root(x):
+            p = self._parent[x]
+            if not self._is_splay_root(p):
+                g = self._parent[p]
+                # zig-zig rotates the parent first, zig-zag rotates x twice
+                if (self._left[g] == p) == (self._left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x: int) -> None:
+        # make the root-to-x path preferred and splay x to its top
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self._right[y] = last
+            self._update(y)
+            last = y
+            y = self._parent[y]
+        self._splay(x)
+
+    def _make_root(self, x: int) -> None:
+        self._access(x)
+        self._reversed[x] = not self._reversed[x]
+
+    def __str__(self) -> str:
+        return f"LinkCutTree(size={self.size()})"
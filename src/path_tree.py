@@ -0,0 +1,152 @@
+from typing import Dict, List, Optional, Iterable
+import numpy as np
+
+
+class ShortestPathTree:
+    # compact shortest-path tree: predecessors as an int array (-1 for the
+    # source and unreachable vertices) over a fixed vertex order, plus the
+    # distances. Extracts many paths at once, reusing prefixes shared with
+    # previously extracted paths, and round-trips through a single .npy file.
+
+    def __init__(
+        self,
+        vertices: List[str],
+        predecessors: np.ndarray,
+        distances: np.ndarray,
+        source: str
+    ):
+        self.vertices = vertices
+        self.index: Dict[str, int] = {v: i for i, v in enumerate(vertices)}
+        self.predecessors = predecessors
+        self.distances = distances
+        self.source = source
+        self._depth: Optional[np.ndarray] = None
+        self._subtree_size: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_dijkstra(
+        cls,
+        source: str,
+        distance: Dict[str, float],
+        previous: Dict[str, Optional[str]]
+    ) -> 'ShortestPathTree':
+        # build from the (distance, previous) dicts returned by dijkstra
+        vertices = list(previous.keys())
+        index = {v: i for i, v in enumerate(vertices)}
+        predecessors = np.fromiter(
+            (-1 if previous[v] is None else index[previous[v]] for v in vertices),
+            dtype=np.int64, count=len(vertices)
+        )
+        distances = np.fromiter((distance[v] for v in vertices),
+                                dtype=np.float64, count=len(vertices))
+        return cls(vertices, predecessors, distances, source)
+
+    def path(self, target: str) -> Optional[List[str]]:
+        # same result as get_shortest_path(source, target, previous)
+        return self.paths([target])[target]
+
+    def paths(self, targets: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        # shortest paths to many targets (None if unreachable)
+        # targets are handled shallowest first and each path's id list is
+        # cached, so a deeper target only walks up to the nearest cached
+        # ancestor; its path is a copy of that prefix plus the walk, so the
+        # walk is saved but every path still holds its own list
+        targets = list(targets)
+        depth = self.depth()
+        source_id = self.index[self.source]
+        cached: Dict[int, List[int]] = {source_id: [source_id]}
+        result: Dict[str, Optional[List[str]]] = {}
+
+        ids = [self.index.get(t, -1) for t in targets]
+        order = sorted(range(len(targets)), key=lambda i: depth[ids[i]] if ids[i] >= 0 else -1)
+
+        predecessors = self.predecessors
+        for i in order:
+            target, node = targets[i], ids[i]
+            if node < 0 or depth[node] < 0:
+                result[target] = None
+                continue
+
+            # Step 1: walk up until a cached path (at worst the source's)
+            segment = []
+            while node not in cached:
+                segment.append(node)
+                node = int(predecessors[node])
+
+            # Step 2: prefix + reversed segment
+            path_ids = cached[node] + segment[::-1]
+            cached[ids[i]] = path_ids
+            result[target] = [self.vertices[j] for j in path_ids]
+
+        return result
+
+    def depth(self) -> np.ndarray:
+        # number of edges from the source, -1 for unreachable vertices
+        if self._depth is None:
+            self._depth = self._compute_depth()
+        return self._depth
+
+    def subtree_sizes(self) -> np.ndarray:
+        # number of vertices in each vertex's subtree, itself included
+        # (0 for unreachable vertices)
+        if self._subtree_size is None:
+            depth = self.depth()
+            sizes = (depth >= 0).astype(np.int64)
+            # one level at a time from the deepest, each vertex adds its
+            # size to its parent
+            order = np.argsort(depth, kind='stable')
+            levels = np.searchsorted(depth[order], np.arange(depth.max() + 2))
+            for level in range(depth.max(), 0, -1):
+                nodes = order[levels[level]:levels[level + 1]]
+                np.add.at(sizes, self.predecessors[nodes], sizes[nodes])
+            self._subtree_size = sizes
+        return self._subtree_size
+
+    def save(self, filename: str) -> None:
+        # one .npy structured array (vertex, predecessor, distance, is_source)
+        # that loads without pickle in any process
+        width = max((len(v) for v in self.vertices), default=1)
+        records = np.zeros(len(self.vertices), dtype=[
+            ('vertex', f'U{width}'),
+            ('predecessor', np.int64),
+            ('distance', np.float64),
+            ('is_source', np.bool_)
+        ])
+        records['vertex'] = self.vertices
+        records['predecessor'] = self.predecessors
+        records['distance'] = self.distances
+        records['is_source'][self.index[self.source]] = True
+        np.save(filename, records, allow_pickle=False)
+
+    @classmethod
+    def load(cls, filename: str) -> 'ShortestPathTree':
+        records = np.load(filename, allow_pickle=False)
+        vertices = records['vertex'].tolist()
+        source = vertices[int(np.flatnonzero(records['is_source'])[0])]
+        return cls(vertices, records['predecessor'].copy(), records['distance'].copy(), source)
+
+    def _compute_depth(self) -> np.ndarray:
+        # pointer jumping: after round k every vertex points 2 ** k steps up
+        # (or at a root) and knows how many edges it skipped, so
+        # ceil(log2(n)) + 1 rounds reach the root from anywhere. Roots are
+        # the source and a sentinel n standing for "no predecessor"; a
+        # predecessor cycle never reaches either and ends up at -1.
+        n = len(self.vertices)
+        source = self.index[self.source]
+        up = np.append(np.asarray(self.predecessors, dtype=np.int64), n)
+        up[up < 0] = n
+        up[source] = source
+        up[n] = n
+        skipped = np.ones(n + 1, dtype=np.int64)
+        skipped[[source, n]] = 0
+
+        for _ in range(int(np.ceil(np.log2(n + 1))) + 1):
+            skipped += skipped[up]
+            up = up[up]
+        return np.where(up[:n] == source, skipped[:n], -1)
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def __repr__(self) -> str:
+        return f"ShortestPathTree(source={self.source!r}, vertices={len(self.vertices)})"
@@ -0,0 +1,190 @@
+from typing import Dict, List, Optional, Any, Iterator, Union
+from collections.abc import Mapping, Sequence
+from array import array
+import numpy as np
+
+# distances/keys as array('d') or float64 arrays, vertex ids as array('i'/'q')
+# or int arrays, with -1 meaning "no vertex"
+FloatArray = Union[array, np.ndarray]
+IntArray = Union[array, np.ndarray]
+
+
+class ArrayMapping(Mapping):
+    # read-only dict view over an array indexed by interned vertex id
+    # values are decoded back to labels when labels is given (for
+    # predecessor arrays, where -1 reads as None)
+
+    __slots__ = ('_index', '_values', '_labels')
+
+    def __init__(self, index: Dict[str, int], values: Any, labels: Optional[List[str]] = None):
+        self._index = index
+        self._values = values
+        self._labels = labels
+
+    def __getitem__(self, vertex: str) -> Any:
+        value = self._values[self._index[vertex]]
+        if self._labels is None:
+            return float(value)
+        return self._labels[value] if value >= 0 else None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"ArrayMapping(size={len(self)})"
+
+
+class ShortestPathResult:
+    # single-source shortest-path result stored as two flat arrays
+    # distance and previous read like the dicts dijkstra returns, and the
+    # object unpacks as (distance, previous, step_history) so existing
+    # `distances, previous, history = dijkstra(...)` callers keep working
+
+    __slots__ = ('vertices', 'index', 'source', '_distance', '_previous', 'step_history')
+
+    def __init__(
+        self,
+        vertices: List[str],
+        index: Dict[str, int],
+        source: str,
+        distance: FloatArray,
+        previous: IntArray,
+        step_history: Optional[List[Dict[str, Any]]] = None
+    ):
+        self.vertices = vertices  # shared with the graph's CSR snapshot
+        self.index = index
+        self.source = source
+        self._distance = distance
+        self._previous = previous
+        self.step_history = step_history if step_history is not None else []
+
+    @property
+    def distance(self) -> ArrayMapping:
+        return ArrayMapping(self.index, self._distance)
+
+    @property
+    def previous(self) -> ArrayMapping:
+        return ArrayMapping(self.index, self._previous, self.vertices)
+
+    def path(self, target: str) -> Optional[List[str]]:
+        # same result as get_shortest_path(source, target, previous)
+        if target not in self.index:
+            return None
+        path = []
+        current = self.index[target]
+        while current >= 0:
+            path.append(self.vertices[current])
+            current = self._previous[current]
+        if path[-1] != self.source:
+            return None
+        path.reverse()
+        return path
+
+    def nbytes(self) -> int:
+        # memory held by this result's own arrays
+        return _nbytes(self._distance) + _nbytes(self._previous)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.distance, self.previous, self.step_history))
+
+    def __repr__(self) -> str:
+        return f"ShortestPathResult(source={self.source!r}, vertices={len(self.vertices)})"
+
+
+class MSTEdges(Sequence):
+    # read-only list view of (parent, child, weight) tuples, one per vertex
+    # that has a parent, in vertex-id order
+
+    __slots__ = ('_vertices', '_children', '_parent', '_weight')
+
+    def __init__(self, vertices: List[str], parent: IntArray, weight: FloatArray):
+        self._vertices = vertices
+        self._children = np.flatnonzero(np.asarray(parent) >= 0)
+        self._parent = parent
+        self._weight = weight
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        child = int(self._children[i])
+        return (self._vertices[self._parent[child]], self._vertices[child], float(self._weight[child]))
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MSTEdges({list(self)!r})"
+
+
+class MSTResult:
+    # minimum spanning tree stored as per-vertex parent ids and keys (the
+    # weight of the edge to the parent); edges reads like prim's edge list
+    # and the object unpacks as (edges, total_weight, step_history)
+
+    __slots__ = ('vertices', 'index', 'total_weight', '_parent', '_key', 'step_history')
+
+    def __init__(
+        self,
+        vertices: List[str],
+        index: Dict[str, int],
+        parent: IntArray,
+        key: FloatArray,
+        total_weight: float,
+        step_history: Optional[List[Dict[str, Any]]] = None
+    ):
+        self.vertices = vertices
+        self.index = index
+        self.total_weight = total_weight
+        self._parent = parent
+        self._key = key
+        self.step_history = step_history if step_history is not None else []
+
+    @property
+    def edges(self) -> MSTEdges:
+        return MSTEdges(self.vertices, self._parent, self._key)
+
+    @property
+    def parent(self) -> ArrayMapping:
+        return ArrayMapping(self.index, self._parent, self.vertices)
+
+    def nbytes(self) -> int:
+        return _nbytes(self._parent) + _nbytes(self._key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.edges, self.total_weight, self.step_history))
+
+    def __repr__(self) -> str:
+        return f"MSTResult(edges={len(self.edges)}, total_weight={self.total_weight})"
+
+
+def _nbytes(values: Any) -> int:
+    if isinstance(values, np.ndarray):
+        return values.nbytes
+    return values.itemsize * len(values)
+
+
+def id_dtype(size: int) -> np.dtype:
+    # NumPy dtype for ids of size vertices: int32 while ids fit
+    return np.dtype(np.int32 if size < 2 ** 31 else np.int64)
+
+
+def compact_ids(ids: np.ndarray) -> np.ndarray:
+    # narrow an int64 id array to int32 while ids fit
+    return ids.astype(id_dtype(len(ids)), copy=False)
+
+
+def id_array(size: int, fill: int = -1) -> array:
+    # compact vertex-id array: 4 bytes per entry while ids fit
+    return array('i' if size < 2 ** 31 else 'q', [fill]) * size
+
+
+def float_array(size: int, fill: float = float('inf')) -> array:
+    return array('d', [fill]) * size
@@ -0,0 +1,511 @@
+from typing import Dict, List, Tuple, Optional, Any, Union
+import argparse
+import json
+import math
+import os
+import signal
+import socket
+import threading
+import time
+import numpy as np
+from src.graph import Graph
+from src.algorithms import prim
+from src.cache import ShortestPathCache
+
+# Protocol: one JSON object per line in each direction.
+# request:  {"id": any, "op": <op>, ...params}
+# response: {"id": same, "ok": true, "result": ...}
+#           {"id": same, "ok": false, "error": "message"}
+# ops:
+#   ping                                  -> "pong"
+#   vertices                              -> [vertex, ...]
+#   dijkstra         source               -> {vertex: distance}
+#   path             source, target       -> {"path": [...] | null, "distance": d}
+#   prim             start (optional)     -> {"edges": [[u, v, w], ...], "total_weight": w}
+#   distance_matrix  sources, targets?    -> [[d, ...], ...] (rows follow sources)
+# Unreachable distances are sent as null, since JSON has no infinity.
+Address = Union[Tuple[str, int], str]
+
+
+def _finite(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+def load_edge_list(filename: str, directed: bool = False) -> Graph:
+    # whitespace-separated "u v weight" lines; blank lines and # comments skipped
+    graph = Graph(directed=directed)
+    with open(filename) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if len(parts) != 3:
+                raise ValueError(f"{filename}:{line_number}: expected 'u v weight'")
+            graph.add_edge(parts[0], parts[1], float(parts[2]))
+    return graph
+
+
+class QueryHandler:
+    # answers protocol requests against one graph, with a warm
+    # ShortestPathCache for single-source queries and memoized MSTs
+
+    def __init__(self, graph: Graph, cache_bytes: int = 64 * 1024 * 1024):
+        self.graph = graph
+        self.cache = ShortestPathCache(cache_bytes, fringe_type='heap')
+        self._msts: Dict[str, Dict[str, Any]] = {}
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response: Dict[str, Any] = {'id': request.get('id')}
+        try:
+            response['result'] = self._dispatch(request)
+            response['ok'] = True
+        except Exception as exc:
+            # any failure answers this request only; the worker keeps serving
+            response['ok'] = False
+            if isinstance(exc, KeyError):
+                response['error'] = f"Missing field {exc}"
+            elif isinstance(exc, (ValueError, TypeError)):
+                response['error'] = str(exc)
+            else:
+                response['error'] = f"{type(exc).__name__}: {exc}"
+        return response
+
+    def _dispatch(self, request: Dict[str, Any]) -> Any:
+        op = request.get('op')
+        if op == 'ping':
+            return 'pong'
+        if op == 'vertices':
+            return self.graph.to_csr().vertices
+        if op == 'dijkstra':
+            self._require(request['source'])
+            return {v: _finite(d) for v, d in self.cache.distances(self.graph, request['source']).items()}
+        if op == 'path':
+            self._require(request['source'])
+            self._require(request['target'])
+            path = self.cache.shortest_path(self.graph, request['source'], request['target'])
+            distance = self.cache.distance(self.graph, request['source'], request['target'])
+            return {'path': path, 'distance': _finite(distance)}
+        if op == 'prim':
+            start = request.get('start')
+            if start is None:
+                if self.graph.num_vertices() == 0:
+                    raise ValueError("Graph is empty")
+                start = self.graph.to_csr().vertices[0]
+            self._require(start)
+            if start not in self._msts:
+                edges, total_weight, _ = prim(self.graph, start, 'heap', record_history=False)
+                self._msts[start] = {'edges': [list(e) for e in edges], 'total_weight': total_weight}
+            return self._msts[start]
+        if op == 'distance_matrix':
+            sources = request['sources']
+            targets = request.get('targets', sources)
+            if not isinstance(sources, list) or not isinstance(targets, list):
+                raise ValueError("sources and targets must be lists of vertices")
+            for vertex in sources + targets:
+                self._require(vertex)
+            return [[_finite(self.cache.distance(self.graph, s, t)) for t in targets] for s in sources]
+        raise ValueError(f"Unknown op: {op}")
+
+    def _require(self, vertex: Any) -> None:
+        if not isinstance(vertex, str) or not self.graph.has_vertex(vertex):
+            raise ValueError(f"Vertex {vertex!r} not in graph")
+
+
+def _serve_connection(connection: socket.socket, handler: QueryHandler) -> None:
+    with connection, connection.makefile('rb') as reader, connection.makefile('wb') as writer:
+        for line in reader:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                response = handler.handle(request)
+            except (ValueError, RecursionError) as exc:
+                # malformed or too deeply nested JSON
+                response = {'id': None, 'ok': False, 'error': f"Bad request: {exc}"}
+            writer.write(json.dumps(response).encode() + b'\n')
+            writer.flush()
+
+
+class _Stop(Exception):
+    # raised inside the supervisor process by SIGTERM
+    pass
+
+
+def _raise_stop(signum, frame) -> None:
+    raise _Stop()
+
+
+class GraphServer:
+    # pre-forked JSON-lines server over localhost TCP or a Unix socket
+    # the graph is loaded and frozen (CSR snapshot, component index) once in
+    # the parent, then workers are forked and share it copy-on-write. Each
+    # worker accepts connections from the shared listening socket and keeps
+    # its own warm cache; a connection is served by one worker until it
+    # closes, so run at least as many workers as concurrent clients.
+    # Workers are forked by a supervisor process, itself forked once by
+    # start(). It replaces workers that exit while the server is running, and
+    # being single-threaded it can fork safely at any time, whatever threads
+    # the parent runs. It reports worker pids and respawns over a pipe.
+    # Workers that keep dying (more than MAX_RESPAWNS within RESPAWN_WINDOW
+    # seconds, e.g. at startup) stop the server with exit status 1 instead
+    # of being re-forked in a busy loop.
+
+    MAX_RESPAWNS = 10
+    RESPAWN_WINDOW = 10.0
+
+    def __init__(
+        self,
+        graph: Graph,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        unix_path: Optional[str] = None,
+        workers: int = 4,
+        cache_bytes: int = 64 * 1024 * 1024
+    ):
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self.graph = graph
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.workers = workers
+        self.cache_bytes = cache_bytes
+        self._socket: Optional[socket.socket] = None
+        self._supervisor: Optional[int] = None
+        # read end of the supervisor's report pipe, and its unparsed tail
+        self._reports: Optional[int] = None
+        self._buffer = b''
+        self._pids: List[int] = []
+        self._respawns = 0
+
+    @property
+    def address(self) -> Address:
+        if self._socket is None:
+            raise RuntimeError("Server is not running")
+        return self._socket.getsockname()
+
+    @property
+    def respawns(self) -> int:
+        # workers replaced since start()
+        self._read_reports()
+        return self._respawns
+
+    def worker_pids(self) -> List[int]:
+        self._read_reports()
+        return list(self._pids)
+
+    def start(self) -> None:
+        # Step 1: freeze the graph before forking so workers inherit it warm
+        self.graph.to_csr()
+        self.graph.num_components()
+
+        # Step 2: bind the shared listening socket
+        if self.unix_path is not None:
+            if os.path.exists(self.unix_path):
+                os.unlink(self.unix_path)
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.bind(self.unix_path)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._socket.bind((self.host, self.port))
+        self._socket.listen(128)
+
+        # Step 3: fork the supervisor, which forks the workers
+        self._reports, report = os.pipe()
+        self._supervisor = os.fork()
+        if self._supervisor == 0:
+            os.close(self._reports)
+            self._supervise(report)
+        os.close(report)
+
+        # Step 4: return once the workers are up
+        self._buffer = b''
+        self._pids = []
+        self._respawns = 0
+        while not self._pids:
+            chunk = os.read(self._reports, 4096)
+            if not chunk:
+                self.stop()
+                raise RuntimeError("Server supervisor exited during start")
+            self._parse_reports(chunk)
+        os.set_blocking(self._reports, False)
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._worker()
+        return pid
+
+    def _supervise(self, report: int) -> None:
+        # supervisor process: fork the workers, then reap any that exit and
+        # fork replacements until SIGTERM; never returns into the parent's code
+        status = 0
+        pids: List[int] = []
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            # SIGTERM is held while forking, so every forked pid is recorded
+            # before _Stop can interrupt
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+            signal.signal(signal.SIGTERM, _raise_stop)
+            pids = [self._spawn() for _ in range(self.workers)]
+            respawns = 0
+            recent: List[float] = []  # respawn times within the window
+            os.set_blocking(report, False)
+            while True:
+                try:
+                    # lines are far below PIPE_BUF, so a write is never partial
+                    # and a full pipe (a parent that stopped reading) skips it
+                    os.write(report, f"{respawns} {' '.join(map(str, pids))}\n".encode())
+                except BlockingIOError:
+                    pass
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+                pid, _ = os.wait()
+                signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+                if pid in pids:
+                    now = time.monotonic()
+                    recent = [t for t in recent if now - t < self.RESPAWN_WINDOW] + [now]
+                    if len(recent) > self.MAX_RESPAWNS:
+                        raise RuntimeError("Workers are crashing repeatedly")
+                    pids[pids.index(pid)] = self._spawn()
+                    respawns += 1
+        except _Stop:
+            pass
+        except BaseException:
+            status = 1
+        finally:
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            for pid in pids:
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass  # already reaped
+            os._exit(status)
+
+    def _worker(self) -> None:
+        # child process: never returns into the parent's code
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+            handler = QueryHandler(self.graph, self.cache_bytes)
+            while True:
+                connection, _ = self._socket.accept()
+                try:
+                    _serve_connection(connection, handler)
+                except (ConnectionError, OSError):
+                    pass  # client went away mid-request
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _read_reports(self) -> None:
+        # take in whatever the supervisor reported since the last call
+        if self._reports is None:
+            return
+        try:
+            while True:
+                chunk = os.read(self._reports, 4096)
+                if not chunk:
+                    break  # supervisor exited
+                self._parse_reports(chunk)
+        except BlockingIOError:
+            pass
+
+    def _parse_reports(self, chunk: bytes) -> None:
+        # each complete "respawns pid pid ..." line replaces the last one
+        lines = (self._buffer + chunk).split(b'\n')
+        self._buffer = lines.pop()
+        if lines:
+            values = [int(value) for value in lines[-1].split()]
+            self._respawns, self._pids = values[0], values[1:]
+
+    def wait(self) -> int:
+        # block until the server is stopped (workers are replaced meanwhile)
+        # Returns: the supervisor's exit status, nonzero if workers kept crashing
+        if self._supervisor is None:
+            return 0
+        try:
+            _, status = os.waitpid(self._supervisor, 0)
+        except ChildProcessError:
+            return 0  # reaped by stop()
+        self._supervisor = None
+        return os.waitstatus_to_exitcode(status)
+
+    def stop(self) -> None:
+        # Step 1: the supervisor terminates and reaps the workers, then exits
+        if self._supervisor is not None:
+            self._read_reports()
+            try:
+                os.kill(self._supervisor, signal.SIGTERM)
+                os.waitpid(self._supervisor, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass  # already exited and reaped
+            self._supervisor = None
+        if self._reports is not None:
+            os.close(self._reports)
+            self._reports = None
+
+        # Step 2: release the socket
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+
+    def __enter__(self) -> 'GraphServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class GraphClient:
+    # blocking client holding one connection to a GraphServer
+
+    def __init__(self, address: Address, timeout: Optional[float] = 30.0):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(address)
+        self._reader = self._socket.makefile('rb')
+        self._next_id = 0
+
+    def request(self, op: str, **params) -> Any:
+        # send one request and return its result, raising on server errors
+        self._next_id += 1
+        message = dict(params, op=op, id=self._next_id)
+        self._socket.sendall(json.dumps(message).encode() + b'\n')
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        response = json.loads(line)
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response['result']
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'GraphClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def run_load(
+    address: Address,
+    requests: List[Dict[str, Any]],
+    concurrency: int = 4
+) -> Dict[str, float]:
+    # replay requests over `concurrency` connections (round-robin split)
+    # and report throughput and exact latency percentiles
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+    latencies: List[List[float]] = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+
+    def client_thread(i: int) -> None:
+        with GraphClient(address) as client:
+            for request in requests[i::concurrency]:
+                params = {k: v for k, v in request.items() if k != 'op'}
+                start = time.perf_counter()
+                try:
+                    client.request(request['op'], **params)
+                except ValueError:
+                    errors[i] += 1
+                latencies[i].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client_thread, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    samples = np.array([s for per_client in latencies for s in per_client]) * 1000
+    return {
+        'requests': len(samples),
+        'errors': sum(errors),
+        'seconds': elapsed,
+        'throughput_qps': len(samples) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': float(np.percentile(samples, 50)) if len(samples) else 0.0,
+        'p99_ms': float(np.percentile(samples, 99)) if len(samples) else 0.0
+    }
+
+
+def _parse_address(args: argparse.Namespace) -> Address:
+    return args.unix if args.unix else (args.host, args.port)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="JSON-lines graph query server")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="load an edge list and serve queries")
+    serve.add_argument('edges', help="edge list file with 'u v weight' lines")
+    serve.add_argument('--directed', action='store_true')
+    serve.add_argument('--workers', type=int, default=4)
+
+    load = commands.add_parser('load', help="generate random load against a server")
+    load.add_argument('--requests', type=int, default=1000)
+    load.add_argument('--concurrency', type=int, default=4)
+    load.add_argument('--op', choices=('path', 'dijkstra'), default='path')
+    load.add_argument('--sources', type=int, default=16,
+                      help="distinct sources to draw from (fewer means warmer caches)")
+    load.add_argument('--seed', type=int, default=42)
+
+    for command in (serve, load):
+        command.add_argument('--host', default='127.0.0.1')
+        command.add_argument('--port', type=int, default=7372)
+        command.add_argument('--unix', help="Unix socket path instead of TCP")
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        graph = load_edge_list(args.edges, args.directed)
+        server = GraphServer(graph, args.host, args.port, args.unix, args.workers)
+        server.start()
+        print(f"Serving {graph.num_vertices()} vertices on {server.address} with {args.workers} workers")
+        status = 0
+        try:
+            status = server.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+        if status:
+            raise SystemExit(status)
+    else:
+        rng = np.random.default_rng(args.seed)
+        address = _parse_address(args)
+        with GraphClient(address) as client:
+            vertices = client.request('vertices')
+        sources = rng.choice(vertices, size=min(args.sources, len(vertices)), replace=False).tolist()
+        requests = []
+        for _ in range(args.requests):
+            request = {'op': args.op, 'source': sources[rng.integers(len(sources))]}
+            if args.op == 'path':
+                request['target'] = vertices[rng.integers(len(vertices))]
+            requests.append(request)
+
+        report = run_load(address, requests, args.concurrency)
+        print(f"{report['requests']} requests in {report['seconds']:.2f}s: "
+              f"{report['throughput_qps']:.0f} req/s, p50 {report['p50_ms']:.2f}ms, "
+              f"p99 {report['p99_ms']:.2f}ms, {report['errors']} errors")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,8 @@ import subprocess
 import platform
 from src.graph import Graph
 from src.algorithms import dijkstra, prim
-from src.visualizer import draw_graph, create_dijkstra_animation, create_prim_animation
-import matplotlib.pyplot as plt
+# src.visualizer (matplotlib, networkx, PIL) is imported on first use, so
+# the menu comes up without loading the plotting stack
 
 def open_image(filepath):
     # try to open image with system default viewer
@@ -34,8 +34,10 @@ def create_sample_graph():
 
 def visualize_graph(graph, filename='temp_graph.png'):
     # save graph visualization to file
-    fig, ax, pos = draw_graph(graph, title="Current Graph")
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    import matplotlib.pyplot as plt
+    from src.visualizer import draw_graph, get_layout
+    fig, ax, pos = draw_graph(graph, pos=get_layout(graph), title="Current Graph")
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
     plt.close(fig)
     return filename
 
@@ -131,6 +133,7 @@ def run_dijkstra_interactive(graph):
         os.makedirs('animations', exist_ok=True)
         filename = f'animations/dijkstra_{start}_{fringe}_demo.gif'
         print(f"Generating animation: {filename}")
+        from src.visualizer import create_dijkstra_animation
         create_dijkstra_animation(graph, history, filename, duration=600)
         print(f"✓ Animation saved!")
 
@@ -197,6 +200,7 @@ def run_prim_interactive(graph):
         os.makedirs('animations', exist_ok=True)
         filename = f'animations/prim_{start}_{fringe}_demo.gif'
         print(f"Generating animation: {filename}")
+        from src.visualizer import create_prim_animation
         create_prim_animation(graph, history, filename, duration=600)
         print(f"✓ Animation saved!")
 
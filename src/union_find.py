@@ -0,0 +1,57 @@
+from typing import List
+
+
+class UnionFind:
+    # disjoint-set forest over integer ids 0..n-1
+    # union by rank with path halving, near O(1) amortized per operation
+
+    def __init__(self, size: int = 0):
+        self._parent: List[int] = list(range(size))
+        self._rank: List[int] = [0] * size
+        self._num_sets: int = size
+
+    def add(self) -> int:
+        # add a new singleton set and return its id
+        self._parent.append(len(self._parent))
+        self._rank.append(0)
+        self._num_sets += 1
+        return len(self._parent) - 1
+
+    def find(self, x: int) -> int:
+        # return representative of x's set
+        parent = self._parent
+        while parent[x] != x:
+            # path halving: point every other node at its grandparent
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        # merge the sets containing x and y
+        # returns False if they were already in the same set
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        # attach shorter tree under taller one
+        if self._rank[root_x] < self._rank[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        if self._rank[root_x] == self._rank[root_y]:
+            self._rank[root_x] += 1
+
+        self._num_sets -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def num_sets(self) -> int:
+        return self._num_sets
+
+    def size(self) -> int:
+        return len(self._parent)
+
+    def __str__(self) -> str:
+        return f"UnionFind(size={self.size()}, sets={self.num_sets()})"
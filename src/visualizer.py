@@ -1,10 +1,424 @@
+import sys
+import matplotlib
+# headless: figures are only saved to files, so use Agg unless pyplot was
+# already set up by the caller (e.g. a notebook)
+if 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-import networkx as nx
-from PIL import Image
-from typing import Dict, List, Set, Tuple, Optional, Any
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, GifImagePlugin
+from typing import Dict, List, Set, Tuple, Optional, Any, Iterator, Sequence
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import io
 import os
-from src.graph import Graph
+import struct
+import weakref
+import zlib
+import numpy as np
+from src.graph import Graph, CSRGraph
+
+# spring layout parameters shared by every drawing and animation
+LAYOUT_SEED = 42
+LAYOUT_ITERATIONS = 50
+WARM_START_ITERATIONS = 15  # after an incremental edit
+FAST_LAYOUT_THRESHOLD = 500  # vertices from which force_layout replaces nx.spring_layout
+
+# colors
+DEFAULT_NODE_COLOR = '#D3D3D3'      # Light gray
+VISITED_NODE_COLOR = '#87CEEB'      # Sky blue
+CURRENT_NODE_COLOR = '#FF6B6B'      # Red
+EDGE_COLOR = '#999999'              # Gray
+HIGHLIGHTED_EDGE_COLOR = '#4CAF50'  # Green
+
+# level of detail: larger graphs drop text and shrink nodes, since labels
+# dominate drawing time and are unreadable at that size anyway
+EDGE_LABEL_THRESHOLD = 100   # max edges that still get weight labels
+NODE_LABEL_THRESHOLD = 200   # max vertices that still get text labels
+NODE_SIZE = 700
+SMALL_NODE_SIZE = 60         # nodes without text
+
+# force_layout: vertices per neighbor cell paired exactly, and the share of
+# vertices on each side left out when sizing the grid
+NEAR_FIELD_CAP = 16
+GRID_OUTLIER_PERCENTILE = 1.0
+
+
+def _grid_pairs(cells: np.ndarray, grid: int, cap: int = NEAR_FIELD_CAP) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (i, j, weight) pairs of vertices in the same or adjacent grid cells,
+    # each unordered pair at most once
+    # cells: flat cell id per vertex on a grid x grid board
+    # A vertex is paired with every vertex of a neighbor cell holding at most
+    # cap vertices (weight 1). From a fuller cell it takes cap of them,
+    # spread over the cell, and each pair stands for count / cap vertices, so
+    # there are at most 5 * cap pairs per vertex however the vertices bunch up.
+    order = np.argsort(cells, kind='stable')
+    counts = np.bincount(cells, minlength=grid * grid)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.empty(len(cells), dtype=np.int64)
+    rank[order] = np.arange(len(cells)) - starts[cells[order]]
+    cx, cy = np.divmod(cells, grid)
+
+    pairs_i = []
+    pairs_j = []
+    weights = []
+    # own cell plus the 4 "forward" neighbors covers every adjacent pair once
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        nx_, ny_ = cx + dx, cy + dy
+        inside = (nx_ >= 0) & (nx_ < grid) & (ny_ >= 0) & (ny_ < grid)
+        other = np.where(inside, nx_ * grid + ny_, 0)
+        n_other = np.where(inside, counts[other], 0)
+        if dx == dy == 0:
+            # a small cell pairs everything (keeping i < j); a full one pairs
+            # each vertex with the next cap vertices around the cell, which
+            # gives each unordered pair once when cap <= (count - 1) / 2
+            exact = n_other <= 2 * cap + 1
+            n_pairs = np.where(exact, n_other, cap)
+            base = np.where(exact, 0, rank + 1)
+            weight = np.where(exact, 1.0, (n_other - 1) / (2.0 * cap))
+        else:
+            exact = n_other <= cap
+            n_pairs = np.where(exact, n_other, cap)
+            base = np.where(exact, 0, rank * n_other // np.maximum(counts[cells], 1))
+            weight = np.where(exact, 1.0, n_other / float(cap))
+        # expand every vertex into one pair per chosen vertex of the cell
+        i = np.repeat(np.arange(len(cells)), n_pairs)
+        offsets = np.arange(len(i)) - np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs)
+        other_rank = (np.repeat(base, n_pairs) + offsets) % np.maximum(np.repeat(n_other, n_pairs), 1)
+        j = order[np.repeat(starts[other], n_pairs) + other_rank]
+        w = np.repeat(weight, n_pairs)
+        if dx == dy == 0:
+            keep = ~np.repeat(exact, n_pairs) | (other_rank > np.repeat(rank, n_pairs))
+            i, j, w = i[keep], j[keep], w[keep]
+        pairs_i.append(i)
+        pairs_j.append(j)
+        weights.append(w)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j), np.concatenate(weights)
+
+
+def _far_field_kernel(grid: int) -> Tuple[np.ndarray, np.ndarray]:
+    # FFT of the repulsion direction / distance a vertex exerts on a cell
+    # (dx, dy) cells away, in cell units; zero for the 3 x 3 neighborhood
+    # that _grid_pairs handles exactly
+    size = 2 * grid
+    offsets = np.fft.fftfreq(size, 1.0 / size)  # 0, 1, ..., -1 (wrapped)
+    dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+    near = (np.abs(dx) <= 1) & (np.abs(dy) <= 1)
+    scale = 1.0 / np.where(near, np.inf, dx ** 2 + dy ** 2)
+    return np.fft.rfft2(dx * scale), np.fft.rfft2(dy * scale)
+
+
+def _far_field(counts: np.ndarray, kernel: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    # convolve the per-cell vertex counts with the kernel
+    # Returns: array (grid, grid, 2) of summed repulsion in cell units
+    grid = counts.shape[0]
+    size = 2 * grid
+    spectrum = np.fft.rfft2(counts, (size, size))
+    fx = np.fft.irfft2(spectrum * kernel[0], (size, size))[:grid, :grid]
+    fy = np.fft.irfft2(spectrum * kernel[1], (size, size))[:grid, :grid]
+    return np.stack([fx, fy], axis=-1)
+
+
+def force_layout(
+    csr: CSRGraph,
+    iterations: int = LAYOUT_ITERATIONS,
+    seed: int = LAYOUT_SEED,
+    initial: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    # vectorized Fruchterman-Reingold layout (the forces of nx.spring_layout)
+    # in roughly O(V + E) per iteration: the box holding all but the outer
+    # GRID_OUTLIER_PERCENTILE of vertices on each side is split into about
+    # one grid cell per vertex (outliers join the border cells, so a few far
+    # away vertices do not squeeze the rest into a handful of cells);
+    # repulsion is computed between vertices in the same or adjacent cells,
+    # exactly up to NEAR_FIELD_CAP vertices per cell (see _grid_pairs), and
+    # from farther cells by an FFT convolution of the per-cell vertex counts
+    # (a particle-mesh approximation). Attraction runs over the CSR edges.
+    # Vertices are processed in sorted label order, so a seeded run does not
+    # depend on insertion order. Positions are scaled to [-1, 1] like
+    # nx.spring_layout; initial warm-starts from earlier positions.
+    n = csr.num_vertices()
+    if n == 0:
+        return {}
+    if iterations < 0:
+        raise ValueError("iterations must be non-negative")
+
+    # Step 1: relabel vertices in sorted order and collect each edge once
+    labels = sorted(csr.vertices)
+    to_sorted = np.empty(n, dtype=np.int64)
+    to_sorted[[csr.index[v] for v in labels]] = np.arange(n)
+    # (direction is ignored, like topology_fingerprint: u->v and v->u are
+    # one spring)
+    ends = to_sorted[np.repeat(np.arange(n), np.diff(csr.indptr))], to_sorted[csr.indices]
+    rows, cols = np.minimum(*ends), np.maximum(*ends)
+    keep = rows != cols
+    edges = np.unique(np.stack([rows[keep], cols[keep]], axis=1), axis=0).reshape(-1, 2)
+    u, v = edges[:, 0], edges[:, 1]
+
+    # Step 2: start positions in the unit square
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(0.0, 1.0, (n, 2))
+    temperature = 0.1
+    if initial is not None:
+        known = np.array([w in initial for w in labels])
+        if known.any():
+            placed = np.array([initial[w] for w in labels if w in initial], dtype=float).reshape(-1, 2)
+            low = placed.min(axis=0)
+            span = max(float((placed.max(axis=0) - low).max()), 1e-9)
+            pos[known] = (placed - low) / span
+            # a warm start only needs small moves
+            temperature = 0.02
+
+    k = 1.0 / np.sqrt(n)  # ideal edge length
+    grid = max(1, int(np.sqrt(n)))
+    kernel = _far_field_kernel(grid)
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        disp = np.zeros((n, 2))
+
+        # Step 3: bin vertices into the grid over the box without outliers
+        low = np.percentile(pos, GRID_OUTLIER_PERCENTILE, axis=0)
+        high = np.percentile(pos, 100.0 - GRID_OUTLIER_PERCENTILE, axis=0)
+        cell = max(float((high - low).max()) / grid, 1e-12)
+        cells = np.clip(np.floor((pos - low) / cell), 0, grid - 1).astype(np.int64)
+        flat = cells[:, 0] * grid + cells[:, 1]
+
+        # Step 4: repulsion k^2 / d from vertices in nearby cells
+        i, j, weight = _grid_pairs(flat, grid)
+        x, y = pos[:, 0], pos[:, 1]
+        dx = x[i] - x[j]
+        dy = y[i] - y[j]
+        factor = weight * k * k / np.maximum(dx * dx + dy * dy, 1e-4 * k * k)
+        for axis, delta in ((0, dx), (1, dy)):
+            push = np.bincount(i, weights=delta * factor, minlength=n)
+            pull = np.bincount(j, weights=delta * factor, minlength=n)
+            disp[:, axis] += push - pull
+
+        # Step 5: and from farther cells through their vertex counts
+        far = _far_field(np.bincount(flat, minlength=grid * grid).reshape(grid, grid), kernel)
+        disp += far[cells[:, 0], cells[:, 1]] * (k * k / cell)
+
+        # Step 6: attraction d^2 / k along edges, on both endpoints
+        dx = x[u] - x[v]
+        dy = y[u] - y[v]
+        factor = np.sqrt(dx * dx + dy * dy) / k
+        for axis, delta in ((0, dx), (1, dy)):
+            pull = np.bincount(u, weights=delta * factor, minlength=n)
+            push = np.bincount(v, weights=delta * factor, minlength=n)
+            disp[:, axis] += push - pull
+
+        # Step 7: move at most temperature and cool down
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-12)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    # Step 8: center and scale like nx.rescale_layout
+    pos -= pos.mean(axis=0)
+    extent = np.abs(pos).max()
+    if extent > 0:
+        pos /= extent
+    return dict(zip(labels, pos))
+
+
+class LayoutCache:
+    # node positions keyed by Graph.topology_fingerprint(), so every drawing
+    # and animation of the same topology reuses one layout
+    # entries live in an in-memory LRU of max_entries layouts and, when
+    # cache_dir is set, in <key>.npz files that survive restarts.
+    # When a graph that was laid out before is edited, the new layout
+    # warm-starts from its previous positions, which is faster and keeps
+    # the picture stable. A warm-started layout depends on the layout it
+    # started from, so it is keyed by that layout's key plus the new
+    # fingerprint: a graph seen without history always gets the cold
+    # layout of its topology, and each edit history its own warm one.
+
+    def __init__(self, max_entries: int = 32, cache_dir: Optional[str] = None):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._layouts: 'OrderedDict[str, Dict[str, np.ndarray]]' = OrderedDict()
+        # graph -> (fingerprint, key, positions) of its last layout, for
+        # warm starts after edits
+        self._previous: 'weakref.WeakKeyDictionary[Graph, Tuple[str, str, Dict[str, np.ndarray]]]' = \
+            weakref.WeakKeyDictionary()
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._warm_starts = 0
+
+    def get(self, graph: Graph) -> Dict[str, np.ndarray]:
+        # positions for every vertex of graph: a fresh dict each call, of
+        # read-only arrays shared with the cache
+        fingerprint = graph.topology_fingerprint()
+        previous = self._previous.get(graph)
+        if previous is None:
+            key = fingerprint
+        elif previous[0] == fingerprint:
+            key = previous[1]  # not edited since its last layout
+        else:
+            key = _warm_key(previous[1], fingerprint)
+
+        # Step 1: memory, then disk
+        pos = self._layouts.get(key)
+        if pos is not None:
+            self._hits += 1
+            self._layouts.move_to_end(key)
+        elif previous is not None and previous[0] == fingerprint:
+            # evicted, but this graph still holds it
+            self._hits += 1
+            pos = previous[2]
+            self._store(key, pos)
+        else:
+            pos = self._load(key)
+            if pos is not None:
+                self._disk_hits += 1
+            else:
+                # Step 2: compute, warm-starting from this graph's last layout
+                self._misses += 1
+                pos = _read_only(self._compute(graph, previous[2] if previous is not None else None))
+                self._save(key, pos)
+            self._store(key, pos)
+
+        self._previous[graph] = (fingerprint, key, pos)
+        return dict(pos)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self._hits,
+            'disk_hits': self._disk_hits,
+            'misses': self._misses,
+            'warm_starts': self._warm_starts,
+            'entries': len(self._layouts)
+        }
+
+    def clear(self) -> None:
+        # drop in-memory entries; files in cache_dir are kept
+        self._layouts.clear()
+        self._previous = weakref.WeakKeyDictionary()
+
+    def _compute(self, graph: Graph, previous: Optional[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        # spring layout of the undirected topology, built in sorted vertex
+        # order so the seeded result does not depend on insertion order
+        # large graphs use the grid-approximated force_layout instead
+        if graph.num_vertices() >= FAST_LAYOUT_THRESHOLD:
+            if previous is not None:
+                self._warm_starts += 1
+                return force_layout(graph.to_csr(), WARM_START_ITERATIONS, initial=previous)
+            return force_layout(graph.to_csr())
+
+        import networkx as nx  # only needed for small graphs
+        G = nx.Graph()
+        G.add_nodes_from(sorted(graph.get_vertices()))
+        G.add_edges_from((u, v) for u, v, _ in graph.get_edges())
+        if len(G) == 0:
+            return {}
+
+        if previous is None:
+            return nx.spring_layout(G, k=2, iterations=LAYOUT_ITERATIONS, seed=LAYOUT_SEED)
+
+        # place new vertices at the mean of their already placed neighbors
+        # (or at a seeded random spot) and relax briefly from there
+        self._warm_starts += 1
+        rng = np.random.default_rng(LAYOUT_SEED)
+        initial = {v: previous[v] for v in G if v in previous}
+        for v in G:
+            if v not in initial:
+                placed = [initial[u] for u in G.neighbors(v) if u in initial]
+                initial[v] = np.mean(placed, axis=0) if placed else rng.uniform(-1.0, 1.0, 2)
+        return nx.spring_layout(G, k=2, pos=initial, iterations=WARM_START_ITERATIONS, seed=LAYOUT_SEED)
+
+    def _store(self, key: str, pos: Dict[str, np.ndarray]) -> None:
+        self._layouts[key] = pos
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.max_entries:
+            self._layouts.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        if self.cache_dir is None or not os.path.exists(self._path(key)):
+            return None
+        with np.load(self._path(key), allow_pickle=False) as data:
+            return _read_only(dict(zip(data['vertices'].tolist(), data['positions'])))
+
+    def _save(self, key: str, pos: Dict[str, np.ndarray]) -> None:
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        vertices = list(pos)
+        positions = np.array([pos[v] for v in vertices], dtype=np.float64).reshape(-1, 2)
+        np.savez(self._path(key), vertices=np.array(vertices, dtype=str), positions=positions)
+
+
+def _warm_key(previous_key: str, fingerprint: str) -> str:
+    # cache key of a layout warm-started from the layout under previous_key
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(previous_key.encode() + b'\0' + fingerprint.encode())
+    return digest.hexdigest()
+
+
+def _read_only(pos: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    # float copies of the positions that cannot be edited in place, since
+    # cached layouts are handed to every caller
+    frozen = {}
+    for vertex, xy in pos.items():
+        xy = np.array(xy, dtype=np.float64)
+        xy.flags.writeable = False
+        frozen[vertex] = xy
+    return frozen
+
+
+# cache used when no explicit layout is passed
+default_layout_cache = LayoutCache()
+
+
+def get_layout(graph: Graph, cache: Optional[LayoutCache] = None) -> Dict[str, np.ndarray]:
+    # cached node positions for graph
+    return (cache or default_layout_cache).get(graph)
+
+
+def _detail_level(
+    num_vertices: int,
+    num_edges: int,
+    node_label_threshold: int,
+    edge_label_threshold: int
+) -> Tuple[bool, bool, float]:
+    # (draw node text, draw edge labels, node size) for a graph of this size
+    node_text = num_vertices <= node_label_threshold
+    edge_labels = num_edges <= edge_label_threshold
+    return node_text, edge_labels, NODE_SIZE if node_text else SMALL_NODE_SIZE
+
+
+def _draw_edges(
+    ax: plt.Axes,
+    pos: Dict[str, Tuple[float, float]],
+    edges: List[Tuple[str, str]],
+    directed: bool,
+    arrows: bool,
+    node_size: float,
+    **style
+):
+    # all edges as one LineCollection; directed graphs get networkx arrows
+    # while they are small enough to read them
+    if directed and arrows:
+        import networkx as nx
+        G = nx.DiGraph(edges)
+        return nx.draw_networkx_edges(G, pos, edgelist=edges, ax=ax, node_size=node_size, **style)
+    lines = LineCollection([(pos[u], pos[v]) for u, v in edges],
+                           colors=style.get('edge_color'), linewidths=style.get('width'),
+                           alpha=style.get('alpha'))
+    ax.add_collection(lines)
+    return lines
 
 
 def draw_graph(
@@ -15,128 +429,148 @@ def draw_graph(
     highlighted_nodes: Optional[Set[str]] = None,
     highlighted_edges: Optional[List[Tuple[str, str]]] = None,
     node_labels: Optional[Dict[str, str]] = None,
-    current_node: Optional[str] = None
+    current_node: Optional[str] = None,
+    node_label_threshold: int = NODE_LABEL_THRESHOLD,
+    edge_label_threshold: int = EDGE_LABEL_THRESHOLD,
+    rasterize: bool = False
 ) -> Tuple[plt.Figure, plt.Axes, Dict[str, Tuple[float, float]]]:
     # Returns (figure, axes, node_positions) for reuse.
+    # Node text and edge weight labels are left out above the thresholds;
+    # rasterize=True draws the base edges and nodes as one bitmap, which
+    # keeps vector output (PDF/SVG) of large graphs small and fast.
     # Create figure if needed
     if ax is None:
         fig, ax = plt.subplots(figsize=(10, 8))
     else:
         fig = ax.figure
 
-    # Convert to NetworkX graph for layout
-    G = nx.Graph() if not graph.directed else nx.DiGraph()
-
-    for vertex in graph.get_vertices():
-        G.add_node(vertex)
-
-    for u, v, weight in graph.get_edges():
-        G.add_edge(u, v, weight=weight)
-
-    # Generate layout if not provided
+    # Reuse the cached layout if none is provided
     if pos is None:
-        if len(G.nodes) > 0:
-            pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-        else:
-            pos = {}
+        pos = get_layout(graph)
 
-    # Define colors
-    default_node_color = '#D3D3D3'  # Light gray
-    visited_node_color = '#87CEEB'   # Sky blue
-    current_node_color = '#FF6B6B'   # Red
-    edge_color = '#999999'           # Gray
-    highlighted_edge_color = '#4CAF50'  # Green
+    vertices = sorted(graph.get_vertices())
+    edges = [(u, v) for u, v, _ in graph.get_edges()]
+    node_text, edge_labels, node_size = _detail_level(
+        len(vertices), len(edges), node_label_threshold, edge_label_threshold)
 
-    # Determine node colors
-    node_colors = []
-    for node in G.nodes():
-        if current_node and node == current_node:
-            node_colors.append(current_node_color)
-        elif highlighted_nodes and node in highlighted_nodes:
-            node_colors.append(visited_node_color)
+    # Split edges with set lookups (either orientation counts)
+    highlighted = set(highlighted_edges or ())
+    base_edges = []
+    selected_edges = []
+    for u, v in edges:
+        if (u, v) in highlighted or (v, u) in highlighted:
+            selected_edges.append((u, v))
         else:
-            node_colors.append(default_node_color)
+            base_edges.append((u, v))
 
     # Draw all edges first (non-highlighted)
-    edge_list = []
-    edge_weights = []
-    for u, v, data in G.edges(data=True):
-        is_highlighted = False
-        if highlighted_edges:
-            for edge_u, edge_v in highlighted_edges:
-                if (u == edge_u and v == edge_v) or (u == edge_v and v == edge_u):
-                    is_highlighted = True
-                    break
-
-        if not is_highlighted:
-            edge_list.append((u, v))
-            edge_weights.append(data['weight'])
-
-    if edge_list:
-        nx.draw_networkx_edges(
-            G, pos, edgelist=edge_list,
-            edge_color=edge_color, width=1.5, ax=ax, alpha=0.6
-        )
+    if base_edges:
+        base = _draw_edges(ax, pos, base_edges, graph.directed, node_text, node_size,
+                           edge_color=EDGE_COLOR, width=1.5, alpha=0.6)
+        if rasterize and isinstance(base, LineCollection):
+            base.set_rasterized(True)
 
     # Draw highlighted edges (MST or shortest path)
-    if highlighted_edges:
-        highlighted_edge_list = []
-        for edge_u, edge_v in highlighted_edges:
-            if G.has_edge(edge_u, edge_v):
-                highlighted_edge_list.append((edge_u, edge_v))
-
-        if highlighted_edge_list:
-            nx.draw_networkx_edges(
-                G, pos, edgelist=highlighted_edge_list,
-                edge_color=highlighted_edge_color, width=3.0, ax=ax
-            )
+    if selected_edges:
+        _draw_edges(ax, pos, selected_edges, graph.directed, node_text, node_size,
+                    edge_color=HIGHLIGHTED_EDGE_COLOR, width=3.0)
 
     # Draw nodes
-    nx.draw_networkx_nodes(
-        G, pos, node_color=node_colors,
-        node_size=700, ax=ax, edgecolors='black', linewidths=2
-    )
+    node_colors = []
+    for node in vertices:
+        if current_node and node == current_node:
+            node_colors.append(CURRENT_NODE_COLOR)
+        elif highlighted_nodes and node in highlighted_nodes:
+            node_colors.append(VISITED_NODE_COLOR)
+        else:
+            node_colors.append(DEFAULT_NODE_COLOR)
+    xy = np.array([pos[v] for v in vertices], dtype=float).reshape(-1, 2)
+    nodes = ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=node_colors,
+                       edgecolors='black', linewidths=2 if node_text else 0.5, zorder=2)
+    nodes.set_rasterized(rasterize)
 
     # Draw node labels with distances/keys if provided
-    if node_labels:
-        labels = node_labels
-    else:
-        labels = {node: node for node in G.nodes()}
-
-    nx.draw_networkx_labels(
-        G, pos, labels, font_size=10, font_weight='bold', ax=ax
-    )
+    if node_text:
+        for v, (x, y) in zip(vertices, xy):
+            label = node_labels.get(v, v) if node_labels else v
+            ax.text(x, y, label, fontsize=10, fontweight='bold',
+                    horizontalalignment='center', verticalalignment='center', clip_on=True)
 
     # Draw edge labels (weights)
-    edge_labels = nx.get_edge_attributes(G, 'weight')
-    # Format weights to 1 decimal place
-    edge_labels = {k: f'{v:.1f}' for k, v in edge_labels.items()}
-    nx.draw_networkx_edge_labels(
-        G, pos, edge_labels, font_size=8, ax=ax
-    )
+    if edge_labels:
+        for u, v, weight in graph.get_edges():
+            _edge_label(ax, pos, u, v, f'{weight:.1f}')
 
+    ax.autoscale_view()
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.axis('off')
 
-    # Add legend
+    _add_legend(ax)
+
+    return fig, ax, pos
+
+
+def _edge_label(ax: plt.Axes, pos: Dict[str, Tuple[float, float]], u: str, v: str, label: str):
+    # weight label at the edge midpoint, along the edge and kept upright,
+    # styled like networkx's edge labels but without their per-draw
+    # path clipping
+    (x1, y1), (x2, y2) = pos[u], pos[v]
+    angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
+    if angle > 90:
+        angle -= 180
+    elif angle < -90:
+        angle += 180
+    return ax.text(
+        (x1 + x2) / 2, (y1 + y2) / 2, label, fontsize=8,
+        rotation=angle, transform_rotates_text=True, rotation_mode='anchor',
+        horizontalalignment='center', verticalalignment='center', clip_on=True,
+        bbox=dict(boxstyle='round', ec=(1.0, 1.0, 1.0), fc=(1.0, 1.0, 1.0))
+    )
+
+
+def _add_legend(ax: plt.Axes):
     legend_elements = [
-        mpatches.Patch(color=default_node_color, label='Unvisited'),
-        mpatches.Patch(color=visited_node_color, label='Visited'),
-        mpatches.Patch(color=current_node_color, label='Current'),
-        mpatches.Patch(color=highlighted_edge_color, label='Selected Edge')
+        mpatches.Patch(color=DEFAULT_NODE_COLOR, label='Unvisited'),
+        mpatches.Patch(color=VISITED_NODE_COLOR, label='Visited'),
+        mpatches.Patch(color=CURRENT_NODE_COLOR, label='Current'),
+        mpatches.Patch(color=HIGHLIGHTED_EDGE_COLOR, label='Selected Edge')
     ]
-    ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
+    return ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
 
-    return fig, ax, pos
 
+class StepView:
+    # what a single algorithm step looks like: the arguments draw_graph
+    # needs, computed once so full redraws and incremental frame updates
+    # show exactly the same thing
+    # recent holds vertices processed by skipped steps (when an animation
+    # is decimated), shown like the current one
 
-def draw_dijkstra_step(
-    graph: Graph,
-    step: Dict[str, Any],
-    pos: Dict[str, Tuple[float, float]],
-    ax: Optional[plt.Axes] = None
-) -> Tuple[plt.Figure, plt.Axes]:
-    # Draw a single step of Dijkstra's algorithm.
+    __slots__ = ('title', 'visited', 'highlighted_edges', 'node_labels', 'current', 'recent')
+
+    def __init__(
+        self,
+        title: str,
+        visited: Set[str],
+        highlighted_edges: List[Tuple[str, str]],
+        node_labels: Dict[str, str],
+        current: Optional[str],
+        recent: Optional[Set[str]] = None
+    ):
+        self.title = title
+        self.visited = visited
+        self.highlighted_edges = highlighted_edges
+        self.node_labels = node_labels
+        self.current = current
+        self.recent = recent if recent is not None else set()
+
+
+def _step_range(iteration: int, skipped: Sequence[Optional[str]]) -> str:
+    # "Step 7", or "Steps 4-7" when skipped steps are folded into this frame
+    return f"Steps {iteration - len(skipped)}-{iteration}" if skipped else f"Step {iteration}"
+
+
+def dijkstra_step_view(graph: Graph, step: Dict[str, Any], skipped: Sequence[Optional[str]] = ()) -> StepView:
+    # skipped: current vertices of the steps folded into this one
     iteration = step['iteration']
     current = step.get('current')
     visited = step.get('visited', set())
@@ -161,26 +595,15 @@ def draw_dijkstra_step(
 
     # Title
     if current:
-        title = f"Dijkstra's Algorithm - Step {iteration}\nProcessing: {current}"
+        title = f"Dijkstra's Algorithm - {_step_range(iteration, skipped)}\nProcessing: {current}"
     else:
         title = f"Dijkstra's Algorithm - Initial State"
 
-    return draw_graph(
-        graph, pos, ax, title,
-        highlighted_nodes=visited,
-        highlighted_edges=highlighted_edges,
-        node_labels=node_labels,
-        current_node=current
-    )
+    return StepView(title, visited, highlighted_edges, node_labels, current, {v for v in skipped if v})
 
 
-def draw_prim_step(
-    graph: Graph,
-    step: Dict[str, Any],
-    pos: Dict[str, Tuple[float, float]],
-    ax: Optional[plt.Axes] = None
-) -> Tuple[plt.Figure, plt.Axes]:
-    # Draw a single step of Prim's algorithm.
+def prim_step_view(graph: Graph, step: Dict[str, Any], skipped: Sequence[Optional[str]] = ()) -> StepView:
+    # skipped: current vertices of the steps folded into this one
     iteration = step['iteration']
     current = step.get('current')
     visited = step.get('visited', set())
@@ -204,122 +627,642 @@ def draw_prim_step(
 
     # Title
     if current:
-        title = f"Prim's Algorithm - Step {iteration}\nProcessing: {current} | MST Weight: {mst_weight:.1f}"
+        title = f"Prim's Algorithm - {_step_range(iteration, skipped)}\nProcessing: {current} | MST Weight: {mst_weight:.1f}"
     else:
         title = f"Prim's Algorithm - Initial State"
 
+    return StepView(title, visited, highlighted_edges, node_labels, current, {v for v in skipped if v})
+
+
+def draw_dijkstra_step(
+    graph: Graph,
+    step: Dict[str, Any],
+    pos: Dict[str, Tuple[float, float]],
+    ax: Optional[plt.Axes] = None
+) -> Tuple[plt.Figure, plt.Axes]:
+    # Draw a single step of Dijkstra's algorithm.
+    view = dijkstra_step_view(graph, step)
+    return draw_graph(
+        graph, pos, ax, view.title,
+        highlighted_nodes=view.visited,
+        highlighted_edges=view.highlighted_edges,
+        node_labels=view.node_labels,
+        current_node=view.current
+    )
+
+
+def draw_prim_step(
+    graph: Graph,
+    step: Dict[str, Any],
+    pos: Dict[str, Tuple[float, float]],
+    ax: Optional[plt.Axes] = None
+) -> Tuple[plt.Figure, plt.Axes]:
+    # Draw a single step of Prim's algorithm.
+    view = prim_step_view(graph, step)
     return draw_graph(
-        graph, pos, ax, title,
-        highlighted_nodes=visited,
-        highlighted_edges=highlighted_edges,
-        node_labels=node_labels,
-        current_node=current
+        graph, pos, ax, view.title,
+        highlighted_nodes=view.visited,
+        highlighted_edges=view.highlighted_edges,
+        node_labels=view.node_labels,
+        current_node=view.current
     )
 
 
+class FrameWriter(ABC):
+    # streaming animation encoder: each frame is encoded and written as it
+    # is added, so memory holds a single frame no matter how long the
+    # animation is
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.frames = 0
+
+    @abstractmethod
+    def add(self, frame: Image.Image, duration: int) -> None:
+        # append an RGB frame shown for duration milliseconds
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'FrameWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _changed_box(previous: Optional[np.ndarray], current: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    # (left, top, right, bottom) around the pixels that differ from the
+    # previous frame, the whole frame if there is none, None if identical
+    if previous is None or previous.shape != current.shape:
+        return 0, 0, current.shape[1], current.shape[0]
+    diff = previous != current
+    if diff.ndim == 3:
+        diff = diff.any(axis=2)
+    rows = np.flatnonzero(diff.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+class GifStreamWriter(FrameWriter):
+    # animated GIF
+    # by default each frame gets its own adaptive palette (local color
+    # table), which matches what Image.save(save_all=True) does with RGB
+    # frames. With shared_palette=True the palette is computed once from the
+    # first frame and written as the global color table; later frames are
+    # only mapped onto it (much cheaper than quantizing each one) and only
+    # the region that changed since the previous frame is stored. Use it
+    # when the first frame shows every color, like animation frames with
+    # their legend.
+
+    def __init__(self, output_path: str, loop: int = 0, shared_palette: bool = False):
+        super().__init__(output_path)
+        self.loop = loop
+        self.shared_palette = shared_palette
+        self._palette: Optional[Image.Image] = None
+        self._previous: Optional[np.ndarray] = None
+        self._file = open(output_path, 'wb')
+
+    def add(self, frame: Image.Image, duration: int) -> None:
+        if not self.shared_palette:
+            paletted = frame.convert('P', palette=Image.ADAPTIVE)
+            if self.frames == 0:
+                header, _ = GifImagePlugin.getheader(paletted, info={'loop': self.loop})
+                self._file.write(b''.join(header))
+            self._write(paletted, (0, 0), duration, True)
+            self.frames += 1
+            return
+
+        # Step 1: the first frame defines the global palette
+        if self._palette is None:
+            self._palette = frame.convert('P', palette=Image.ADAPTIVE)
+            header, _ = GifImagePlugin.getheader(self._palette.copy(), info={'loop': self.loop})
+            self._file.write(b''.join(header))
+            paletted = self._palette
+        else:
+            paletted = frame.quantize(palette=self._palette, dither=Image.Dither.NONE)
+
+        # Step 2: store only the changed region (earlier pixels stay shown)
+        indices = np.asarray(paletted)
+        box = _changed_box(self._previous, indices) or (0, 0, 1, 1)
+        self._previous = indices
+        self._write(paletted.crop(box), box[:2], duration, False)
+        self.frames += 1
+
+    def _write(self, paletted: Image.Image, offset: Tuple[int, int], duration: int, color_table: bool) -> None:
+        for chunk in GifImagePlugin.getdata(paletted, offset=offset, duration=duration,
+                                            include_color_table=color_table):
+            self._file.write(chunk)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.write(b';')  # GIF trailer
+            self._file.close()
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def _png_chunks(image: Image.Image, compress_level: int) -> Dict[bytes, bytes]:
+    # IHDR and concatenated IDAT data of image encoded as PNG
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', compress_level=compress_level)
+    data = buffer.getvalue()
+    chunks = {b'IDAT': b''}
+    at = 8  # after the signature
+    while at < len(data):
+        length, kind = struct.unpack('>I4s', data[at:at + 8])
+        body = data[at + 8:at + 8 + length]
+        if kind == b'IDAT':
+            chunks[b'IDAT'] += body
+        else:
+            chunks[kind] = body
+        at += 12 + length
+    return chunks
+
+
+def _apng_delay(duration: int) -> Tuple[int, int]:
+    # fcTL delay as a (numerator, denominator) pair of 16-bit values: ms
+    # while they fit, then coarser units (centiseconds, ...) rounding down
+    for denominator in (1000, 100, 10, 1):
+        numerator = int(duration * denominator // 1000)
+        if numerator <= 0xFFFF:
+            return numerator, denominator
+    raise ValueError(f"Frame duration too long for APNG: {duration} ms")
+
+
+class ApngStreamWriter(FrameWriter):
+    # animated PNG: lossless RGB, no palette. Each frame stores only the
+    # region that changed since the previous one. The frame count in the
+    # header is patched in on close, so the file is written in one pass
+    # (a seekable output is required).
+
+    def __init__(self, output_path: str, loop: int = 0, compress_level: int = 1):
+        super().__init__(output_path)
+        self.loop = loop
+        # zlib level 1: much faster, and flat-color frames come out about as
+        # small as at the default level
+        self.compress_level = compress_level
+        self._sequence = 0
+        self._actl_offset = 0
+        self._previous: Optional[np.ndarray] = None
+        self._file = open(output_path, 'wb')
+
+    def add(self, frame: Image.Image, duration: int) -> None:
+        delay = _apng_delay(duration)  # checked before anything is written
+        pixels = np.asarray(frame)
+        box = _changed_box(self._previous, pixels) or (0, 0, 1, 1)
+        self._previous = pixels
+        chunks = _png_chunks(frame.crop(box), self.compress_level)
+
+        # Step 1: signature, header and a frame count to fill in on close
+        if self.frames == 0:
+            self._file.write(b'\x89PNG\r\n\x1a\n')
+            self._file.write(_png_chunk(b'IHDR', chunks[b'IHDR']))
+            self._actl_offset = self._file.tell()
+            self._file.write(_png_chunk(b'acTL', struct.pack('>II', 0, self.loop)))
+
+        # Step 2: frame control (region, delay), then the pixel data;
+        # the first frame is the default image (IDAT), later ones fdAT
+        left, top, right, bottom = box
+        self._file.write(_png_chunk(b'fcTL', struct.pack(
+            '>IIIIIHHBB', self._sequence, right - left, bottom - top, left, top, *delay, 0, 0)))
+        self._sequence += 1
+        if self.frames == 0:
+            self._file.write(_png_chunk(b'IDAT', chunks[b'IDAT']))
+        else:
+            self._file.write(_png_chunk(b'fdAT', struct.pack('>I', self._sequence) + chunks[b'IDAT']))
+            self._sequence += 1
+        self.frames += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.write(_png_chunk(b'IEND', b''))
+        if self.frames:
+            self._file.seek(self._actl_offset)
+            self._file.write(_png_chunk(b'acTL', struct.pack('>II', self.frames, self.loop)))
+        self._file.close()
+
+
+class FrameSequenceWriter(FrameWriter):
+    # numbered still images (frame_00000.png, ...) in the output_path
+    # directory, plus frames.txt listing them with their durations in
+    # ffmpeg's concat format (ffmpeg -f concat -i frames.txt out.mp4)
+    # WebP frames are lossless, which keeps text sharp
+
+    FORMATS = {'png': 'PNG', 'webp': 'WEBP'}
+
+    def __init__(self, output_path: str, image_format: str = 'png'):
+        if image_format not in self.FORMATS:
+            raise ValueError(f"Invalid image format: {image_format}")
+        super().__init__(output_path)
+        self.image_format = image_format
+        self._entries: List[str] = ["ffconcat version 1.0"]
+        self._last = None
+        os.makedirs(output_path, exist_ok=True)
+
+    def add(self, frame: Image.Image, duration: int) -> None:
+        name = f"frame_{self.frames:05d}.{self.image_format}"
+        path = os.path.join(self.output_path, name)
+        if self.image_format == 'png':
+            frame.save(path, 'PNG', compress_level=1)
+        else:
+            frame.save(path, 'WEBP', lossless=True)
+        self._entries += [f"file '{name}'", f"duration {duration / 1000:g}"]
+        self._last = name
+        self.frames += 1
+
+    def close(self) -> None:
+        if self._entries is None:
+            return
+        if self._last is not None:
+            # concat applies the last duration only if the file is repeated
+            self._entries.append(f"file '{self._last}'")
+        with open(os.path.join(self.output_path, 'frames.txt'), 'w') as f:
+            f.write('\n'.join(self._entries) + '\n')
+        self._entries = None
+
+
+# animation encoders by name; 'png' and 'webp' write a directory of frames
+ENCODERS = ('gif', 'apng', 'png', 'webp')
+
+
+def open_frame_writer(encoder: str, output_path: str, loop: int = 0) -> FrameWriter:
+    if encoder == 'gif':
+        return GifStreamWriter(output_path, loop, shared_palette=True)
+    if encoder == 'apng':
+        return ApngStreamWriter(output_path, loop)
+    if encoder in ('png', 'webp'):
+        return FrameSequenceWriter(output_path, encoder)
+    raise ValueError(f"Invalid encoder: {encoder}")
+
+
+def new_frame_figure(figsize: Tuple[float, float] = (10, 8), dpi: int = 100) -> Tuple[Figure, plt.Axes]:
+    # off-screen Agg figure, not registered with pyplot, for frame rendering
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def render_frame(fig: Figure) -> Image.Image:
+    # rasterize fig and copy its Agg buffer into an RGB image
+    fig.canvas.draw()
+    width, height = fig.canvas.get_width_height()
+    return Image.frombuffer('RGBA', (width, height), fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).convert('RGB')
+
+
+class FrameRenderer:
+    # renders StepViews on one off-screen figure, creating every artist once
+    # (with draw_graph's level-of-detail thresholds)
+    # the static part (base edges) is rasterized once into a
+    # background. Per frame only the node colors, node labels and
+    # highlighted edges that differ from the previous view are updated, and
+    # the dynamic artists are blitted over the saved background, instead of
+    # draw_graph rebuilding the whole picture.
+    # Directed graphs small enough for arrows get one highlight arrow per
+    # edge, drawn when the edge is highlighted, as draw_graph draws them.
+
+    def __init__(
+        self,
+        graph: Graph,
+        pos: Dict[str, Tuple[float, float]],
+        figsize: Tuple[float, float] = (10, 8),
+        dpi: int = 100,
+        node_label_threshold: int = NODE_LABEL_THRESHOLD,
+        edge_label_threshold: int = EDGE_LABEL_THRESHOLD
+    ):
+        self.fig, self.ax = new_frame_figure(figsize, dpi)
+        ax = self.ax
+        self._pos = pos
+        self._vertices = sorted(graph.get_vertices())
+        self._index = {v: i for i, v in enumerate(self._vertices)}
+        edges = graph.get_edges()
+        node_text, edge_labels, node_size = _detail_level(
+            len(self._vertices), len(edges), node_label_threshold, edge_label_threshold)
+
+        # Step 1: static artists
+        if edges:
+            _draw_edges(ax, pos, [(u, v) for u, v, _ in edges], graph.directed, node_text, node_size,
+                        edge_color=EDGE_COLOR, width=1.5, alpha=0.6)
+        ax.axis('off')
+
+        # Step 2: dynamic artists, in draw_graph's drawing order
+        self._highlight = LineCollection([], colors=HIGHLIGHTED_EDGE_COLOR, linewidths=3.0)
+        ax.add_collection(self._highlight)
+        self._arrows: Dict[Tuple[str, str], Any] = {}
+        if graph.directed and node_text and edges:
+            keys = [(u, v) for u, v, _ in edges]
+            arrows = _draw_edges(ax, pos, keys, True, True, node_size,
+                                 edge_color=HIGHLIGHTED_EDGE_COLOR, width=3.0)
+            for key, arrow in zip(keys, arrows):
+                arrow.set_animated(True)
+                self._arrows[key] = arrow
+        self._shown_arrows: List[Any] = []
+
+        xy = np.array([pos[v] for v in self._vertices], dtype=float).reshape(-1, 2)
+        self._palette = {
+            'default': to_rgba(DEFAULT_NODE_COLOR),
+            'visited': to_rgba(VISITED_NODE_COLOR),
+            'current': to_rgba(CURRENT_NODE_COLOR)
+        }
+        self._colors = np.tile(self._palette['default'], (len(self._vertices), 1))
+        self._nodes = ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=self._colors,
+                                 edgecolors='black', linewidths=2 if node_text else 0.5)
+
+        self._labels = [
+            ax.text(x, y, v, fontsize=10, fontweight='bold',
+                    horizontalalignment='center', verticalalignment='center', clip_on=True)
+            for v, (x, y) in zip(self._vertices, xy)
+        ] if node_text else []
+        self._title = ax.set_title('', fontsize=14, fontweight='bold')
+        self._legend = _add_legend(ax)
+        for artist in [self._highlight, self._nodes, self._title, self._legend] + self._labels:
+            artist.set_animated(True)
+
+        # edge weight labels are static, but the ones on highlighted edges
+        # are drawn again on top of the highlight each frame
+        self._edge_labels: Dict[Tuple[str, str], Any] = {}
+        for u, v, weight in edges if edge_labels else ():
+            text = _edge_label(ax, pos, u, v, f'{weight:.1f}')
+            self._edge_labels[(u, v)] = text
+            if not graph.directed:
+                self._edge_labels[(v, u)] = text
+        self._raised_labels: List[Any] = []
+
+        # Step 3: rasterize the static background once
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+        # state shown by the last frame, for diffing
+        self._shown_visited: Set[str] = set()
+        self._shown_current: Set[str] = set()
+        self._shown_labels = list(self._vertices) if node_text else []
+        self._shown_edges: frozenset = frozenset()
+
+    def render(self, view: StepView) -> Image.Image:
+        self._update(view)
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+        # same stacking as draw_graph, legend on top
+        for artist in [self._highlight] + self._shown_arrows + [self._nodes] + self._labels + \
+                self._raised_labels + [self._title, self._legend]:
+            self.ax.draw_artist(artist)
+
+        width, height = canvas.get_width_height()
+        return Image.frombuffer('RGBA', (width, height), canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).convert('RGB')
+
+    def _update(self, view: StepView) -> None:
+        # Step 1: recolor only nodes whose visited/current state changed
+        visited = view.visited
+        current = view.recent | {view.current} if view.current is not None else set(view.recent)
+        changed = (visited ^ self._shown_visited) | current | self._shown_current
+        if changed:
+            for v in changed:
+                if v not in self._index:
+                    continue
+                if v in current:
+                    state = 'current'
+                elif v in visited:
+                    state = 'visited'
+                else:
+                    state = 'default'
+                self._colors[self._index[v]] = self._palette[state]
+            self._nodes.set_facecolor(self._colors)
+            self._shown_visited = set(visited)
+            self._shown_current = current
+
+        # Step 2: relabel only nodes whose text changed
+        labels = view.node_labels
+        for i, v in enumerate(self._vertices if self._labels else ()):
+            label = labels.get(v, v) if labels else v
+            if label != self._shown_labels[i]:
+                self._labels[i].set_text(label)
+                self._shown_labels[i] = label
+
+        # Step 3: rebuild highlighted segments only when the edge set changed
+        edges = frozenset((u, v) for u, v in view.highlighted_edges if u in self._pos and v in self._pos)
+        if edges != self._shown_edges:
+            if self._arrows:
+                # graph edges in either orientation, like draw_graph
+                keys = {key for u, v in edges for key in ((u, v), (v, u)) if key in self._arrows}
+                self._shown_arrows = [self._arrows[key] for key in sorted(keys)]
+            else:
+                self._highlight.set_segments([(self._pos[u], self._pos[v]) for u, v in edges])
+            self._raised_labels = [self._edge_labels[e] for e in edges if e in self._edge_labels]
+            self._shown_edges = edges
+
+        if self._title.get_text() != view.title:
+            self._title.set_text(view.title)
+
+
+# graph and layout shared with frame-rendering worker processes (set once
+# per pool); each worker builds its own FrameRenderer on first use
+_frame_worker_args: Optional[Tuple[Graph, Dict[str, Tuple[float, float]]]] = None
+_frame_worker_renderer: Optional[FrameRenderer] = None
+
+
+def _init_frame_worker(graph: Graph, pos: Dict[str, Tuple[float, float]]) -> None:
+    global _frame_worker_args, _frame_worker_renderer
+    _frame_worker_args = (graph, pos)
+    _frame_worker_renderer = None
+
+
+def _render_chunk(views: List[StepView]) -> List[Image.Image]:
+    # worker entry point: render a contiguous run of step views
+    # a frame depends only on its own view, so chunks can be rendered by
+    # any worker in any order and still match serial output
+    global _frame_worker_renderer
+    if _frame_worker_renderer is None:
+        _frame_worker_renderer = FrameRenderer(*_frame_worker_args)
+    return [_frame_worker_renderer.render(view) for view in views]
+
+
+def _step_changes(step_history: List[Dict[str, Any]]) -> np.ndarray:
+    # number of distances (dijkstra) or keys (prim) each step changed
+    changes = np.zeros(len(step_history))
+    previous: Dict[str, float] = {}
+    for i, step in enumerate(step_history):
+        values = step.get('distances', step.get('keys', {}))
+        changes[i] = sum(1 for v, value in values.items() if previous.get(v) != value)
+        previous = values
+    return changes
+
+
+def sample_steps(
+    step_history: List[Dict[str, Any]],
+    max_frames: int,
+    mode: str = 'uniform'
+) -> List[Tuple[int, List[Optional[str]]]]:
+    # pick at most max_frames steps to render, always keeping the first and
+    # last one. 'uniform' spaces them evenly; 'adaptive' spends more frames
+    # where many distances/keys changed and fewer on quiet stretches
+    # Returns: (step index, current vertices of the skipped steps folded
+    # into it) per rendered frame
+    if max_frames < 2:
+        raise ValueError("max_frames must be at least 2")
+    if mode not in ('uniform', 'adaptive'):
+        raise ValueError(f"Invalid sampling mode: {mode}")
+    n = len(step_history)
+    if n <= max_frames:
+        return [(i, []) for i in range(n)]
+
+    # Step 1: choose the steps to keep
+    if mode == 'uniform':
+        chosen = np.linspace(0, n - 1, max_frames).round().astype(int)
+    else:
+        # equal shares of the cumulative change (+1 per step, so quiet
+        # stretches still advance)
+        cumulative = np.cumsum(_step_changes(step_history) + 1)
+        targets = np.linspace(cumulative[0], cumulative[-1], max_frames)
+        chosen = np.searchsorted(cumulative, targets)
+    chosen = sorted(set(chosen.tolist()) | {0, n - 1})
+
+    # Step 2: fold each run of skipped steps into the next kept one
+    samples = []
+    last = -1
+    for i in chosen:
+        skipped = [step_history[j].get('current') for j in range(last + 1, i)]
+        samples.append((i, skipped))
+        last = i
+    return samples
+
+
+def _render_frames(
+    graph: Graph,
+    step_history: List[Dict[str, Any]],
+    step_view,
+    pos: Dict[str, Tuple[float, float]],
+    workers: int = 1,
+    samples: Optional[List[Tuple[int, List[Optional[str]]]]] = None
+) -> Iterator[Image.Image]:
+    # frames in step order, rendered here or on a process pool
+    # samples (from sample_steps) selects the steps to render; all by default
+    if samples is None:
+        samples = [(i, []) for i in range(len(step_history))]
+    if workers == 1:
+        renderer = FrameRenderer(graph, pos)
+        for i, skipped in samples:
+            yield renderer.render(step_view(graph, step_history[i], skipped))
+        return
+
+    # Step 1: split the frames into chunks, a few per worker so they
+    # finish at different times and keep every worker busy
+    chunk_size = max(1, min(16, -(-len(samples) // (workers * 4))))
+    chunks = [samples[i:i + chunk_size] for i in range(0, len(samples), chunk_size)]
+
+    # Step 2: keep at most 2 chunks per worker in flight and yield results
+    # in order, so memory stays bounded however long the animation is
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_frame_worker,
+                             initargs=(graph, pos)) as pool:
+        in_flight = deque()
+        next_chunk = 0
+        while next_chunk < len(chunks) or in_flight:
+            while next_chunk < len(chunks) and len(in_flight) < workers * 2:
+                views = [step_view(graph, step_history[i], skipped) for i, skipped in chunks[next_chunk]]
+                in_flight.append(pool.submit(_render_chunk, views))
+                next_chunk += 1
+            yield from in_flight.popleft().result()
+
+
+def _frame_budget(
+    duration: int,
+    max_frames: Optional[int],
+    target_duration: Optional[float]
+) -> Optional[int]:
+    # frames that fit both limits; target_duration is in seconds and
+    # accounts for the longer first (2x) and last (3x) frame, so it must
+    # leave room for at least those two
+    budget = max_frames
+    if target_duration is not None:
+        fitting = int(target_duration * 1000 // duration) - 3
+        if fitting < 2:
+            raise ValueError(f"target_duration must be at least {5 * duration / 1000} seconds "
+                             f"(first and last frame at {duration} ms per frame)")
+        budget = fitting if budget is None else min(budget, fitting)
+    return budget
+
+
+def _render_animation(
+    graph: Graph,
+    step_history: List[Dict[str, Any]],
+    output_path: str,
+    duration: int,
+    step_view,
+    workers: int = 1,
+    max_frames: Optional[int] = None,
+    target_duration: Optional[float] = None,
+    sampling: str = 'uniform',
+    encoder: str = 'gif'
+) -> None:
+    # render each (sampled) step and stream it into the encoder
+    # first and last frame display longer, so every frame is written only
+    # once the next one exists
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    if encoder not in ENCODERS:
+        raise ValueError(f"Invalid encoder: {encoder}")
+    budget = _frame_budget(duration, max_frames, target_duration)
+    if not step_history:
+        return
+    samples = sample_steps(step_history, budget, sampling) if budget is not None else None
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Consistent layout shared with every other drawing of this graph
+    pos = get_layout(graph)
+
+    with open_frame_writer(encoder, output_path) as writer:
+        pending = None
+        for frame in _render_frames(graph, step_history, step_view, pos, workers, samples):
+            if pending is not None:
+                writer.add(pending, duration * 2 if writer.frames == 0 else duration)
+            pending = frame
+        writer.add(pending, duration * 3 if writer.frames > 0 else duration * 2)
+
+    print(f"Animation saved to: {output_path}")
+
+
 def create_dijkstra_animation(
     graph: Graph,
     step_history: List[Dict[str, Any]],
     output_path: str,
-    duration: int = 800
+    duration: int = 800,
+    workers: int = 1,
+    max_frames: Optional[int] = None,
+    target_duration: Optional[float] = None,
+    sampling: str = 'uniform',
+    encoder: str = 'gif'
 ) -> None:
-    # Create output directory if needed
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # Generate consistent layout
-    G = nx.Graph()
-    for v in graph.get_vertices():
-        G.add_node(v)
-    for u, v, w in graph.get_edges():
-        G.add_edge(u, v)
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-
-    frames = []
-    temp_files = []
-
-    try:
-        # Create frame for each step
-        for i, step in enumerate(step_history):
-            fig, ax = plt.subplots(figsize=(10, 8))
-            draw_dijkstra_step(graph, step, pos, ax)
-
-            # Save frame
-            temp_file = f"/tmp/dijkstra_frame_{i}.png"
-            plt.savefig(temp_file, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-
-            frames.append(Image.open(temp_file))
-            temp_files.append(temp_file)
-
-        # Create GIF
-        if frames:
-            # First and last frame display longer
-            durations = [duration * 2] + [duration] * (len(frames) - 2) + [duration * 3]
-            frames[0].save(
-                output_path,
-                save_all=True,
-                append_images=frames[1:],
-                duration=durations,
-                loop=0
-            )
-            print(f"Animation saved to: {output_path}")
-
-    finally:
-        # Cleanup temp files
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+    # workers > 1 renders frames on a process pool (same output as serial)
+    # max_frames / target_duration (seconds) cap the frame count for long
+    # histories, sampling steps with sample_steps ('uniform' or 'adaptive')
+    # encoder: 'gif', 'apng', or 'png' / 'webp' frames in the output_path directory
+    _render_animation(graph, step_history, output_path, duration, dijkstra_step_view,
+                      workers, max_frames, target_duration, sampling, encoder)
 
 
 def create_prim_animation(
     graph: Graph,
     step_history: List[Dict[str, Any]],
     output_path: str,
-    duration: int = 800
+    duration: int = 800,
+    workers: int = 1,
+    max_frames: Optional[int] = None,
+    target_duration: Optional[float] = None,
+    sampling: str = 'uniform',
+    encoder: str = 'gif'
 ) -> None:
-    # Create output directory if needed
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # Generate consistent layout
-    G = nx.Graph()
-    for v in graph.get_vertices():
-        G.add_node(v)
-    for u, v, w in graph.get_edges():
-        G.add_edge(u, v)
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-
-    frames = []
-    temp_files = []
-
-    try:
-        # Create frame for each step
-        for i, step in enumerate(step_history):
-            fig, ax = plt.subplots(figsize=(10, 8))
-            draw_prim_step(graph, step, pos, ax)
-
-            # Save frame
-            temp_file = f"/tmp/prim_frame_{i}.png"
-            plt.savefig(temp_file, dpi=100, bbox_inches='tight')
-            plt.close(fig)
-
-            frames.append(Image.open(temp_file))
-            temp_files.append(temp_file)
-
-        # Create GIF
-        if frames:
-            # First and last frame display longer
-            durations = [duration * 2] + [duration] * (len(frames) - 2) + [duration * 3]
-            frames[0].save(
-                output_path,
-                save_all=True,
-                append_images=frames[1:],
-                duration=durations,
-                loop=0
-            )
-            print(f"Animation saved to: {output_path}")
-
-    finally:
-        # Cleanup temp files
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+    # workers > 1 renders frames on a process pool (same output as serial)
+    # max_frames / target_duration (seconds) cap the frame count for long
+    # histories, sampling steps with sample_steps ('uniform' or 'adaptive')
+    # encoder: 'gif', 'apng', or 'png' / 'webp' frames in the output_path directory
+    _render_animation(graph, step_history, output_path, duration, prim_step_view,
+                      workers, max_frames, target_duration, sampling, encoder)
@@ -0,0 +1,15 @@
+import random
+from src.graph import Graph
+
+
+def make_random_graph(num_vertices: int, edge_probability: float, seed: int) -> Graph:
+    # connected random graph with a spanning path plus random extra edges
+    rng = random.Random(seed)
+    graph = Graph(directed=False)
+    for i in range(1, num_vertices):
+        graph.add_edge(f"V{i - 1}", f"V{i}", rng.uniform(1.0, 10.0))
+    for i in range(num_vertices):
+        for j in range(i + 2, num_vertices):
+            if rng.random() < edge_probability:
+                graph.add_edge(f"V{i}", f"V{j}", rng.uniform(1.0, 10.0))
+    return graph
@@ -2,11 +2,27 @@ import time
 import random
 import csv
 import os
-from typing import List, Tuple, Dict
-import matplotlib.pyplot as plt
+import sys
+import tempfile
+import tracemalloc
+import gc
+import subprocess
+from typing import List, Tuple, Dict, Optional
 
 from src.graph import Graph
-from src.algorithms import dijkstra, prim
+from src.algorithms import dijkstra, prim, boruvka, delta_stepping
+from src.dynamic import DynamicShortestPaths, IncrementalMST
+from src.checkpoint import checkpointed_dijkstra, checkpointed_prim
+# matplotlib and src.visualizer are imported inside the chart and render
+# benchmarks, so algorithm-only suites never load the plotting stack
+
+
+def _pyplot():
+    # headless pyplot for the charts
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
 
 
 def generate_random_graph(num_vertices: int, edge_probability: float = 0.3) -> Graph:
@@ -34,6 +50,24 @@ def generate_random_graph(num_vertices: int, edge_probability: float = 0.3) -> G
     return graph
 
 
+def generate_degree_graph(num_vertices: int, avg_degree: float) -> Graph:
+    # sparse random graph with a given average degree, O(V + E) to build
+    graph = Graph(directed=False)
+    vertices = [f"V{i}" for i in range(num_vertices)]
+
+    # random spanning tree keeps the graph connected
+    graph.add_vertex(vertices[0])
+    for i in range(1, num_vertices):
+        graph.add_edge(vertices[i], vertices[random.randint(0, i - 1)], random.uniform(1.0, 10.0))
+
+    num_extra = max(0, int(num_vertices * avg_degree / 2) - (num_vertices - 1))
+    for _ in range(num_extra):
+        u, v = random.sample(vertices, 2)
+        graph.add_edge(u, v, random.uniform(1.0, 10.0))
+
+    return graph
+
+
 def benchmark_algorithm(
     graph: Graph,
     algorithm: str,
@@ -109,11 +143,676 @@ def run_benchmarks() -> List[Dict]:
     return results
 
 
-def save_results_csv(results: List[Dict], filename: str = 'results/performance_data.csv'):
+def run_boruvka_scaling_benchmark(
+    graph_sizes: Tuple[int, ...] = (500, 1000, 2000),
+    worker_counts: Tuple[int, ...] = (1, 2, 4, 8),
+    num_runs: int = 3
+) -> List[Dict]:
+    # time Boruvka over a growing process pool against single-threaded Prim
+    results = []
+
+    print("Running Boruvka scaling benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        graph = generate_random_graph(size, edge_probability=0.2)
+        start_node = next(iter(graph.get_vertices()))
+        print(f"\nTesting graph size: {size} vertices, {graph.num_edges()} edges")
+
+        prim_time, _ = benchmark_algorithm(graph, 'prim', 'heap', start_node, num_runs)
+        print(f"  prim (heap): {prim_time:.2f} ms")
+
+        for workers in worker_counts:
+            times = []
+            for _ in range(num_runs):
+                start_time = time.perf_counter()
+                boruvka(graph, workers=workers)
+                times.append((time.perf_counter() - start_time) * 1000)
+            avg_time = sum(times) / len(times)
+
+            results.append({
+                'vertices': size,
+                'edges': graph.num_edges(),
+                'workers': workers,
+                'time_ms': avg_time,
+                'prim_ms': prim_time
+            })
+            print(f"  boruvka ({workers} workers): {avg_time:.2f} ms")
+
+    return results
+
+
+def run_engine_crossover_benchmark(
+    num_vertices: int = 2000,
+    degrees: Tuple[int, ...] = (2, 4, 8, 16, 32, 64, 128, 256),
+    num_runs: int = 3
+) -> List[Dict]:
+    # scalar vs vectorized Dijkstra relaxation as average degree grows
+    results = []
+
+    print("Running Dijkstra engine crossover benchmark...")
+    print("=" * 70)
+
+    for degree in degrees:
+        graph = generate_degree_graph(num_vertices, degree)
+        start_node = sorted(graph.get_vertices())[0]
+        graph.to_csr()  # snapshot is built once per graph, not per query
+
+        row = {'vertices': num_vertices, 'edges': graph.num_edges(), 'degree': degree}
+        for engine in ('scalar', 'vectorized'):
+            times = []
+            for _ in range(num_runs):
+                start_time = time.perf_counter()
+                dijkstra(graph, start_node, 'heap', record_history=False, engine=engine)
+                times.append((time.perf_counter() - start_time) * 1000)
+            row[f'{engine}_ms'] = sum(times) / len(times)
+
+        results.append(row)
+        print(f"  degree {degree:4}: scalar={row['scalar_ms']:.2f}ms, "
+              f"vectorized={row['vectorized_ms']:.2f}ms")
+
+    crossover = next((r['degree'] for r in results if r['vectorized_ms'] < r['scalar_ms']), None)
+    if crossover is None:
+        print("\nVectorized engine never won in this range")
+    else:
+        print(f"\nVectorized engine wins from average degree {crossover}")
+
+    return results
+
+
+def run_delta_stepping_benchmark(
+    graph_sizes: Tuple[int, ...] = (20000, 100000),
+    avg_degree: int = 16,
+    worker_counts: Tuple[int, ...] = (1, 2, 4, 8),
+    num_runs: int = 3
+) -> List[Dict]:
+    # delta-stepping speedup over worker count, with heap Dijkstra as reference
+    results = []
+
+    print("Running delta-stepping benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        graph = generate_degree_graph(size, avg_degree)
+        start_node = 'V0'
+        graph.to_csr()
+        print(f"\nTesting graph size: {size} vertices, {graph.num_edges()} edges")
+
+        times = []
+        for _ in range(num_runs):
+            start_time = time.perf_counter()
+            dijkstra(graph, start_node, 'heap', record_history=False)
+            times.append((time.perf_counter() - start_time) * 1000)
+        dijkstra_time = sum(times) / len(times)
+        print(f"  dijkstra (heap): {dijkstra_time:.2f} ms")
+
+        for workers in worker_counts:
+            times = []
+            for _ in range(num_runs):
+                start_time = time.perf_counter()
+                delta_stepping(graph, start_node, workers=workers)
+                times.append((time.perf_counter() - start_time) * 1000)
+            avg_time = sum(times) / len(times)
+
+            results.append({
+                'vertices': size,
+                'edges': graph.num_edges(),
+                'workers': workers,
+                'time_ms': avg_time,
+                'dijkstra_ms': dijkstra_time
+            })
+            print(f"  delta-stepping ({workers} workers): {avg_time:.2f} ms")
+
+    return results
+
+
+def run_dynamic_update_benchmark(
+    graph_sizes: Tuple[int, ...] = (1000, 5000, 20000),
+    avg_degree: int = 8,
+    num_updates: int = 100
+) -> List[Dict]:
+    # incremental shortest-path repair vs rerunning dijkstra after each update
+    results = []
+
+    print("Running dynamic shortest-path update benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        print(f"\nTesting graph size: {size} vertices")
+
+        for kind in ('insert', 'increase', 'delete'):
+            graph = generate_degree_graph(size, avg_degree)
+            dsp = DynamicShortestPaths(graph, 'V0', 'heap')
+            vertices = sorted(graph.get_vertices())
+            edges = graph.get_edges()
+
+            update_time = 0.0
+            rerun_time = 0.0
+            touched = 0
+            for _ in range(num_updates):
+                start_time = time.perf_counter()
+                if kind == 'insert':
+                    u, v = random.sample(vertices, 2)
+                    dsp.add_edge(u, v, random.uniform(1.0, 10.0))
+                else:
+                    u, v, w = edges.pop(random.randrange(len(edges)))
+                    if kind == 'increase':
+                        dsp.add_edge(u, v, w * 2)
+                    else:
+                        dsp.remove_edge(u, v)
+                update_time += time.perf_counter() - start_time
+                touched += dsp.last_update_touched
+
+                start_time = time.perf_counter()
+                dijkstra(graph, 'V0', 'heap', record_history=False)
+                rerun_time += time.perf_counter() - start_time
+
+            result = {
+                'vertices': size,
+                'update': kind,
+                'update_ms': update_time / num_updates * 1000,
+                'rerun_ms': rerun_time / num_updates * 1000,
+                'avg_touched': touched / num_updates
+            }
+            results.append(result)
+            print(f"  {kind:8}: update={result['update_ms']:.3f}ms, "
+                  f"rerun={result['rerun_ms']:.2f}ms, touched={result['avg_touched']:.1f}")
+
+    return results
+
+
+def run_incremental_mst_benchmark(
+    graph_sizes: Tuple[int, ...] = (1000, 5000, 20000),
+    avg_degree: int = 8,
+    num_updates: int = 100
+) -> List[Dict]:
+    # incremental MST maintenance vs rerunning prim after each insertion
+    results = []
+
+    print("Running incremental MST benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        graph = generate_degree_graph(size, avg_degree)
+        mst = IncrementalMST(graph)
+        vertices = sorted(graph.get_vertices())
+
+        update_time = 0.0
+        rerun_time = 0.0
+        for _ in range(num_updates):
+            u, v = random.sample(vertices, 2)
+            start_time = time.perf_counter()
+            mst.add_edge(u, v, random.uniform(1.0, 10.0))
+            mst.total_weight
+            update_time += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            prim(graph, 'V0', 'heap', record_history=False)
+            rerun_time += time.perf_counter() - start_time
+
+        result = {
+            'vertices': size,
+            'edges': graph.num_edges(),
+            'update_ms': update_time / num_updates * 1000,
+            'rerun_ms': rerun_time / num_updates * 1000
+        }
+        results.append(result)
+        print(f"  {size} vertices: update={result['update_ms']:.3f}ms, "
+              f"prim rerun={result['rerun_ms']:.2f}ms")
+
+    return results
+
+
+def measure_result_memory(func, *args, **kwargs) -> Tuple[int, int]:
+    # (bytes still held by the returned result, peak bytes during the call)
+    # a full collection empties the interpreter's tuple/float free lists,
+    # which otherwise keep ~100KB of the search's temporaries on the books
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func(*args, **kwargs)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained - before, peak - before
+
+
+def run_result_memory_benchmark(
+    graph_sizes: Tuple[int, ...] = (10000, 100000, 1000000),
+    avg_degree: int = 4
+) -> List[Dict]:
+    # memory per query of dict results vs array-backed result objects
+    results = []
+
+    print("Running result memory benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        graph = generate_degree_graph(size, avg_degree)
+        graph.to_csr()  # shared snapshot, not part of any single query
+        print(f"\nTesting graph size: {size} vertices")
+
+        for algorithm, func in (('dijkstra', dijkstra), ('prim', prim)):
+            dict_retained, dict_peak = measure_result_memory(
+                func, graph, 'V0', 'heap', record_history=False)
+            compact_retained, compact_peak = measure_result_memory(
+                func, graph, 'V0', 'heap', record_history=False, compact=True)
+
+            result = {
+                'vertices': size,
+                'algorithm': algorithm,
+                'dict_mb': dict_retained / 2 ** 20,
+                'compact_mb': compact_retained / 2 ** 20,
+                'dict_peak_mb': dict_peak / 2 ** 20,
+                'compact_peak_mb': compact_peak / 2 ** 20,
+                'reduction': dict_retained / max(compact_retained, 1)
+            }
+            results.append(result)
+            print(f"  {algorithm:8}: dict={result['dict_mb']:.2f}MB, "
+                  f"compact={result['compact_mb']:.2f}MB ({result['reduction']:.1f}x smaller), "
+                  f"peak {result['dict_peak_mb']:.2f}MB -> {result['compact_peak_mb']:.2f}MB")
+
+    return results
+
+
+def run_checkpoint_benchmark(
+    graph_sizes: Tuple[int, ...] = (20000, 100000),
+    avg_degree: int = 4,
+    checkpoints_per_run: Tuple[int, ...] = (1, 10, 100)
+) -> List[Dict]:
+    # cost of periodic checkpointing relative to the plain compact search
+    results = []
+
+    print("Running checkpoint overhead benchmark...")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'search.ckpt')
+
+        for size in graph_sizes:
+            graph = generate_degree_graph(size, avg_degree)
+            graph.to_csr()
+            print(f"\nTesting graph size: {size} vertices")
+
+            for algorithm, plain, checkpointed in (('dijkstra', dijkstra, checkpointed_dijkstra),
+                                                   ('prim', prim, checkpointed_prim)):
+                start = time.perf_counter()
+                plain(graph, 'V0', 'heap', record_history=False, compact=True)
+                baseline_ms = (time.perf_counter() - start) * 1000
+
+                for count in checkpoints_per_run:
+                    start = time.perf_counter()
+                    checkpointed(graph, 'V0', path, every_steps=max(1, size // (count + 1)))
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+
+                    results.append({
+                        'vertices': size,
+                        'algorithm': algorithm,
+                        'checkpoints': count,
+                        'baseline_ms': baseline_ms,
+                        'checkpointed_ms': elapsed_ms,
+                        'overhead_pct': (elapsed_ms / baseline_ms - 1) * 100
+                    })
+                    print(f"  {algorithm:8} {count:4} checkpoints: {baseline_ms:.1f}ms -> "
+                          f"{elapsed_ms:.1f}ms ({results[-1]['overhead_pct']:+.1f}%)")
+
+    return results
+
+
+def render_animation_legacy(graph: Graph, step_history: List[Dict], output_path: str,
+                            duration: int = 800) -> None:
+    # the original frame pipeline, kept as the benchmark baseline: a new
+    # figure per step, saved to a temporary PNG and reopened, with every
+    # frame held in memory until the GIF is written
+    from PIL import Image
+    from src.visualizer import draw_dijkstra_step, get_layout
+    plt = _pyplot()
+
+    pos = get_layout(graph)
+    frames = []
+    temp_files = []
+    try:
+        for i, step in enumerate(step_history):
+            fig, ax = plt.subplots(figsize=(10, 8))
+            draw_dijkstra_step(graph, step, pos, ax)
+            temp_file = os.path.join(tempfile.gettempdir(), f"legacy_frame_{i}.png")
+            plt.savefig(temp_file, dpi=100, bbox_inches='tight')
+            plt.close(fig)
+            frames.append(Image.open(temp_file))
+            temp_files.append(temp_file)
+
+        durations = [duration * 2] + [duration] * (len(frames) - 2) + [duration * 3]
+        frames[0].save(output_path, save_all=True, append_images=frames[1:],
+                       duration=durations, loop=0)
+    finally:
+        for temp_file in temp_files:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+
+def render_animation_full_redraw(graph: Graph, step_history: List[Dict], output_path: str,
+                                 duration: int = 800) -> None:
+    # in-memory frames on one reused figure, but every frame redrawn from
+    # scratch with draw_graph (no incremental artist updates)
+    from src.visualizer import draw_dijkstra_step, get_layout, new_frame_figure, render_frame, GifStreamWriter
+
+    pos = get_layout(graph)
+    fig, ax = new_frame_figure()
+    with GifStreamWriter(output_path) as writer:
+        for step in step_history:
+            ax.clear()
+            draw_dijkstra_step(graph, step, pos, ax)
+            writer.add(render_frame(fig), duration)
+
+
+def run_render_benchmark(graph_sizes: Tuple[int, ...] = (10, 30, 100, 200)) -> List[Dict]:
+    # animation frames per second: the original temp-file pipeline, full
+    # in-memory redraws, and the incremental renderer
+    from src.visualizer import create_dijkstra_animation, get_layout
+    results = []
+
+    print("Running animation rendering benchmark...")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in graph_sizes:
+            graph = generate_random_graph(size, edge_probability=min(1.0, 4.0 / size))
+            _, _, history = dijkstra(graph, 'A', 'heap')
+            get_layout(graph)  # layout time is not part of frame rendering
+            print(f"\nTesting graph size: {size} vertices, {len(history)} frames")
+
+            result = {'vertices': size, 'frames': len(history)}
+            for name, render in (('legacy', render_animation_legacy),
+                                 ('full_redraw', render_animation_full_redraw),
+                                 ('incremental', create_dijkstra_animation)):
+                start = time.perf_counter()
+                render(graph, history, os.path.join(directory, f"{name}.gif"))
+                elapsed = time.perf_counter() - start
+                result[f"{name}_fps"] = len(history) / elapsed
+                print(f"  {name:12}: {result[f'{name}_fps']:.1f} frames/sec")
+            result['speedup'] = result['incremental_fps'] / result['legacy_fps']
+            results.append(result)
+
+    return results
+
+
+def run_parallel_render_benchmark(
+    num_vertices: int = 60,
+    worker_counts: Tuple[int, ...] = (1, 2, 4)
+) -> List[Dict]:
+    # animation rendering time by number of frame-rendering processes
+    from src.visualizer import create_dijkstra_animation, get_layout
+    results = []
+
+    print("Running parallel animation rendering benchmark...")
+    print(f"CPUs available: {os.cpu_count()}")
+    print("=" * 70)
+
+    graph = generate_random_graph(num_vertices, edge_probability=min(1.0, 4.0 / num_vertices))
+    _, _, history = dijkstra(graph, 'A', 'heap')
+    get_layout(graph)
+    print(f"\nGraph: {num_vertices} vertices, {len(history)} frames")
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            create_dijkstra_animation(graph, history, os.path.join(directory, f"w{workers}.gif"),
+                                      workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+
+            results.append({
+                'workers': workers,
+                'frames': len(history),
+                'time': elapsed,
+                'fps': len(history) / elapsed,
+                'speedup': baseline / elapsed
+            })
+            print(f"  {workers} workers: {elapsed:.2f}s ({results[-1]['fps']:.1f} frames/sec, "
+                  f"{results[-1]['speedup']:.2f}x)")
+
+    return results
+
+
+def run_layout_benchmark(
+    graph_sizes: Tuple[int, ...] = (100, 400, 1000, 10000, 50000),
+    avg_degree: float = 4.0,
+    spring_limit: int = 400,
+    isolated: int = 50
+) -> List[Dict]:
+    # force_layout vs nx.spring_layout (O(V^2) per iteration, only timed up
+    # to spring_limit vertices); each graph gets isolated extra vertices,
+    # which drift far from the rest like the trees of a spanning forest
+    import networkx as nx
+    from src.visualizer import force_layout, LAYOUT_ITERATIONS, LAYOUT_SEED
+    results = []
+
+    print("Running graph layout benchmark...")
+    print("=" * 70)
+
+    for size in graph_sizes:
+        graph = generate_degree_graph(size, avg_degree)
+        for vertex in range(isolated):
+            graph.add_vertex(f"I{vertex}")
+        csr = graph.to_csr()
+
+        start = time.perf_counter()
+        force_layout(csr)
+        fast_ms = (time.perf_counter() - start) * 1000
+
+        spring_ms = None
+        if size <= spring_limit:
+            G = nx.Graph()
+            G.add_nodes_from(sorted(graph.get_vertices()))
+            G.add_edges_from((u, v) for u, v, _ in graph.get_edges())
+            start = time.perf_counter()
+            nx.spring_layout(G, iterations=LAYOUT_ITERATIONS, seed=LAYOUT_SEED)
+            spring_ms = (time.perf_counter() - start) * 1000
+
+        results.append({
+            'vertices': size,
+            'edges': graph.num_edges(),
+            'force_layout_ms': fast_ms,
+            'spring_layout_ms': spring_ms
+        })
+        spring = f"{spring_ms:.1f}ms" if spring_ms is not None else "skipped"
+        print(f"  {size} vertices: force_layout={fast_ms:.1f}ms, spring_layout={spring}")
+
+    return results
+
+
+def run_encoder_benchmark(num_vertices: int = 100, max_frames: int = 60) -> List[Dict]:
+    # encode time and output size of the animation encoders for the same
+    # pre-rendered frames; 'gif-adaptive' is the former GIF writer with a
+    # palette quantized per frame
+    from src.visualizer import (ENCODERS, FrameRenderer, GifStreamWriter, dijkstra_step_view,
+                                get_layout, open_frame_writer, sample_steps)
+    results = []
+
+    print("Running animation encoder benchmark...")
+    print("=" * 70)
+
+    graph = generate_random_graph(num_vertices, edge_probability=min(1.0, 4.0 / num_vertices))
+    _, _, history = dijkstra(graph, 'A', 'heap')
+    renderer = FrameRenderer(graph, get_layout(graph))
+    frames = [renderer.render(dijkstra_step_view(graph, history[i], skipped))
+              for i, skipped in sample_steps(history, max_frames)]
+    print(f"\nGraph: {num_vertices} vertices, {len(frames)} frames of {frames[0].size[0]}x{frames[0].size[1]}")
+
+    writers = [('gif-adaptive', lambda path: GifStreamWriter(path))]
+    writers += [(encoder, lambda path, encoder=encoder: open_frame_writer(encoder, path)) for encoder in ENCODERS]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, make_writer in writers:
+            path = os.path.join(directory, name)
+            start = time.perf_counter()
+            with make_writer(path) as writer:
+                for frame in frames:
+                    writer.add(frame, 800)
+            elapsed = time.perf_counter() - start
+
+            if os.path.isdir(path):
+                size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            else:
+                size = os.path.getsize(path)
+            results.append({
+                'encoder': name,
+                'frames': len(frames),
+                'encode_ms_per_frame': elapsed * 1000 / len(frames),
+                'size_kb': size / 1024
+            })
+            print(f"  {name:13}: {results[-1]['encode_ms_per_frame']:6.1f}ms/frame, "
+                  f"{results[-1]['size_kb']:8.0f}KB")
+
+    return results
+
+
+# modules that only visualization should pull in
+PLOTTING_MODULES = ('matplotlib', 'networkx', 'PIL')
+
+
+def measure_import_time(modules: List[str], repeats: int = 5) -> Tuple[float, bool]:
+    # cold import of modules in a fresh interpreter via python -X importtime
+    # Returns: (best total cumulative import time in ms, whether any
+    # plotting module got loaded)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    statement = (f"import sys, {', '.join(modules)}; "
+                 f"print(any(m in sys.modules for m in {PLOTTING_MODULES!r}))")
+    best = None
+    plotting = False
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                   cwd=root, capture_output=True, text=True, check=True)
+        # lines are "import time: self | cumulative | name", nested imports
+        # indented; only top-level entries for the requested modules count
+        total = 0
+        for line in completed.stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].rstrip()[1:] in modules:
+                total += int(parts[1])
+        best = total if best is None else min(best, total)
+        plotting = completed.stdout.strip() == 'True'
+    return best / 1000, plotting
+
+
+def run_import_time_benchmark(repeats: int = 5) -> List[Dict]:
+    # cold-start cost of the core modules and the interactive UI, which
+    # imports the visualizer only when a picture or animation is requested;
+    # 'src.ui + src.visualizer' is what starting the UI cost when it was
+    # imported eagerly
+    cases = [
+        ['src.graph'],
+        ['src.fringe'],
+        ['src.algorithms'],
+        ['src.ui'],
+        ['src.visualizer'],
+        ['src.ui', 'src.visualizer']
+    ]
+    results = []
+
+    print("Running import time benchmark...")
+    print("=" * 70)
+
+    for modules in cases:
+        import_ms, plotting = measure_import_time(modules, repeats)
+        results.append({
+            'modules': ' + '.join(modules),
+            'import_ms': import_ms,
+            'plotting_loaded': plotting
+        })
+        print(f"  {results[-1]['modules']:28}: {import_ms:7.1f}ms"
+              f"{'  (loads plotting stack)' if plotting else ''}")
+
+    lazy = results[3]['import_ms']
+    eager = results[-1]['import_ms']
+    print(f"\nUI cold start: {lazy:.1f}ms lazy vs {eager:.1f}ms eager ({eager / lazy:.1f}x faster)")
+    return results
+
+
+def generate_render_speedup_chart(results: List[Dict], filename: str):
+    plt = _pyplot()
+    os.makedirs('results', exist_ok=True)
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    workers = [r['workers'] for r in results]
+    ax.plot(workers, [r['speedup'] for r in results],
+            'o-', label='Measured', linewidth=2, markersize=8)
+    ax.plot(workers, workers, '--', color='gray', label='Linear')
+    ax.set_xlabel('Worker Processes', fontsize=11)
+    ax.set_ylabel('Speedup over 1 Worker', fontsize=11)
+    ax.set_title("Parallel Animation Rendering Speedup", fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    print(f"Render speedup chart saved to: {filename}")
+
+    plt.close()
+
+
+def generate_crossover_chart(results: List[Dict], filename: str):
+    plt = _pyplot()
+    os.makedirs('results', exist_ok=True)
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    degrees = [r['degree'] for r in results]
+    ax.plot(degrees, [r['scalar_ms'] for r in results],
+            'o-', label='Scalar loop', linewidth=2, markersize=8)
+    ax.plot(degrees, [r['vectorized_ms'] for r in results],
+            's-', label='Vectorized CSR', linewidth=2, markersize=8)
+    ax.set_xscale('log', base=2)
+    ax.set_yscale('log')
+    ax.set_xlabel('Average Degree', fontsize=11)
+    ax.set_ylabel('Execution Time (ms)', fontsize=11)
+    ax.set_title("Dijkstra Relaxation Engine Crossover", fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    print(f"Crossover chart saved to: {filename}")
+
+    plt.close()
+
+
+def generate_scaling_chart(results: List[Dict], title: str, filename: str):
+    # speedup of each worker count relative to 1 worker, one line per graph size
+    plt = _pyplot()
+    os.makedirs('results', exist_ok=True)
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    for size in sorted(set(r['vertices'] for r in results)):
+        rows = sorted((r for r in results if r['vertices'] == size), key=lambda r: r['workers'])
+        baseline = rows[0]['time_ms']
+        ax.plot([r['workers'] for r in rows], [baseline / r['time_ms'] for r in rows],
+                'o-', label=f'{size} vertices', linewidth=2, markersize=8)
+
+    ax.set_xlabel('Worker Processes', fontsize=11)
+    ax.set_ylabel('Speedup vs 1 Worker', fontsize=11)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150, bbox_inches='tight')
+    print(f"Scaling chart saved to: {filename}")
+
+    plt.close()
+
+
+def save_results_csv(
+    results: List[Dict],
+    filename: str = 'results/performance_data.csv',
+    fieldnames: Optional[List[str]] = None
+):
     os.makedirs('results', exist_ok=True)
 
     with open(filename, 'w', newline='') as f:
-        fieldnames = ['vertices', 'edges', 'algorithm', 'fringe', 'time_ms', 'steps']
+        if fieldnames is None:
+            fieldnames = ['vertices', 'edges', 'algorithm', 'fringe', 'time_ms', 'steps']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
 
         writer.writeheader()
@@ -124,6 +823,7 @@ def save_results_csv(results: List[Dict], filename: str = 'results/performance_d
 
 
 def generate_comparison_charts(results: List[Dict]):
+    plt = _pyplot()
     os.makedirs('results', exist_ok=True)
 
     # Separate results by algorithm
@@ -228,6 +928,107 @@ def print_summary(results: List[Dict]):
                       f"Speedup={speedup:.2f}x")
 
 
+def main_boruvka():
+    random.seed(42)
+
+    results = run_boruvka_scaling_benchmark()
+    save_results_csv(results, 'results/boruvka_scaling.csv',
+                     ['vertices', 'edges', 'workers', 'time_ms', 'prim_ms'])
+    generate_scaling_chart(results, "Parallel Boruvka MST Scaling", 'results/boruvka_scaling.png')
+
+
+def main_delta():
+    random.seed(42)
+
+    results = run_delta_stepping_benchmark()
+    save_results_csv(results, 'results/delta_stepping_scaling.csv',
+                     ['vertices', 'edges', 'workers', 'time_ms', 'dijkstra_ms'])
+    generate_scaling_chart(results, "Delta-Stepping SSSP Scaling", 'results/delta_stepping_scaling.png')
+
+
+def main_dynamic():
+    random.seed(42)
+
+    results = run_dynamic_update_benchmark()
+    save_results_csv(results, 'results/dynamic_updates.csv',
+                     ['vertices', 'update', 'update_ms', 'rerun_ms', 'avg_touched'])
+
+
+def main_mst_updates():
+    random.seed(42)
+
+    results = run_incremental_mst_benchmark()
+    save_results_csv(results, 'results/incremental_mst.csv',
+                     ['vertices', 'edges', 'update_ms', 'rerun_ms'])
+
+
+def main_memory():
+    random.seed(42)
+
+    results = run_result_memory_benchmark()
+    save_results_csv(results, 'results/result_memory.csv',
+                     ['vertices', 'algorithm', 'dict_mb', 'compact_mb',
+                      'dict_peak_mb', 'compact_peak_mb', 'reduction'])
+
+
+def main_render():
+    random.seed(42)
+
+    results = run_render_benchmark()
+    save_results_csv(results, 'results/render_fps.csv',
+                     ['vertices', 'frames', 'legacy_fps', 'full_redraw_fps',
+                      'incremental_fps', 'speedup'])
+
+
+def main_render_parallel():
+    random.seed(42)
+
+    results = run_parallel_render_benchmark()
+    save_results_csv(results, 'results/render_parallel.csv',
+                     ['workers', 'frames', 'time', 'fps', 'speedup'])
+    generate_render_speedup_chart(results, 'results/render_parallel.png')
+
+
+def main_layout():
+    random.seed(42)
+
+    results = run_layout_benchmark()
+    save_results_csv(results, 'results/layout_time.csv',
+                     ['vertices', 'edges', 'force_layout_ms', 'spring_layout_ms'])
+
+
+def main_encoders():
+    random.seed(42)
+
+    results = run_encoder_benchmark()
+    save_results_csv(results, 'results/animation_encoders.csv',
+                     ['encoder', 'frames', 'encode_ms_per_frame', 'size_kb'])
+
+
+def main_import_time():
+    results = run_import_time_benchmark()
+    save_results_csv(results, 'results/import_time.csv',
+                     ['modules', 'import_ms', 'plotting_loaded'])
+
+
+def main_checkpoint():
+    random.seed(42)
+
+    results = run_checkpoint_benchmark()
+    save_results_csv(results, 'results/checkpoint_overhead.csv',
+                     ['vertices', 'algorithm', 'checkpoints', 'baseline_ms',
+                      'checkpointed_ms', 'overhead_pct'])
+
+
+def main_engine():
+    random.seed(42)
+
+    results = run_engine_crossover_benchmark()
+    save_results_csv(results, 'results/engine_crossover.csv',
+                     ['vertices', 'edges', 'degree', 'scalar_ms', 'vectorized_ms'])
+    generate_crossover_chart(results, 'results/engine_crossover.png')
+
+
 def main():
     print("Graph Algorithm Performance Benchmark")
     print("Comparing Binary Heap vs Sorted Linked List\n")
@@ -250,5 +1051,26 @@ def main():
     print("\n✓ Performance analysis complete!")
 
 
+# extra benchmark suites, selected by name on the command line:
+#   python -m tests.performance_test boruvka
+BENCHMARK_SUITES = {
+    'boruvka': main_boruvka,
+    'engine': main_engine,
+    'delta': main_delta,
+    'dynamic': main_dynamic,
+    'mst-updates': main_mst_updates,
+    'memory': main_memory,
+    'checkpoint': main_checkpoint,
+    'render': main_render,
+    'render-parallel': main_render_parallel,
+    'layout': main_layout,
+    'import-time': main_import_time,
+    'encoders': main_encoders,
+}
+
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        BENCHMARK_SUITES[sys.argv[1]]()
+    else:
+        main()
\ No newline at end of file
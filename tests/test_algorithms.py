@@ -1,6 +1,11 @@
+import random
 import pytest
 from src.graph import Graph
-from src.algorithms import dijkstra, prim, get_shortest_path, reconstruct_mst_graph
+from src.algorithms import (
+    dijkstra, dijkstra_dense, delta_stepping, bounded_dijkstra, prim, prim_dense, boruvka, minimum_spanning_forest,
+    shortest_path, get_shortest_path, reconstruct_mst_graph
+)
+from tests.helpers import make_random_graph
 
 
 class TestDijkstra:
@@ -65,3 +70,260 @@ class TestPrim:
         mst_graph = reconstruct_mst_graph(mst_edges)
         assert mst_graph.num_vertices() == 3
         assert mst_graph.num_edges() == 2
+
+
+class TestSpanningForest:
+
+    def setup_method(self):
+        # two components: triangle A-B-C and pair D-E, plus isolated F
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+        self.graph.add_edge('D', 'E', 5.0)
+        self.graph.add_vertex('F')
+
+    def test_forest_covers_every_component(self):
+        edges, weights, history = minimum_spanning_forest(self.graph, 'heap')
+
+        assert len(edges) == 3
+        assert weights == [3.0, 5.0, 0.0]
+        assert edges[1] == [('D', 'E', 5.0)]
+        assert edges[2] == []
+        assert len(history) - 1 == self.graph.num_vertices()
+
+    def test_forest_matches_prim_per_component(self):
+        edges, weights, _ = minimum_spanning_forest(self.graph, 'list', record_history=False)
+        _, prim_weight, _ = prim(self.graph, 'A', 'list')
+
+        assert weights[0] == prim_weight
+        assert len(edges[0]) == 2
+
+    def test_prim_without_history(self):
+        mst_edges, total_weight, history = prim(self.graph, 'A', record_history=False)
+
+        assert total_weight == 3.0
+        assert history == []
+
+
+class TestDense:
+
+    def setup_method(self):
+        self.graph = make_random_graph(40, 0.3, seed=3)
+
+    def test_dijkstra_dense_matches_heap(self):
+        distances, previous, _ = dijkstra(self.graph, 'V0', 'heap')
+        dense_distances, dense_previous, history = dijkstra_dense(self.graph, 'V0')
+
+        assert dense_distances == distances
+        assert dense_previous == previous
+        assert len(history) - 1 == self.graph.num_vertices()
+
+    def test_prim_dense_matches_heap(self):
+        mst_edges, total_weight, _ = prim(self.graph, 'V0', 'heap')
+        dense_edges, dense_weight, _ = prim_dense(self.graph, 'V0')
+
+        assert sorted(dense_edges) == sorted(mst_edges)
+        assert dense_weight == pytest.approx(total_weight)
+
+    @pytest.mark.parametrize('fringe_type', ['heap', 'list', 'auto'])
+    def test_tied_weights_match_dense(self, fringe_type):
+        # integer weights from a tiny range tie constantly; every fringe must
+        # pick the same tree as the dense argmin
+        rng = random.Random(8)
+        graph = Graph(directed=False)
+        for i in range(220):
+            for j in range(i + 1, 220):
+                if rng.random() < 0.3:
+                    graph.add_edge(f"V{(i * 7) % 220}", f"V{(j * 7) % 220}", float(rng.randint(1, 3)))
+
+        assert dijkstra(graph, 'V0', fringe_type)[:2] == dijkstra_dense(graph, 'V0')[:2]
+        assert prim(graph, 'V0', fringe_type)[0] == prim_dense(graph, 'V0')[0]
+        assert dijkstra(graph, 'V0', 'heap', engine='vectorized')[:2] == dijkstra_dense(graph, 'V0')[:2]
+        compact = dijkstra(graph, 'V0', 'heap', compact=True)
+        dense = dijkstra(graph, 'V0', 'dense', compact=True)
+        assert list(compact.previous) == list(dense.previous)
+        assert list(prim(graph, 'V0', 'heap', compact=True).parent) == list(prim(graph, 'V0', 'dense', compact=True).parent)
+
+    def test_dense_unreachable_vertices(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_vertex('C')
+        distances, previous, _ = dijkstra(graph, 'A', 'dense')
+
+        assert distances == {'A': 0.0, 'B': 1.0, 'C': float('inf')}
+        assert previous == {'A': None, 'B': 'A', 'C': None}
+
+
+class TestVectorizedDijkstra:
+
+    def test_vectorized_matches_scalar(self):
+        graph = make_random_graph(50, 0.2, seed=5)
+        distances, previous, _ = dijkstra(graph, 'V0', 'heap')
+        vec_distances, vec_previous, history = dijkstra(graph, 'V0', 'heap', engine='vectorized')
+
+        assert vec_distances == distances
+        assert vec_previous == previous
+        assert len(history) - 1 == graph.num_vertices()
+
+    def test_vectorized_with_list_fringe(self):
+        graph = Graph(directed=False)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('B', 'C', 2.0)
+        graph.add_edge('A', 'C', 4.0)
+        distances, previous, _ = dijkstra(graph, 'A', 'list', engine='vectorized')
+
+        assert distances['C'] == 3.0
+        assert get_shortest_path('A', 'C', previous) == ['A', 'B', 'C']
+
+    def test_invalid_engine(self):
+        graph = Graph(directed=False)
+        graph.add_edge('A', 'B', 1.0)
+        with pytest.raises(ValueError):
+            dijkstra(graph, 'A', engine='simd')
+
+
+class TestDeltaStepping:
+
+    def test_matches_dijkstra(self):
+        graph = make_random_graph(80, 0.1, seed=13)
+        distances, _, _ = dijkstra(graph, 'V0', 'heap')
+        delta_distances, delta_previous, history = delta_stepping(graph, 'V0')
+
+        assert delta_distances == pytest.approx(distances)
+        # every predecessor edge lies on a shortest path
+        for v, u in delta_previous.items():
+            if u is not None:
+                assert delta_distances[v] == pytest.approx(delta_distances[u] + graph.get_weight(u, v))
+        assert sum(step['settled'] for step in history) == graph.num_vertices()
+
+    def test_explicit_delta_and_workers(self, monkeypatch):
+        graph = make_random_graph(80, 0.1, seed=17)
+        distances, _, _ = dijkstra(graph, 'V0', 'heap')
+
+        for delta in (0.5, 3.0, 100.0):
+            result, _, _ = delta_stepping(graph, 'V0', delta=delta)
+            assert result == pytest.approx(distances)
+
+        # force every frontier through the process pool
+        monkeypatch.setattr('src.algorithms.DELTA_PARALLEL_MIN_EDGES', 0)
+        result, _, _ = delta_stepping(graph, 'V0', workers=2)
+        assert result == pytest.approx(distances)
+
+    def test_unreachable_vertex(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('C', 'A', 1.0)
+        distances, previous, _ = delta_stepping(graph, 'A')
+
+        assert distances == {'A': 0.0, 'B': 1.0, 'C': float('inf')}
+        assert previous['C'] is None
+
+    def test_stale_bucket_entries_are_skipped(self):
+        # D is first filed in bucket 10 via A->D, then improves into bucket 3
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'D', 10.0)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('B', 'C', 1.0)
+        graph.add_edge('C', 'D', 1.0)
+        graph.add_edge('D', 'E', 0.0)
+        distances, previous, history = delta_stepping(graph, 'A', delta=1.0)
+
+        assert distances == {'A': 0.0, 'B': 1.0, 'C': 2.0, 'D': 3.0, 'E': 3.0}
+        assert previous['D'] == 'C'
+        assert [step['bucket'] for step in history] == [0, 1, 2, 3]
+        assert sum(step['settled'] for step in history) == 5
+
+
+class TestBoundedDijkstra:
+
+    def setup_method(self):
+        # path A--1--B--2--C--3--D plus shortcut A--5--D
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('C', 'D', 3.0)
+        self.graph.add_edge('A', 'D', 5.0)
+
+    def test_radius(self):
+        distances, previous = bounded_dijkstra(self.graph, 'A', radius=3.0)
+
+        assert distances == {'A': 0.0, 'B': 1.0, 'C': 3.0}
+        assert get_shortest_path('A', 'C', previous) == ['A', 'B', 'C']
+
+    def test_k_nearest(self):
+        distances, previous = bounded_dijkstra(self.graph, 'A', k=2)
+
+        assert distances == {'A': 0.0, 'B': 1.0}
+        assert previous == {'A': None, 'B': 'A'}
+
+    def test_unbounded_matches_dijkstra(self):
+        graph = make_random_graph(40, 0.1, seed=9)
+        full_distances, _, _ = dijkstra(graph, 'V0', 'heap')
+        distances, _ = bounded_dijkstra(graph, 'V0')
+        assert distances == full_distances
+
+        nearest, _ = bounded_dijkstra(graph, 'V0', k=10, fringe_type='list')
+        assert sorted(nearest.values()) == sorted(full_distances.values())[:10]
+
+
+class TestComponentShortCircuit:
+
+    def setup_method(self):
+        # Triangle graph A-B-C plus a separate edge D-E
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+        self.graph.add_edge('D', 'E', 1.0)
+
+    def test_shortest_path(self):
+        assert shortest_path(self.graph, 'A', 'C') == (['A', 'B', 'C'], 3.0)
+        assert shortest_path(self.graph, 'A', 'E') == (None, float('inf'))
+
+    def test_directed_weakly_connected_but_unreachable(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+        assert shortest_path(graph, 'B', 'A') == (None, float('inf'))
+        assert shortest_path(graph, 'A', 'B') == (['A', 'B'], 1.0)
+
+    def test_prim_require_spanning(self):
+        with pytest.raises(ValueError):
+            prim(self.graph, 'A', 'heap', require_spanning=True)
+
+        self.graph.add_edge('C', 'D', 3.0)
+        _, total_weight, _ = prim(self.graph, 'A', 'heap', require_spanning=True)
+        assert total_weight == 7.0
+
+
+class TestBoruvka:
+
+    def setup_method(self):
+        # Triangle graph: A--1--B--2--C, A--4--C
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+
+    def test_boruvka_triangle(self):
+        mst_edges, total_weight, history = boruvka(self.graph)
+
+        assert len(mst_edges) == 2
+        assert total_weight == 3.0
+        assert history[-1]['num_components'] == 1
+
+    def test_boruvka_matches_prim(self):
+        graph = make_random_graph(60, 0.2, seed=7)
+        _, prim_weight, _ = prim(graph, 'V0', 'heap')
+        mst_edges, total_weight, _ = boruvka(graph)
+
+        assert len(mst_edges) == graph.num_vertices() - 1
+        assert total_weight == pytest.approx(prim_weight)
+
+    def test_boruvka_parallel_matches_serial(self):
+        graph = make_random_graph(60, 0.2, seed=11)
+        serial_edges, serial_weight, _ = boruvka(graph, workers=1)
+        parallel_edges, parallel_weight, _ = boruvka(graph, workers=2)
+
+        assert sorted(parallel_edges) == sorted(serial_edges)
+        assert parallel_weight == pytest.approx(serial_weight)
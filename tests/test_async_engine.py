@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, prim, get_shortest_path
+from src.async_engine import AsyncGraphEngine, LatencyHistogram
+from tests.helpers import make_random_graph
+
+
+class TestAsyncGraphEngine:
+
+    def setup_method(self):
+        self.graph = make_random_graph(60, 0.1, seed=11)
+
+    def test_results_match(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph, workers=2) as engine:
+                return await asyncio.gather(
+                    engine.shortest_path('V0', 'V42'),
+                    engine.distances('V5'),
+                    engine.mst())
+
+        (path, distance), result, mst = asyncio.run(run())
+        distances, previous, _ = dijkstra(self.graph, 'V0', 'heap')
+        assert path == get_shortest_path('V0', 'V42', previous)
+        assert distance == distances['V42']
+        assert dict(result.distance) == dijkstra(self.graph, 'V5', 'heap')[0]
+        assert mst.total_weight == pytest.approx(prim(self.graph, 'V0', 'heap')[1])
+
+    def test_identical_requests_coalesce(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph, workers=1) as engine:
+                await asyncio.gather(*(engine.shortest_path('V0', f"V{i}") for i in range(10)))
+                return engine.stats()
+
+        stats = asyncio.run(run())
+        assert stats['computed'] == 1
+        assert stats['coalesced'] == 9
+        assert stats['latency']['shortest_path']['count'] == 10
+
+    def test_backpressure_with_small_queue(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph, workers=1, max_pending=1) as engine:
+                results = await asyncio.gather(*(engine.distances(f"V{i}") for i in range(20)))
+                return results, engine.stats()
+
+        results, stats = asyncio.run(run())
+        assert [r.source for r in results] == [f"V{i}" for i in range(20)]
+        assert stats['computed'] == 20
+        assert stats['pending'] == 0
+
+    def test_recomputes_after_mutation(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph) as engine:
+                before = await engine.shortest_path('V0', 'V59')
+                self.graph.add_edge('V0', 'V59', 0.25)
+                after = await engine.shortest_path('V0', 'V59')
+                return before, after
+
+        before, after = asyncio.run(run())
+        assert before[1] > 0.25
+        assert after == (['V0', 'V59'], 0.25)
+
+    def test_process_pool(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph, executor='process', workers=2) as engine:
+                return await engine.distances('V0'), await engine.mst('V0')
+
+        result, mst = asyncio.run(run())
+        assert dict(result.distance) == dijkstra(self.graph, 'V0', 'heap')[0]
+        assert mst.total_weight == pytest.approx(prim(self.graph, 'V0', 'heap')[1])
+
+    def test_close_fails_pending_queries(self):
+        async def run():
+            engine = AsyncGraphEngine(self.graph, workers=1, max_pending=2)
+            # running, coalesced, queued and waiting-for-room queries
+            tasks = [asyncio.ensure_future(engine.distances(v)) for v in ['V0', 'V0', 'V1', 'V2', 'V3', 'V4']]
+            await asyncio.sleep(0)
+            await engine.close()
+            return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 5)
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) and str(r) == 'engine closed' for r in results)
+
+    def test_invalid_vertex(self):
+        async def run():
+            async with AsyncGraphEngine(self.graph) as engine:
+                await engine.distances('missing')
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+    def test_mst_rejects_directed_graph(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+
+        async def run():
+            async with AsyncGraphEngine(graph) as engine:
+                await engine.mst('A')
+
+        with pytest.raises(ValueError, match="undirected"):
+            asyncio.run(run())
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.001)  # 1ms
+        histogram.record(0.5)        # 500ms
+
+        summary = histogram.summary()
+        assert summary['count'] == 100
+        assert 1.0 <= summary['p50_ms'] <= 2.0
+        assert summary['p99_ms'] <= 2.0
+        assert summary['max_ms'] == pytest.approx(500.0)
@@ -0,0 +1,57 @@
+from src.graph import Graph
+from src.algorithms import dijkstra, get_shortest_path
+from src.cache import ShortestPathCache
+
+
+class TestShortestPathCache:
+
+    def setup_method(self):
+        # Triangle graph: A--1--B--2--C, A--4--C
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+
+    def test_results_match_dijkstra(self):
+        cache = ShortestPathCache()
+        distances, previous, _ = dijkstra(self.graph, 'A', 'heap')
+
+        assert cache.distances(self.graph, 'A') == distances
+        for target in ('A', 'B', 'C'):
+            assert cache.shortest_path(self.graph, 'A', target) == get_shortest_path('A', target, previous)
+
+    def test_hits_and_misses(self):
+        cache = ShortestPathCache()
+        cache.shortest_path(self.graph, 'A', 'C')
+        cache.shortest_path(self.graph, 'A', 'B')
+        cache.distance(self.graph, 'B', 'C')
+
+        stats = cache.stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 1
+        assert stats['entries'] == 2
+
+    def test_invalidated_on_mutation(self):
+        cache = ShortestPathCache()
+        assert cache.distance(self.graph, 'A', 'C') == 3.0
+
+        self.graph.add_edge('A', 'C', 0.5)
+        assert cache.distance(self.graph, 'A', 'C') == 0.5
+        assert cache.stats()['invalidations'] == 1
+        assert len(cache) == 1
+
+    def test_lru_eviction_by_memory_budget(self):
+        cache = ShortestPathCache()
+        cache.distances(self.graph, 'A')
+        entry_bytes = cache.stats()['bytes']
+
+        cache = ShortestPathCache(max_bytes=2 * entry_bytes)
+        cache.distances(self.graph, 'A')
+        cache.distances(self.graph, 'B')
+        cache.distances(self.graph, 'A')  # A is now most recently used
+        cache.distances(self.graph, 'C')  # evicts B
+
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes'] <= 2 * entry_bytes
+        cache.distances(self.graph, 'A')
+        assert cache.stats()['hits'] == 2
@@ -0,0 +1,84 @@
+import os
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, prim
+from src.checkpoint import _Checkpointer, checkpointed_dijkstra, checkpointed_prim, resume_search
+from tests.helpers import make_random_graph
+
+
+class _Crash(Exception):
+    pass
+
+
+def crash_after(monkeypatch, saves: int) -> None:
+    # make the search die right after its n-th checkpoint is written
+    original = _Checkpointer.save
+
+    def save(self, state):
+        original(self, state)
+        if self.checkpoints == saves:
+            raise _Crash()
+
+    monkeypatch.setattr(_Checkpointer, 'save', save)
+
+
+class TestCheckpoint:
+
+    def setup_method(self):
+        self.graph = make_random_graph(120, 0.05, seed=3)
+
+    def test_prim_rejects_directed_graph(self, tmp_path):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('B', 'C', 2.0)
+        with pytest.raises(ValueError):
+            checkpointed_prim(graph, 'A', str(tmp_path / 'prim.npz'), every_steps=1)
+
+    def test_uninterrupted_run_matches_and_cleans_up(self, tmp_path):
+        path = str(tmp_path / 'search.ckpt')
+        result = checkpointed_dijkstra(self.graph, 'V0', path, every_steps=10)
+        distances, _, _ = dijkstra(self.graph, 'V0', 'heap')
+
+        assert dict(result.distance) == distances
+        assert not os.path.exists(path)
+
+    def test_resume_dijkstra(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'search.ckpt')
+        crash_after(monkeypatch, 3)
+        with pytest.raises(_Crash):
+            checkpointed_dijkstra(self.graph, 'V0', path, every_steps=25)
+        assert os.path.exists(path)
+        monkeypatch.undo()
+
+        result = resume_search(self.graph, path)
+        distances, previous, _ = dijkstra(self.graph, 'V0', 'heap')
+        assert dict(result.distance) == distances
+        assert dict(result.previous) == previous
+        assert not os.path.exists(path)
+
+    def test_resume_prim(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'search.ckpt')
+        crash_after(monkeypatch, 2)
+        with pytest.raises(_Crash):
+            checkpointed_prim(self.graph, 'V0', path, every_steps=30)
+        monkeypatch.undo()
+
+        result = resume_search(self.graph, path, every_steps=30)
+        _, total_weight, _ = prim(self.graph, 'V0', 'heap')
+        assert len(result.edges) == self.graph.num_vertices() - 1
+        assert result.total_weight == pytest.approx(total_weight)
+
+    def test_rejects_changed_graph(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'search.ckpt')
+        crash_after(monkeypatch, 1)
+        with pytest.raises(_Crash):
+            checkpointed_dijkstra(self.graph, 'V0', path, every_steps=10)
+        monkeypatch.undo()
+
+        self.graph.add_edge('V0', 'V100', 0.5)
+        with pytest.raises(ValueError):
+            resume_search(self.graph, path)
+
+    def test_interval_required(self, tmp_path):
+        with pytest.raises(ValueError):
+            checkpointed_dijkstra(self.graph, 'V0', str(tmp_path / 'search.ckpt'))
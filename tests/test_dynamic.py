@@ -0,0 +1,138 @@
+import random
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, minimum_spanning_forest
+from src.dynamic import DynamicShortestPaths, IncrementalMST
+
+
+def assert_matches_dijkstra(dsp: DynamicShortestPaths):
+    distances, _, _ = dijkstra(dsp.graph, dsp.source, 'heap')
+    assert dsp.distance == pytest.approx(distances)
+    # every tree edge lies on a shortest path
+    for vertex, parent in dsp.previous.items():
+        if parent is not None:
+            weight = dsp.graph.get_weight(parent, vertex)
+            assert dsp.distance[vertex] == pytest.approx(dsp.distance[parent] + weight)
+
+
+class TestDynamicShortestPaths:
+
+    def setup_method(self):
+        # Triangle graph: A--1--B--2--C, A--4--C
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+
+    def test_insertion_shortens_paths(self):
+        dsp = DynamicShortestPaths(self.graph, 'A')
+        dsp.add_edge('A', 'D', 1.0)
+        dsp.add_edge('D', 'C', 0.5)
+
+        assert dsp.distance['C'] == 1.5
+        assert dsp.shortest_path('C') == ['A', 'D', 'C']
+
+    def test_increase_and_removal_of_tree_edge(self):
+        dsp = DynamicShortestPaths(self.graph, 'A')
+        dsp.add_edge('A', 'B', 10.0)
+        assert dsp.distance['C'] == 4.0
+        assert dsp.distance['B'] == 6.0
+
+        dsp.remove_edge('A', 'C')
+        assert dsp.shortest_path('C') == ['A', 'B', 'C']
+        assert dsp.distance['C'] == 12.0
+
+    def test_outside_changes_update_distances(self):
+        graph = Graph(directed=False)
+        graph.add_edge('A', 'C', 2.0)
+        graph.add_edge('C', 'B', 3.0)
+        dsp = DynamicShortestPaths(graph, 'A')
+        assert dsp.distance['B'] == 5.0
+
+        graph.add_edge('A', 'B', 1.0)  # bypasses dsp.add_edge
+        assert dsp.distance['B'] == 1.0
+        assert dsp.previous['B'] == 'A'
+
+        graph.add_edge('B', 'D', 1.0)
+        assert dsp.previous['D'] == 'B'
+        assert_matches_dijkstra(dsp)
+
+    def test_self_loop_updates(self):
+        dsp = DynamicShortestPaths(self.graph, 'A')
+        dsp.add_edge('B', 'B', 0.5)
+        dsp.remove_edge('B', 'B')
+
+        assert not self.graph.has_edge('B', 'B')
+        assert_matches_dijkstra(dsp)
+        dsp.remove_edge('A', 'B')
+        assert_matches_dijkstra(dsp)
+
+    @pytest.mark.parametrize('directed', [False, True])
+    def test_random_updates_match_rerun(self, directed):
+        rng = random.Random(21)
+        graph = Graph(directed=directed)
+        for _ in range(120):
+            u, v = rng.sample(range(30), 2)
+            graph.add_edge(f"V{u}", f"V{v}", rng.uniform(1.0, 10.0))
+        graph.add_vertex('V0')
+        dsp = DynamicShortestPaths(graph, 'V0')
+
+        for _ in range(60):
+            u, v = (f"V{i}" for i in rng.sample(range(30), 2))
+            if graph.has_edge(u, v) and rng.random() < 0.3:
+                dsp.remove_edge(u, v)
+            else:
+                dsp.add_edge(u, v, rng.uniform(0.5, 12.0))
+            assert_matches_dijkstra(dsp)
+
+
+class TestIncrementalMST:
+
+    def setup_method(self):
+        # Triangle graph: A--1--B--2--C, A--4--C
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+
+    def test_cheaper_edge_replaces_heaviest_on_cycle(self):
+        mst = IncrementalMST(self.graph)
+        assert mst.total_weight == 3.0
+
+        mst.add_edge('A', 'C', 0.5)
+        assert mst.total_weight == 1.5
+        assert sorted(mst.edges()) == [('A', 'B', 1.0), ('A', 'C', 0.5)]
+
+    def test_outside_changes_update_total_weight(self):
+        graph = Graph(directed=False)
+        graph.add_edge('A', 'B', 5.0)
+        graph.add_edge('B', 'C', 5.0)
+        mst = IncrementalMST(graph)
+        assert mst.total_weight == 10.0
+
+        graph.add_edge('A', 'C', 1.0)  # bypasses mst.add_edge
+        assert mst.total_weight == 6.0
+
+    def test_new_vertices_join_forest(self):
+        mst = IncrementalMST(self.graph)
+        mst.add_edge('D', 'E', 2.0)
+        assert mst.num_components() == 2
+
+        mst.add_edge('C', 'D', 7.0)
+        assert mst.num_components() == 1
+        assert mst.total_weight == 12.0
+
+    def test_random_insertions_match_recomputation(self):
+        rng = random.Random(5)
+        graph = Graph(directed=False)
+        for i in range(1, 40):
+            graph.add_edge(f"V{rng.randrange(i)}", f"V{i}", rng.uniform(1.0, 10.0))
+        mst = IncrementalMST(graph)
+
+        for _ in range(150):
+            u, v = rng.sample(range(45), 2)
+            mst.add_edge(f"V{u}", f"V{v}", rng.uniform(0.5, 10.0))
+
+            _, weights, _ = minimum_spanning_forest(graph, 'heap', record_history=False)
+            assert mst.total_weight == pytest.approx(sum(weights))
+            assert mst.num_components() == len(weights)
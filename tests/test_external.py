@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, get_shortest_path
+from src.external import BlockedCSRGraph, external_dijkstra
+from src.results import id_dtype
+from tests.helpers import make_random_graph
+
+
+class TestExternalDijkstra:
+
+    def setup_method(self):
+        self.graph = make_random_graph(300, 0.02, seed=7)
+
+    def test_matches_in_memory_dijkstra(self, tmp_path):
+        # cap fits only a few 32-vertex blocks, so blocks get evicted
+        blocked = BlockedCSRGraph.from_csr(self.graph.to_csr(), str(tmp_path), block_size=32,
+                                           memory_limit=16 * 1024)
+        distances, previous, _ = dijkstra(self.graph, 'V0', 'heap')
+        result = external_dijkstra(blocked, 'V0')
+
+        assert dict(result.distance) == pytest.approx(distances)
+        for target in ('V1', 'V150', 'V299'):
+            assert result.path(target) == get_shortest_path('V0', target, previous)
+
+        stats = blocked.stats()
+        assert stats['evictions'] > 0
+        assert stats['resident_bytes'] <= blocked.memory_limit
+        assert stats['blocks_read'] + stats['hits'] == self.graph.num_vertices()
+
+    def test_hit_ratio_with_everything_resident(self, tmp_path):
+        blocked = BlockedCSRGraph.from_csr(self.graph.to_csr(), str(tmp_path), block_size=32)
+        external_dijkstra(blocked, 'V0')
+
+        stats = blocked.stats()
+        assert stats['blocks_read'] == blocked.num_blocks()
+        assert stats['evictions'] == 0
+        assert stats['hit_ratio'] > 0.9
+
+    def test_directed_and_unreachable(self, tmp_path):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 2.0)
+        graph.add_edge('B', 'C', 1.0)
+        graph.add_vertex('D')
+        blocked = BlockedCSRGraph.from_csr(graph.to_csr(), str(tmp_path), block_size=2)
+        result = external_dijkstra(blocked, 'A')
+
+        assert blocked.directed
+        assert result.distance['C'] == 3.0
+        assert result.distance['D'] == float('inf')
+        assert result.path('D') is None
+
+    def test_memory_limit_below_block_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            BlockedCSRGraph.from_csr(self.graph.to_csr(), str(tmp_path), block_size=64, memory_limit=64)
+
+    def test_index_width_follows_vertex_count(self, tmp_path):
+        BlockedCSRGraph.from_csr(self.graph.to_csr(), str(tmp_path))
+        assert np.load(str(tmp_path / 'indices.npy'), mmap_mode='r').dtype == np.int32
+        # ids of 2 ** 31 or more vertices would wrap around in int32
+        assert id_dtype(2 ** 31 - 1) == np.int32
+        assert id_dtype(2 ** 31) == np.int64
+
+    def test_invalid_source(self, tmp_path):
+        blocked = BlockedCSRGraph.from_csr(self.graph.to_csr(), str(tmp_path))
+        with pytest.raises(ValueError):
+            external_dijkstra(blocked, 'missing')
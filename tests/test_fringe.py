@@ -42,6 +42,39 @@ class TestBinaryHeap(unittest.TestCase):
         self.assertEqual(key, "A")
         self.assertEqual(priority, 2.0)
 
+    def test_from_items(self):
+        items = [("A", 5.0), ("B", 3.0), ("C", 8.0), ("D", 1.0), ("E", 4.0)]
+        heap = BinaryHeap.from_items(items)
+        self.assertEqual(heap.size(), 5)
+
+        heap.decrease_key("C", 2.0)
+        order = [heap.extract_min()[0] for _ in range(5)]
+        self.assertEqual(order, ["D", "C", "B", "E", "A"])
+
+        with self.assertRaises(ValueError):
+            BinaryHeap.from_items([("A", 1.0), ("A", 2.0)])
+
+    def test_ties_follow_order(self):
+        rank = {"C": 0, "A": 1, "B": 2, "D": 3}
+        for fringe in (BinaryHeap(rank), SortedLinkedList(rank)):
+            for key in ("D", "B", "A", "C"):
+                fringe.insert(key, 1.0)
+            self.assertEqual([fringe.extract_min()[0] for _ in range(4)], ["C", "A", "B", "D"])
+
+        heap = BinaryHeap(range(4))
+        for key in (3, 1, 2, 0):
+            heap.insert(key, 1.0)
+        self.assertEqual([heap.extract_min()[0] for _ in range(4)], [0, 1, 2, 3])
+
+    def test_ties_without_order_follow_insertion(self):
+        # keys need not be comparable with each other
+        for fringe in (BinaryHeap(), SortedLinkedList()):
+            for key in ("x", 3, "a", 1):
+                fringe.insert(key, 1.0)
+            fringe.decrease_key(1, 1.0)  # keeps its place
+            fringe.insert(None, 0.5)
+            self.assertEqual([fringe.extract_min()[0] for _ in range(5)], [None, "x", 3, "a", 1])
+
 
 class TestSortedLinkedList(unittest.TestCase):
     def test_insert_and_extract(self):
@@ -52,6 +52,110 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(g.num_vertices(), 4)
         self.assertEqual(g.num_edges(), 3)
 
+    def test_remove_edge(self):
+        g = Graph(directed=False)
+        g.add_edge("A", "B", 1.0)
+        g.add_edge("B", "C", 2.0)
+        version = g.version
+
+        g.remove_edge("B", "A")
+        self.assertFalse(g.has_edge("A", "B"))
+        self.assertFalse(g.has_edge("B", "A"))
+        self.assertEqual(g.num_edges(), 1)
+        self.assertGreater(g.version, version)
+        with self.assertRaises(ValueError):
+            g.remove_edge("A", "B")
+
+    def test_remove_self_loop(self):
+        for directed in (False, True):
+            g = Graph(directed=directed)
+            g.add_edge("A", "A", 1.0)
+            g.add_edge("A", "B", 2.0)
+
+            g.remove_edge("A", "A")
+            self.assertFalse(g.has_edge("A", "A"))
+            self.assertTrue(g.has_edge("A", "B"))
+
+    def test_component_index(self):
+        g = Graph(directed=False)
+        g.add_edge("A", "B", 1.0)
+        g.add_edge("C", "D", 1.0)
+        self.assertFalse(g.same_component("A", "C"))
+        self.assertEqual(g.num_components(), 2)
+
+        g.add_edge("B", "C", 1.0)
+        self.assertTrue(g.same_component("A", "D"))
+        self.assertEqual(g.num_components(), 1)
+
+        g.remove_edge("B", "C")
+        self.assertFalse(g.same_component("A", "D"))
+        self.assertEqual(g.num_components(), 2)
+
+    def test_strongly_connected(self):
+        g = Graph(directed=True)
+        g.add_edge("A", "B", 1.0)
+        g.add_edge("B", "C", 1.0)
+        self.assertTrue(g.same_component("A", "C"))
+        self.assertFalse(g.strongly_connected("A", "C"))
+
+        g.add_edge("C", "A", 1.0)
+        self.assertTrue(g.strongly_connected("A", "C"))
+        self.assertTrue(g.strongly_connected("B", "A"))
+
+    def test_to_matrix(self):
+        g = Graph(directed=False)
+        g.add_edge("A", "B", 2.0)
+        g.add_vertex("C")
+
+        vertices, matrix = g.to_matrix()
+        a, b, c = (vertices.index(v) for v in ("A", "B", "C"))
+        self.assertEqual(matrix[a, b], 2.0)
+        self.assertEqual(matrix[b, a], 2.0)
+        self.assertEqual(matrix[a, c], float('inf'))
+
+    def test_to_csr(self):
+        g = Graph(directed=False)
+        g.add_edge("A", "B", 2.0)
+        g.add_edge("A", "C", 3.0)
+
+        csr = g.to_csr()
+        neighbors, weights = csr.neighbors(csr.index["A"])
+        self.assertEqual(sorted(csr.vertices[i] for i in neighbors), ["B", "C"])
+        self.assertEqual(sorted(weights.tolist()), [2.0, 3.0])
+        self.assertEqual(csr.num_edges(), 4)
+
+    def test_vertex_order_is_read_only(self):
+        g = Graph(directed=False)
+        g.add_edge("B", "A", 1.0)
+        order = g.vertex_order()
+        self.assertEqual(dict(order), {"B": 0, "A": 1})
+        with self.assertRaises(TypeError):
+            order["C"] = 2
+
+        g.add_vertex("C")
+        self.assertEqual(order["C"], 2)
+
+    def test_topology_fingerprint(self):
+        g1 = Graph(directed=False)
+        g1.add_edge('A', 'B', 1.0)
+        g1.add_edge('B', 'C', 2.0)
+        g2 = Graph(directed=False)
+        g2.add_edge('C', 'B', 5.0)
+        g2.add_edge('B', 'A', 3.0)
+
+        self.assertEqual(g1.topology_fingerprint(), g2.topology_fingerprint())
+        g2.add_edge('A', 'C', 1.0)
+        self.assertNotEqual(g1.topology_fingerprint(), g2.topology_fingerprint())
+
+    def test_snapshot_invalidated_on_mutation(self):
+        g = Graph(directed=False)
+        g.add_edge("A", "B", 1.0)
+        _, sources, _, _ = g.to_edge_arrays()
+        self.assertIs(g.to_edge_arrays()[1], sources)
+
+        g.add_edge("B", "C", 1.0)
+        self.assertEqual(len(g.to_edge_arrays()[1]), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
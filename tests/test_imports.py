@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(statement: str) -> set:
+    # top-level packages in sys.modules after running statement in a fresh
+    # interpreter
+    completed = subprocess.run(
+        [sys.executable, '-c', f"{statement}; import sys; print(' '.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    return {name.split('.')[0] for name in completed.stdout.split()}
+
+
+@pytest.mark.parametrize('module', ['src.graph', 'src.fringe', 'src.algorithms', 'src.ui'])
+def test_core_modules_do_not_load_plotting(module):
+    assert not loaded_modules(f"import {module}") & {'matplotlib', 'networkx', 'PIL'}
+
+
+def test_visualizer_uses_headless_backend():
+    completed = subprocess.run(
+        [sys.executable, '-c', "import src.visualizer, matplotlib; print(matplotlib.get_backend())"],
+        cwd=ROOT, capture_output=True, text=True, check=True, env={**os.environ, 'MPLBACKEND': ''})
+    assert completed.stdout.strip().lower() == 'agg'
@@ -0,0 +1,36 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.link_cut_tree import LinkCutTree
+
+
+class TestLinkCutTree(unittest.TestCase):
+    def test_link_and_connected(self):
+        tree = LinkCutTree()
+        a, b, c = (tree.add_node() for _ in range(3))
+        tree.link(a, b)
+
+        self.assertTrue(tree.connected(a, b))
+        self.assertFalse(tree.connected(a, c))
+        with self.assertRaises(ValueError):
+            tree.link(b, a)
+
+    def test_path_max_and_cut(self):
+        # path 0 - 1 - 2 - 3 with values on the nodes
+        tree = LinkCutTree()
+        nodes = [tree.add_node(value) for value in (1.0, 5.0, 2.0, 3.0)]
+        for x, y in zip(nodes, nodes[1:]):
+            tree.link(x, y)
+
+        self.assertEqual(tree.path_max(nodes[0], nodes[3]), nodes[1])
+        self.assertEqual(tree.path_max(nodes[2], nodes[3]), nodes[3])
+
+        tree.cut(nodes[1], nodes[2])
+        self.assertFalse(tree.connected(nodes[0], nodes[3]))
+        self.assertEqual(tree.path_max(nodes[3], nodes[2]), nodes[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
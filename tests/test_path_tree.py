@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, get_shortest_path
+from src.path_tree import ShortestPathTree
+
+
+class TestShortestPathTree:
+
+    def setup_method(self):
+        # tree from A: A-B-C-D chain with E hanging off B, F unreachable
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 1.0)
+        self.graph.add_edge('C', 'D', 1.0)
+        self.graph.add_edge('B', 'E', 2.0)
+        self.graph.add_edge('A', 'E', 5.0)
+        self.graph.add_vertex('F')
+        distance, self.previous, _ = dijkstra(self.graph, 'A', 'heap')
+        self.tree = ShortestPathTree.from_dijkstra('A', distance, self.previous)
+
+    def test_bulk_paths_match_get_shortest_path(self):
+        targets = ['D', 'A', 'E', 'C', 'F', 'B']
+        paths = self.tree.paths(targets)
+
+        for target in targets:
+            assert paths[target] == get_shortest_path('A', target, self.previous)
+
+    def test_depth_and_subtree_sizes(self):
+        depth = self.tree.depth()
+        sizes = self.tree.subtree_sizes()
+        index = self.tree.index
+
+        assert [int(depth[index[v]]) for v in 'ABCDEF'] == [0, 1, 2, 3, 2, -1]
+        assert [int(sizes[index[v]]) for v in 'ABCDEF'] == [5, 4, 2, 1, 1, 0]
+
+    def test_depth_of_detached_chains(self):
+        # c <-> d is a predecessor cycle and e hangs off it; none reach S
+        predecessors = np.array([-1, 0, 1, 4, 3, 3])
+        tree = ShortestPathTree(list('Sabcde'), predecessors, np.zeros(6), 'S')
+        assert tree.depth().tolist() == [0, 1, 2, -1, -1, -1]
+
+        # a long path, deeper than any recursion limit
+        n = 5000
+        chain = ShortestPathTree([f"V{i}" for i in range(n)], np.arange(-1, n - 1), np.zeros(n), 'V0')
+        assert chain.depth().tolist() == list(range(n))
+
+    def test_save_and_load(self, tmp_path):
+        filename = str(tmp_path / 'tree.npy')
+        self.tree.save(filename)
+        loaded = ShortestPathTree.load(filename)
+
+        assert loaded.source == 'A'
+        assert loaded.path('D') == ['A', 'B', 'C', 'D']
+        assert loaded.distances.tolist() == pytest.approx(self.tree.distances.tolist())
@@ -0,0 +1,70 @@
+import random
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, prim, get_shortest_path
+from src.results import ShortestPathResult, MSTResult
+
+
+def make_graph(seed: int) -> Graph:
+    rng = random.Random(seed)
+    graph = Graph(directed=False)
+    for i in range(1, 30):
+        graph.add_edge(f"V{rng.randrange(i)}", f"V{i}", rng.uniform(1.0, 10.0))
+    for _ in range(40):
+        u, v = rng.sample(range(30), 2)
+        graph.add_edge(f"V{u}", f"V{v}", rng.uniform(1.0, 10.0))
+    graph.add_vertex("isolated")
+    return graph
+
+
+class TestShortestPathResult:
+
+    @pytest.mark.parametrize('fringe_type, engine', [
+        ('heap', 'scalar'), ('list', 'scalar'), ('heap', 'vectorized'), ('dense', 'scalar')
+    ])
+    def test_reads_like_dicts(self, fringe_type, engine):
+        graph = make_graph(1)
+        distances, previous, _ = dijkstra(graph, 'V0', 'heap')
+        result = dijkstra(graph, 'V0', fringe_type, engine=engine, compact=True)
+
+        assert isinstance(result, ShortestPathResult)
+        assert result.distance == distances
+        assert result.previous == previous
+        assert result.previous['isolated'] is None
+        assert result.path('V7') == get_shortest_path('V0', 'V7', previous)
+
+    def test_unpacks_like_tuple(self):
+        graph = make_graph(2)
+        distances, previous, history = dijkstra(graph, 'V0', 'heap', compact=True)
+
+        assert distances['V0'] == 0.0
+        assert get_shortest_path('V0', 'V5', previous)[0] == 'V0'
+        assert history == []
+
+    def test_shares_vertex_labels_with_snapshot(self):
+        # a result owns only its distance (8 bytes) and previous (4 bytes)
+        # arrays; vertex labels and ids belong to the graph's CSR snapshot
+        graph = make_graph(4)
+        csr = graph.to_csr()
+        for result in (dijkstra(graph, 'V0', 'heap', compact=True), prim(graph, 'V0', 'heap', compact=True)):
+            assert result.vertices is csr.vertices
+            assert result.index is csr.index
+            assert result.nbytes() == 12 * graph.num_vertices()
+
+
+class TestMSTResult:
+
+    @pytest.mark.parametrize('fringe_type', ['heap', 'list', 'dense'])
+    def test_matches_prim(self, fringe_type):
+        graph = make_graph(3)
+        mst_edges, total_weight, _ = prim(graph, 'V0', 'heap')
+        result = prim(graph, 'V0', fringe_type, compact=True)
+
+        assert isinstance(result, MSTResult)
+        assert sorted(result.edges) == sorted(mst_edges)
+        assert result.total_weight == pytest.approx(total_weight)
+
+        edges, weight, history = result
+        assert len(edges) == len(mst_edges)
+        assert edges == list(edges)
+        assert history == []
@@ -0,0 +1,115 @@
+import os
+import signal
+import socket
+import time
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, prim, get_shortest_path
+from src.server import QueryHandler, GraphServer, GraphClient, run_load, load_edge_list
+from tests.helpers import make_random_graph
+
+
+class TestQueryHandler:
+
+    def setup_method(self):
+        self.graph = Graph(directed=False)
+        self.graph.add_edge('A', 'B', 1.0)
+        self.graph.add_edge('B', 'C', 2.0)
+        self.graph.add_edge('A', 'C', 4.0)
+        self.graph.add_vertex('D')
+        self.handler = QueryHandler(self.graph)
+
+    def test_queries(self):
+        response = self.handler.handle({'id': 1, 'op': 'path', 'source': 'A', 'target': 'C'})
+        assert response == {'id': 1, 'ok': True, 'result': {'path': ['A', 'B', 'C'], 'distance': 3.0}}
+
+        distances = self.handler.handle({'op': 'dijkstra', 'source': 'A'})['result']
+        assert distances == {'A': 0.0, 'B': 1.0, 'C': 3.0, 'D': None}
+
+        matrix = self.handler.handle({'op': 'distance_matrix', 'sources': ['A', 'C'], 'targets': ['B', 'D']})
+        assert matrix['result'] == [[1.0, None], [2.0, None]]
+
+        mst = self.handler.handle({'op': 'prim', 'start': 'A'})['result']
+        assert mst['total_weight'] == 3.0
+
+    def test_errors(self):
+        assert self.handler.handle({'op': 'path', 'source': 'A', 'target': 'Z'})['ok'] is False
+        assert self.handler.handle({'op': 'dijkstra'})['ok'] is False
+        assert self.handler.handle({'op': 'explode'})['ok'] is False
+        assert self.handler.handle({'op': 'distance_matrix', 'sources': 'AB'})['ok'] is False
+        assert self.handler.handle({'op': 'distance_matrix', 'sources': ['A'], 'targets': 'B'})['ok'] is False
+
+    def test_load_edge_list(self, tmp_path):
+        path = tmp_path / 'edges.txt'
+        path.write_text("# triangle\nA B 1.0\nB C 2.0\n\nA C 4.0\n")
+        graph = load_edge_list(str(path))
+        assert graph.num_edges() == 3
+        assert graph.get_weight('C', 'A') == 4.0
+
+
+class TestGraphServer:
+
+    def setup_method(self):
+        self.graph = make_random_graph(80, 0.05, seed=5)
+
+    def test_tcp_round_trip(self):
+        distances, previous, _ = dijkstra(self.graph, 'V0', 'heap')
+        with GraphServer(self.graph, workers=2) as server:
+            with GraphClient(server.address) as client:
+                assert client.request('ping') == 'pong'
+                result = client.request('path', source='V0', target='V70')
+                assert result['path'] == get_shortest_path('V0', 'V70', previous)
+                assert result['distance'] == pytest.approx(distances['V70'])
+                assert client.request('prim', start='V0')['total_weight'] == \
+                    pytest.approx(prim(self.graph, 'V0', 'heap')[1])
+                with pytest.raises(ValueError):
+                    client.request('path', source='V0', target='missing')
+
+    def test_unix_socket_load(self, tmp_path):
+        path = str(tmp_path / 'graph.sock')
+        requests = [{'op': 'path', 'source': f"V{i % 4}", 'target': f"V{i}"} for i in range(40)]
+        with GraphServer(self.graph, unix_path=path, workers=2) as server:
+            report = run_load(server.address, requests, concurrency=2)
+        assert not os.path.exists(path)
+        assert report['requests'] == 40
+        assert report['errors'] == 0
+        assert report['p99_ms'] >= report['p50_ms'] > 0
+
+    def test_bad_requests_do_not_kill_workers(self):
+        with GraphServer(Graph(directed=False), workers=1) as server:
+            with GraphClient(server.address, timeout=5.0) as client:
+                with pytest.raises(ValueError):
+                    client.request('prim')  # empty graph, no start vertex
+                assert client.request('ping') == 'pong'
+
+            # deeply nested JSON
+            with socket.create_connection(server.address, timeout=5.0) as raw, raw.makefile('rb') as reader:
+                raw.sendall(b'[' * 100000 + b']' * 100000 + b'\n')
+                assert b'"ok": false' in reader.readline()
+                raw.sendall(b'{"op": "ping", "id": 1}\n')
+                assert b'pong' in reader.readline()
+            assert server.respawns == 0
+
+    def test_crashed_worker_is_replaced(self):
+        with GraphServer(self.graph, workers=1) as server:
+            os.kill(server.worker_pids()[0], signal.SIGKILL)
+            deadline = time.time() + 5
+            while server.respawns == 0 and time.time() < deadline:
+                time.sleep(0.05)
+            assert server.respawns == 1
+            with GraphClient(server.address, timeout=5.0) as client:
+                assert client.request('ping') == 'pong'
+
+            # forked by the supervisor process, not by this (threaded) one
+            with pytest.raises(ChildProcessError):
+                os.waitpid(server.worker_pids()[0], os.WNOHANG)
+
+    def test_crash_loop_stops_the_server(self):
+        class CrashingServer(GraphServer):
+            MAX_RESPAWNS = 3
+
+            def _worker(self):
+                os._exit(1)
+
+        with CrashingServer(self.graph, workers=2) as server:
+            assert server.wait() == 1
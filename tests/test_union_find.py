@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.union_find import UnionFind
+
+
+class TestUnionFind(unittest.TestCase):
+    def test_initial_singletons(self):
+        uf = UnionFind(4)
+        self.assertEqual(uf.num_sets(), 4)
+        self.assertFalse(uf.connected(0, 1))
+
+    def test_union_and_connected(self):
+        uf = UnionFind(5)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(1, 2))
+        self.assertFalse(uf.union(0, 2))
+
+        self.assertTrue(uf.connected(0, 2))
+        self.assertFalse(uf.connected(0, 3))
+        self.assertEqual(uf.num_sets(), 3)
+
+    def test_add_grows_sets(self):
+        uf = UnionFind()
+        a = uf.add()
+        b = uf.add()
+        self.assertEqual((a, b), (0, 1))
+        self.assertEqual(uf.num_sets(), 2)
+
+        uf.union(a, b)
+        self.assertEqual(uf.add(), 2)
+        self.assertEqual(uf.num_sets(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,430 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import random
+import time
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from src.graph import Graph
+from PIL import Image
+from src.algorithms import dijkstra, prim
+from src.visualizer import (LayoutCache, GifStreamWriter, FrameRenderer, create_dijkstra_animation,
+                            create_prim_animation, dijkstra_step_view, draw_graph, get_layout,
+                            sample_steps, force_layout, FAST_LAYOUT_THRESHOLD, ApngStreamWriter,
+                            FrameSequenceWriter, NEAR_FIELD_CAP, _grid_pairs)
+from src import visualizer
+
+
+def make_graph() -> Graph:
+    graph = Graph(directed=False)
+    graph.add_edge('A', 'B', 4.0)
+    graph.add_edge('A', 'C', 2.0)
+    graph.add_edge('B', 'C', 1.0)
+    graph.add_edge('B', 'D', 5.0)
+    graph.add_edge('D', 'E', 2.0)
+    return graph
+
+
+class TestLayoutCache:
+
+    def test_same_topology_reuses_layout(self):
+        cache = LayoutCache()
+        first = cache.get(make_graph())
+
+        # same vertices and edges, different insertion order and weights
+        other = Graph(directed=False)
+        for u, v, _ in reversed(make_graph().get_edges()):
+            other.add_edge(v, u, 1.0)
+        second = cache.get(other)
+
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+        for vertex in first:
+            assert np.array_equal(first[vertex], second[vertex])
+
+    def test_disk_cache(self, tmp_path):
+        first = LayoutCache(cache_dir=str(tmp_path)).get(make_graph())
+
+        cache = LayoutCache(cache_dir=str(tmp_path))
+        second = cache.get(make_graph())
+        assert cache.stats()['disk_hits'] == 1
+        assert cache.stats()['misses'] == 0
+        for vertex in first:
+            assert np.allclose(first[vertex], second[vertex])
+
+    def test_warm_start_after_edit(self):
+        cache = LayoutCache()
+        graph = make_graph()
+        cache.get(graph)
+
+        graph.add_edge('E', 'F', 1.0)
+        pos = cache.get(graph)
+        assert cache.stats()['warm_starts'] == 1
+        assert set(pos) == set('ABCDEF')
+
+    def test_positions_are_read_only(self):
+        cache = LayoutCache()
+        pos = cache.get(make_graph())
+        with pytest.raises(ValueError):
+            pos['A'][0] = 5.0
+        pos['A'] = np.zeros(2)  # the dict itself is the caller's
+        assert not np.array_equal(cache.get(make_graph())['A'], np.zeros(2))
+
+    def test_warm_layouts_keyed_by_history(self):
+        cache = LayoutCache()
+        graph = make_graph()
+        cache.get(graph)
+        graph.add_edge('E', 'F', 1.0)
+        warm = cache.get(graph)
+
+        # the same topology without history gets the cold layout
+        fresh = make_graph()
+        fresh.add_edge('E', 'F', 1.0)
+        cold = cache.get(fresh)
+        assert cache.stats()['misses'] == 3
+        expected = LayoutCache().get(fresh)
+        assert all(np.array_equal(cold[v], expected[v]) for v in expected)
+        assert any(not np.array_equal(cold[v], warm[v]) for v in warm)
+
+        # while the edited graph keeps its own
+        again = cache.get(graph)
+        assert all(np.array_equal(again[v], warm[v]) for v in warm)
+
+    def test_draw_graph_uses_cache(self):
+        graph = make_graph()
+        _, _, pos = draw_graph(graph)
+        _, _, again = draw_graph(graph)
+        for vertex in pos:
+            assert np.array_equal(pos[vertex], again[vertex])
+        plt.close('all')
+
+
+class TestForceLayout:
+
+    def make_grid(self, side: int, reverse: bool = False) -> Graph:
+        edges = []
+        for a in range(side):
+            for b in range(side):
+                if a + 1 < side:
+                    edges.append((f"{a}_{b}", f"{a + 1}_{b}"))
+                if b + 1 < side:
+                    edges.append((f"{a}_{b}", f"{a}_{b + 1}"))
+        graph = Graph(directed=False)
+        for u, v in reversed(edges) if reverse else edges:
+            graph.add_edge(u, v, 1.0)
+        return graph
+
+    def test_deterministic_and_scaled(self):
+        first = force_layout(self.make_grid(10).to_csr())
+        second = force_layout(self.make_grid(10, reverse=True).to_csr())
+
+        assert first.keys() == second.keys()
+        for vertex in first:
+            assert np.array_equal(first[vertex], second[vertex])
+        coordinates = np.array(list(first.values()))
+        assert np.abs(coordinates).max() == pytest.approx(1.0)
+        assert len(np.unique(coordinates.round(6), axis=0)) == len(coordinates)
+
+    def test_directed_edges_both_ways_match_undirected(self):
+        undirected = self.make_grid(6)
+        directed = Graph(directed=True)
+        for u, v, w in undirected.get_edges():
+            directed.add_edge(u, v, w)
+            directed.add_edge(v, u, w)
+
+        assert directed.topology_fingerprint() == undirected.topology_fingerprint()
+        first = force_layout(undirected.to_csr())
+        second = force_layout(directed.to_csr())
+        assert all(np.array_equal(first[v], second[v]) for v in first)
+
+    def test_neighbors_end_up_closer_than_strangers(self):
+        pos = force_layout(self.make_grid(12).to_csr())
+        edge = np.mean([np.linalg.norm(pos[f"{a}_{b}"] - pos[f"{a + 1}_{b}"])
+                        for a in range(11) for b in range(12)])
+        # mean distance over all pairs; a single pair such as the corners
+        # depends on how the seeded layout happens to fold
+        coordinates = np.array(list(pos.values()))
+        strangers = np.linalg.norm(coordinates[:, None] - coordinates[None], axis=2).sum()
+        strangers /= len(coordinates) * (len(coordinates) - 1)
+        assert strangers > 3 * edge
+
+    def test_layout_cache_uses_it_for_large_graphs(self):
+        side = int(np.ceil(np.sqrt(FAST_LAYOUT_THRESHOLD)))
+        graph = self.make_grid(side)
+        cache = LayoutCache()
+        pos = cache.get(graph)
+        expected = force_layout(graph.to_csr())
+        assert all(np.array_equal(pos[v], expected[v]) for v in expected)
+
+        # an edit warm-starts from the previous layout
+        graph.add_edge('0_0', 'extra', 1.0)
+        assert len(cache.get(graph)) == side * side + 1
+        assert cache.stats()['warm_starts'] == 1
+
+    def test_pairs_are_bounded_per_vertex(self):
+        # small cells pair every adjacent vertex exactly once; a crowded cell
+        # pairs each vertex with at most NEAR_FIELD_CAP others per cell
+        cells = np.array([0, 0, 1, 3, 3, 3])
+        i, j, weight = _grid_pairs(cells, 2)
+        assert sorted(zip(i.tolist(), j.tolist())) == [
+            (a, b) for a in range(6) for b in range(a + 1, 6)]
+        assert np.all(weight == 1.0)
+
+        n = 1000
+        i, j, weight = _grid_pairs(np.zeros(n, dtype=np.int64), 4)
+        assert len(i) == n * NEAR_FIELD_CAP
+        assert len(set(zip(np.minimum(i, j).tolist(), np.maximum(i, j).tolist()))) == len(i)
+        # every vertex still feels the other n - 1 on average
+        assert np.bincount(np.concatenate([i, j]), np.concatenate([weight, weight])) == pytest.approx(n - 1)
+
+    def test_outliers_do_not_blow_up_the_near_field(self, monkeypatch):
+        # a random connected core plus isolated vertices: the isolated ones
+        # drift far out and would otherwise crowd the core into a few cells
+        rng = random.Random(0)
+        graph = Graph(directed=False)
+        for vertex in range(1, 2000):
+            graph.add_edge(f"V{vertex}", f"V{rng.randrange(vertex)}", 1.0)
+        for _ in range(2000):
+            u, v = rng.sample(range(2000), 2)
+            graph.add_edge(f"V{u}", f"V{v}", 1.0)
+        for vertex in range(20):
+            graph.add_vertex(f"iso{vertex}")
+        n = graph.num_vertices()
+
+        pair_counts = []
+
+        def counting_grid_pairs(*args):
+            pairs = _grid_pairs(*args)
+            pair_counts.append(len(pairs[0]))
+            return pairs
+        monkeypatch.setattr(visualizer, '_grid_pairs', counting_grid_pairs)
+
+        start = time.perf_counter()
+        pos = force_layout(graph.to_csr())
+        assert time.perf_counter() - start < 5.0
+        assert len(pos) == n
+        assert np.isfinite(np.array(list(pos.values()))).all()
+        # about 10 pairs per vertex (over 200 with a bounding-box grid)
+        assert max(pair_counts) < 20 * n
+
+
+class TestLevelOfDetail:
+
+    def test_small_graph_keeps_all_labels(self):
+        fig, ax, _ = draw_graph(make_graph(), highlighted_edges=[('B', 'A')])
+        texts = [t.get_text() for t in ax.texts]
+        assert set('ABCDE') <= set(texts)
+        assert '4.0' in texts
+        # base and highlighted edges, one collection each
+        assert len([c for c in ax.collections if isinstance(c, LineCollection)]) == 2
+        plt.close(fig)
+
+    def test_thresholds_drop_text(self):
+        graph = make_graph()
+        pos = get_layout(graph)
+        fig, ax, _ = draw_graph(graph, pos=pos, edge_label_threshold=0)
+        assert sorted(t.get_text() for t in ax.texts) == list('ABCDE')
+        plt.close(fig)
+
+        fig, ax, _ = draw_graph(graph, pos=pos, node_label_threshold=0, edge_label_threshold=0,
+                                rasterize=True)
+        assert len(ax.texts) == 0
+        assert all(c.get_rasterized() for c in ax.collections)
+        plt.close(fig)
+
+    def test_frame_renderer_uses_thresholds(self):
+        graph = make_graph()
+        _, _, history = dijkstra(graph, 'A', 'heap')
+        renderer = FrameRenderer(graph, get_layout(graph), node_label_threshold=0, edge_label_threshold=0)
+        frame = renderer.render(dijkstra_step_view(graph, history[-1]))
+        assert frame.size == (1000, 800)
+        assert len(renderer.ax.texts) == 0
+
+
+class TestAnimation:
+
+    def test_gif_stream_writer(self, tmp_path):
+        path = str(tmp_path / 'frames.gif')
+        with GifStreamWriter(path) as writer:
+            for shade, duration in ((0, 200), (128, 100), (255, 300)):
+                writer.add(Image.new('RGB', (40, 30), (shade, 0, 0)), duration)
+
+        gif = Image.open(path)
+        assert gif.n_frames == 3
+        assert gif.size == (40, 30)
+        durations = []
+        for i in range(3):
+            gif.seek(i)
+            durations.append(gif.info['duration'])
+            assert gif.convert('RGB').getpixel((0, 0))[0] == (0, 128, 255)[i]
+        assert durations == [200, 100, 300]
+
+    def test_dijkstra_animation(self, tmp_path):
+        graph = make_graph()
+        _, _, history = dijkstra(graph, 'A', 'heap')
+        path = str(tmp_path / 'out' / 'dijkstra.gif')
+        create_dijkstra_animation(graph, history, path, duration=100)
+
+        gif = Image.open(path)
+        assert gif.n_frames == len(history)
+        assert gif.info['duration'] == 200
+        gif.seek(gif.n_frames - 1)
+        assert gif.info['duration'] == 300
+
+    def test_incremental_frames_match_fresh_renders(self):
+        # a frame reached through diffs looks the same as one rendered
+        # straight from the same step on a new renderer
+        graph = make_graph()
+        _, _, history = dijkstra(graph, 'A', 'heap')
+        pos = get_layout(graph)
+
+        renderer = FrameRenderer(graph, pos)
+        frames = [renderer.render(dijkstra_step_view(graph, step)) for step in history]
+        for i in (2, len(history) - 1):
+            fresh = FrameRenderer(graph, pos).render(dijkstra_step_view(graph, history[i]))
+            assert frames[i].tobytes() == fresh.tobytes()
+        assert frames[0].tobytes() != frames[-1].tobytes()
+
+    def test_directed_highlights_are_arrows(self):
+        graph = Graph(directed=True)
+        for u, v, w in make_graph().get_edges():
+            graph.add_edge(u, v, w)
+        _, _, history = dijkstra(graph, 'A', 'heap')
+        pos = get_layout(graph)
+
+        renderer = FrameRenderer(graph, pos)
+        frames = [renderer.render(dijkstra_step_view(graph, step)) for step in history]
+        # base and highlight arrow per edge, as draw_graph draws them
+        assert len(renderer.ax.patches) == 2 * graph.num_edges()
+        fresh = FrameRenderer(graph, pos).render(dijkstra_step_view(graph, history[-1]))
+        assert frames[-1].tobytes() == fresh.tobytes()
+        assert frames[0].tobytes() != frames[-1].tobytes()
+
+    def test_parallel_rendering_matches_serial(self, tmp_path):
+        graph = make_graph()
+        _, _, history = prim(graph, 'A', 'heap')
+        serial = tmp_path / 'serial.gif'
+        parallel = tmp_path / 'parallel.gif'
+        create_prim_animation(graph, history, str(serial), duration=100)
+        create_prim_animation(graph, history, str(parallel), duration=100, workers=2)
+
+        assert serial.read_bytes() == parallel.read_bytes()
+
+
+class TestFrameSampling:
+
+    def make_history(self, n: int = 60):
+        graph = Graph(directed=False)
+        for i in range(n - 1):
+            graph.add_edge(f"v{i}", f"v{i + 1}", 1.0)
+        _, _, history = dijkstra(graph, 'v0', 'heap')
+        return graph, history
+
+    @pytest.mark.parametrize('mode', ['uniform', 'adaptive'])
+    def test_samples_keep_first_last_and_fold_skipped(self, mode):
+        _, history = self.make_history()
+        samples = sample_steps(history, 10, mode)
+
+        assert len(samples) <= 10
+        assert samples[0] == (0, [])
+        assert samples[-1][0] == len(history) - 1
+        # every step is either rendered or folded into a rendered one
+        assert len(samples) + sum(len(skipped) for _, skipped in samples) == len(history)
+
+    def test_short_history_is_not_sampled(self):
+        _, history = self.make_history(5)
+        assert sample_steps(history, 10) == [(i, []) for i in range(len(history))]
+        with pytest.raises(ValueError):
+            sample_steps(history, 1)
+
+    def test_max_frames_and_target_duration(self, tmp_path):
+        graph, history = self.make_history()
+        path = str(tmp_path / 'capped.gif')
+        create_dijkstra_animation(graph, history, path, duration=100, max_frames=8, sampling='adaptive')
+        assert Image.open(path).n_frames <= 8
+
+        # 1 second at 100 ms per frame, minus the longer first and last frame
+        create_dijkstra_animation(graph, history, path, duration=100, target_duration=1.0)
+        gif = Image.open(path)
+        assert gif.n_frames == 7
+        assert sum(gif.seek(i) or gif.info['duration'] for i in range(gif.n_frames)) == 1000
+
+        # two frames need 5x the frame duration
+        create_dijkstra_animation(graph, history, path, duration=100, target_duration=0.5)
+        assert Image.open(path).n_frames == 2
+        with pytest.raises(ValueError):
+            create_dijkstra_animation(graph, history, path, duration=800, target_duration=2.0)
+
+
+class TestEncoders:
+
+    def render_frames(self):
+        graph = make_graph()
+        _, _, history = dijkstra(graph, 'A', 'heap')
+        renderer = FrameRenderer(graph, get_layout(graph))
+        return graph, history, [renderer.render(dijkstra_step_view(graph, step)) for step in history]
+
+    def test_apng_is_lossless(self, tmp_path):
+        _, _, frames = self.render_frames()
+        path = str(tmp_path / 'out.png')
+        with ApngStreamWriter(path) as writer:
+            for frame in frames:
+                writer.add(frame, 100)
+
+        apng = Image.open(path)
+        assert apng.n_frames == len(frames)
+        for i, frame in enumerate(frames):
+            apng.seek(i)
+            assert apng.info['duration'] == 100
+            assert apng.convert('RGB').tobytes() == frame.tobytes()
+
+    def test_apng_long_delays(self, tmp_path):
+        _, _, frames = self.render_frames()
+        path = str(tmp_path / 'out.png')
+        with ApngStreamWriter(path) as writer:
+            writer.add(frames[0], 90000)
+            writer.add(frames[1], 100)
+            with pytest.raises(ValueError):
+                writer.add(frames[2], 70000 * 1000)
+
+        apng = Image.open(path)
+        assert apng.n_frames == 2
+        assert apng.info['duration'] == 90000
+        apng.seek(1)
+        assert apng.info['duration'] == 100
+
+    def test_shared_palette_gif_is_smaller(self, tmp_path):
+        _, _, frames = self.render_frames()
+        sizes = {}
+        for shared in (False, True):
+            path = tmp_path / f'shared_{shared}.gif'
+            with GifStreamWriter(str(path), shared_palette=shared) as writer:
+                for frame in frames:
+                    writer.add(frame, 100)
+            sizes[shared] = path.stat().st_size
+
+            gif = Image.open(str(path))
+            assert gif.n_frames == len(frames)
+            gif.seek(gif.n_frames - 1)
+            last = np.asarray(gif.convert('RGB'), dtype=int)
+            assert np.abs(last - np.asarray(frames[-1], dtype=int)).mean() < 5
+        assert sizes[True] < sizes[False]
+
+    @pytest.mark.parametrize('encoder', ['png', 'webp'])
+    def test_frame_sequence(self, tmp_path, encoder):
+        graph, history, _ = self.render_frames()
+        directory = tmp_path / 'frames'
+        create_dijkstra_animation(graph, history, str(directory), duration=100, encoder=encoder)
+
+        assert len(list(directory.glob(f'frame_*.{encoder}'))) == len(history)
+        listing = (directory / 'frames.txt').read_text().splitlines()
+        assert listing[:3] == ['ffconcat version 1.0', f"file 'frame_00000.{encoder}'", 'duration 0.2']
+
+    def test_invalid_encoder(self, tmp_path):
+        graph, history, _ = self.render_frames()
+        with pytest.raises(ValueError):
+            create_dijkstra_animation(graph, history, str(tmp_path / 'out.mp4'), encoder='mp4')
+        with pytest.raises(ValueError):
+            FrameSequenceWriter(str(tmp_path), 'jpeg')